@@ -10,15 +10,19 @@ class Encoder(bm.Scenario):
     nmetrics = bm.var(type=int)
     dd_origin = bm.var_bool()
     encoding = bm.var(type=str)
+    compression = bm.var(type=str)
 
     def run(self):
         encoder = utils.init_encoder(self.encoding)
+        compress = utils.init_compressor(self.compression)
         traces = utils.gen_traces(self)
 
         def _(loops):
             for _ in range(loops):
                 for trace in traces:
                     encoder.put(trace)
-                    encoder.encode()
+                    payload = encoder.encode()
+                    if compress is not None:
+                        compress(payload)
 
         yield _
@@ -21,13 +21,23 @@ try:
     def init_encoder(encoding, max_size=8 << 20, max_item_size=8 << 20):
         return MSGPACK_ENCODERS[encoding](max_size, max_item_size)
 
-
 except ImportError:
 
     def init_encoder(encoding):
         return MSGPACK_ENCODERS[encoding]()
 
 
+def init_compressor(compression):
+    if not compression:
+        return None
+    try:
+        from ddtrace.internal.compression import COMPRESSORS
+    except ImportError:
+        # Payload compression is not available in this version
+        return None
+    return COMPRESSORS[compression]
+
+
 def _rands(size=6, chars=string.ascii_uppercase + string.digits):
     return "".join(random.choice(chars) for _ in range(size))
 
@@ -2,6 +2,7 @@ import json
 
 import bm
 
+from ddtrace import config
 from ddtrace.context import Context
 from ddtrace.propagation import http
 
@@ -10,6 +11,7 @@ class HTTPPropagationInject(bm.Scenario):
     sampling_priority = bm.var(type=str)
     dd_origin = bm.var(type=str)
     meta = bm.var(type=str)
+    styles = bm.var(type=str)
 
     def run(self):
         sampling_priority = None
@@ -21,6 +23,9 @@ class HTTPPropagationInject(bm.Scenario):
         if self.meta:
             meta = json.loads(self.meta)
 
+        if self.styles:
+            config._propagation_style_inject = set(self.styles.split(","))
+
         ctx = Context(
             trace_id=8336172473188639332,
             span_id=6804240797025004118,
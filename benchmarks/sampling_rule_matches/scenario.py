@@ -1,10 +1,12 @@
 import itertools
 import random
+import re
 import string
 
 import bm
 
 from ddtrace import Span
+from ddtrace.sampler import DatadogSampler
 from ddtrace.sampler import SamplingRule
 
 
@@ -27,6 +29,7 @@ class SamplingRules(bm.Scenario):
     num_iterations = bm.var(type=int)
     num_services = bm.var(type=int)
     num_operations = bm.var(type=int)
+    num_rules = bm.var(type=int)
 
     def run(self):
         # Generate random service and operation names for the counts we requested
@@ -44,9 +47,30 @@ class SamplingRules(bm.Scenario):
             sample_rate=1.0,
         )
 
+        if self.num_rules <= 1:
+
+            def _(loops):
+                for _ in range(loops):
+                    for span in iter_n(spans, n=self.num_iterations):
+                        rule.matches(span)
+
+            yield _
+            return
+
+        # Put the matching rule behind a mix of literal and regular expression rules
+        # that never match, like a large DD_TRACE_SAMPLING_RULES configuration would
+        rules = []
+        for i in range(self.num_rules - 1):
+            if i % 4 == 0:
+                rules.append(SamplingRule(service=re.compile("^nomatch-%s" % rands()), sample_rate=0.5))
+            else:
+                rules.append(SamplingRule(service="nomatch-%s" % rands(), name=rands(), sample_rate=0.5))
+        rules.append(rule)
+        sampler = DatadogSampler(rules=rules, rate_limit=DatadogSampler.NO_RATE_LIMIT)
+
         def _(loops):
             for _ in range(loops):
                 for span in iter_n(spans, n=self.num_iterations):
-                    rule.matches(span)
+                    sampler.sample(span)
 
         yield _
@@ -12,6 +12,7 @@ class Span(bm.Scenario):
     nmetrics = bm.var(type=int)
     finishspan = bm.var_bool()
     traceid128 = bm.var_bool()
+    childspans = bm.var_bool()
 
     def run(self):
         # run scenario to also set tags on spans
@@ -30,15 +31,21 @@ class Span(bm.Scenario):
         # Recreate span processors and configure global tracer to avoid sending traces to the agent
         utils.drop_traces(tracer)
 
+        # run scenario to start the spans as untagged leaves of a single root span
+        childspans = self.childspans
+
         def _(loops):
             for _ in range(loops):
+                root = tracer.start_span("root") if childspans else None
                 for i in range(self.nspans):
-                    s = tracer.start_span("test." + str(i))
+                    s = tracer.start_span("test." + str(i), child_of=root)
                     if settags:
                         s.set_tags(tags)
                     if setmetrics:
                         s.set_metrics(metrics)
                     if finishspan:
                         s.finish()
+                if root is not None:
+                    root.finish()
 
         yield _
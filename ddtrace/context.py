@@ -2,6 +2,7 @@ import base64
 import re
 import threading
 from typing import Any
+from typing import List
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import Text
@@ -46,6 +47,7 @@ class Context(object):
         "_lock",
         "_meta",
         "_metrics",
+        "_propagation_cache",
     ]
 
     def __init__(
@@ -63,6 +65,8 @@ class Context(object):
 
         self.trace_id = trace_id  # type: Optional[int]
         self.span_id = span_id  # type: Optional[int]
+        # Shared by all the contexts of the trace, see _get_propagation_cache
+        self._propagation_cache = []  # type: List[Any]
 
         if dd_origin is not None:
             self._meta[ORIGIN_KEY] = dd_origin
@@ -90,23 +94,30 @@ class Context(object):
     def __setstate__(self, state):
         # type: (_ContextState) -> None
         self.trace_id, self.span_id, self._meta, self._metrics = state
+        self._propagation_cache = []
         # We cannot serialize and lock, so we must recreate it unless we already have one
         self._lock = threading.RLock()
 
     def _with_span(self, span):
         # type: (Span) -> Context
         """Return a shallow copy of the context with the given span."""
-        return self.__class__(
+        context = self.__class__(
             trace_id=span.trace_id, span_id=span.span_id, meta=self._meta, metrics=self._metrics, lock=self._lock
         )
+        context._propagation_cache = self._propagation_cache
+        return context
 
     def _update_tags(self, span):
         # type: (Span) -> None
         with self._lock:
-            for tag in self._meta:
-                span._meta.setdefault(tag, self._meta[tag])
-            for metric in self._metrics:
-                span._metrics.setdefault(metric, self._metrics[metric])
+            if self._meta:
+                meta = span._meta
+                for tag in self._meta:
+                    meta.setdefault(tag, self._meta[tag])
+            if self._metrics:
+                metrics = span._metrics
+                for metric in self._metrics:
+                    metrics.setdefault(metric, self._metrics[metric])
 
     @property
     def sampling_priority(self):
@@ -124,15 +135,38 @@ class Context(object):
                 return
             self._metrics[SAMPLING_PRIORITY_KEY] = value
 
+    def _get_propagation_cache(self, key):
+        # type: (Any) -> Optional[Any]
+        """Return the value stored with :meth:`_set_propagation_cache` for ``key``.
+
+        The value is discarded as soon as the sampling priority or the trace
+        tags of the trace differ from the ones it was stored with.
+        """
+        with self._lock:
+            cache = self._propagation_cache
+            if cache and cache[0] == key and cache[1] == self.sampling_priority and cache[2] == self._meta:
+                return cache[3]
+            return None
+
+    def _set_propagation_cache(self, key, value):
+        # type: (Any, Any) -> None
+        """Cache a value derived from the trace-level state of the context.
+
+        The cache is shared with all the contexts of the trace, so that the
+        propagation headers do not have to be rendered again for every outbound
+        request made while the trace tags and the sampling priority do not change.
+        """
+        with self._lock:
+            self._propagation_cache[:] = [key, self.sampling_priority, dict(self._meta), value]
+
     @property
-    def _traceparent(self):
+    def _traceparent_format(self):
         # type: () -> str
-        tp = self._meta.get(W3C_TRACEPARENT_KEY)
-        if self.span_id is None or self.trace_id is None:
-            # if we only have a traceparent then we'll forward it
-            # if we don't have a span id or trace id value we can't build a valid traceparent
-            return tp or ""
+        """Return the traceparent value with a ``{:016x}`` placeholder for the span id.
 
+        The context must have a trace id.
+        """
+        tp = self._meta.get(W3C_TRACEPARENT_KEY)
         # determine the trace_id value
         if tp:
             # grab the original traceparent trace id, not the converted value
@@ -141,7 +175,17 @@ class Context(object):
             trace_id = "{:032x}".format(self.trace_id)
 
         sampled = 1 if self.sampling_priority and self.sampling_priority > 0 else 0
-        return "00-{}-{:016x}-{:02x}".format(trace_id, self.span_id, sampled)
+        return "00-%s-{:016x}-%02x" % (trace_id, sampled)
+
+    @property
+    def _traceparent(self):
+        # type: () -> str
+        if self.span_id is None or self.trace_id is None:
+            # if we only have a traceparent then we'll forward it
+            # if we don't have a span id or trace id value we can't build a valid traceparent
+            return self._meta.get(W3C_TRACEPARENT_KEY) or ""
+
+        return self._traceparent_format.format(self.span_id)
 
     @property
     def _tracestate(self):
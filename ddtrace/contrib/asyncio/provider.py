@@ -18,6 +18,8 @@ class AsyncioContextProvider(BaseContextProvider, DatadogContextMixin):
 
     # Task attribute used to set/get the context
     _CONTEXT_ATTR = "__datadog_context"
+    # Task attribute used to set/get the generation of the active span
+    _GENERATION_ATTR = "__datadog_context_generation"
 
     def activate(self, context, loop=None):
         """Sets the scoped ``Context`` for the current running ``Task``."""
@@ -30,6 +32,8 @@ class AsyncioContextProvider(BaseContextProvider, DatadogContextMixin):
         task = asyncio.Task.current_task(loop=loop)
         if task:
             setattr(task, self._CONTEXT_ATTR, context)
+            if isinstance(context, Span):
+                setattr(task, self._GENERATION_ATTR, context._generation)
         return context
 
     def _get_loop(self, loop=None):
@@ -70,5 +74,8 @@ class AsyncioContextProvider(BaseContextProvider, DatadogContextMixin):
             return None
         ctx = getattr(task, self._CONTEXT_ATTR, None)
         if isinstance(ctx, Span):
+            if ctx._generation != getattr(task, self._GENERATION_ATTR, 0):
+                # Reused by the span pool once its trace finished
+                return None
             return self._update_active(ctx)
         return ctx
@@ -132,7 +132,19 @@ def _store_headers(headers, span, integration_config, request_or_response):
     :param integration_config: An integration specific config object.
     :type integration_config: ddtrace.settings.IntegrationConfig
     """
-    if not isinstance(headers, dict):
+    tags = {}  # type: Dict[str, str]
+    _collect_header_tags(headers, integration_config, request_or_response, tags)
+    span._set_tags_str(tags)
+
+
+def _collect_header_tags(headers, integration_config, request_or_response, tags):
+    # type: (Any, IntegrationConfig, str, Dict[str, str]) -> None
+    """Add the tags of the traced headers to ``tags``.
+
+    Header mappings are read in place, other iterables of ``(name, value)``
+    pairs are converted to a dict first.
+    """
+    if not hasattr(headers, "items"):
         try:
             headers = dict(headers)
         except Exception:
@@ -142,14 +154,15 @@ def _store_headers(headers, span, integration_config, request_or_response):
         log.debug("Skipping headers tracing as no integration config was provided")
         return
 
+    header_tag_name = integration_config._header_tag_name
     for header_name, header_value in headers.items():
         """config._header_tag_name gets an element of the dictionary in config.http._header_tags
         which gets the value from DD_TRACE_HEADER_TAGS environment variable."""
-        tag_name = integration_config._header_tag_name(header_name)
+        tag_name = header_tag_name(header_name)
         if tag_name is None:
             continue
         # An empty tag defaults to a http.<request or response>.headers.<header name> tag
-        span.set_tag_str(tag_name or _normalize_tag_name(request_or_response, header_name), header_value)
+        tags[tag_name or _normalize_tag_name(request_or_response, header_name)] = header_value
 
 
 def _get_request_header_user_agent(headers, headers_are_case_sensitive=False):
@@ -405,16 +418,20 @@ def ext_service(pin, int_config, default=None):
     return default
 
 
-def _set_url_tag(integration_config, span, url, query):
-    # type: (IntegrationConfig, Span, str, str) -> None
-
+def _url_tag_value(integration_config, url, query):
+    # type: (IntegrationConfig, str, Optional[str]) -> str
     if integration_config.http_tag_query_string:  # Tagging query string in http.url
         if config.global_query_string_obfuscation_disabled:  # No redacting of query strings
-            span.set_tag_str(http.URL, url)
-        else:  # Redact query strings
-            span.set_tag_str(http.URL, redact_url(url, config._obfuscation_query_string_pattern, query))
-    else:  # Not tagging query string in http.url
-        span.set_tag_str(http.URL, strip_query_string(url))
+            return url
+        # Redact query strings
+        return redact_url(url, config._obfuscation_query_string_pattern, query)
+    # Not tagging query string in http.url
+    return strip_query_string(url)
+
+
+def _set_url_tag(integration_config, span, url, query):
+    # type: (IntegrationConfig, Span, str, str) -> None
+    span.set_tag_str(http.URL, _url_tag_value(integration_config, url, query))
 
 
 def set_http_meta(
@@ -454,12 +471,15 @@ def set_http_meta(
     :param request_path_params: the parameters of the HTTP URL as set by the framework: /posts/<id:int> would give us
          { "id": <int_value> }
     """
+    # DEV: Tags are collected and set on the span at once, their names are known to be strings
+    tags = {}  # type: Dict[str, str]
+
     if method is not None:
-        span.set_tag_str(http.METHOD, method)
+        tags[http.METHOD] = method
 
     if url is not None:
         url = _sanitized_url(url)
-        _set_url_tag(integration_config, span, url, query)
+        tags[http.URL] = _url_tag_value(integration_config, url, query)
 
     if status_code is not None:
         try:
@@ -467,21 +487,21 @@ def set_http_meta(
         except (TypeError, ValueError):
             log.debug("failed to convert http status code %r to int", status_code)
         else:
-            span.set_tag_str(http.STATUS_CODE, str(status_code))
+            tags[http.STATUS_CODE] = str(status_code)
             if config.http_server.is_error_code(int_status_code):
                 span.error = 1
 
     if status_msg is not None:
-        span.set_tag_str(http.STATUS_MSG, status_msg)
+        tags[http.STATUS_MSG] = status_msg
 
     if query is not None and integration_config.trace_query_string:
-        span.set_tag_str(http.QUERY_STRING, query)
+        tags[http.QUERY_STRING] = query
 
     request_ip = peer_ip
     if request_headers:
         user_agent = _get_request_header_user_agent(request_headers, headers_are_case_sensitive)
         if user_agent:
-            span.set_tag_str(http.USER_AGENT, user_agent)
+            tags[http.USER_AGENT] = user_agent
 
         # We always collect the IP if appsec is enabled to report it on potential vulnerabilities.
         # https://datadoghq.atlassian.net/wiki/spaces/APS/pages/2118779066/Client+IP+addresses+resolution
@@ -493,20 +513,25 @@ def set_http_meta(
                 # Not calculated: framework does not support IP blocking or testing env
                 request_ip = _get_request_header_client_ip(request_headers, peer_ip, headers_are_case_sensitive)
 
-            span.set_tag_str(http.CLIENT_IP, request_ip)
-            span.set_tag_str("network.client.ip", request_ip)
+            tags[http.CLIENT_IP] = request_ip
+            tags["network.client.ip"] = request_ip
 
         if integration_config.is_header_tracing_configured:
             """We should store both http.<request_or_response>.headers.<header_name> and
             http.<key>. The last one
             is the DD standardized tag for user-agent"""
-            _store_request_headers(dict(request_headers), span, integration_config)
+            _collect_header_tags(request_headers, integration_config, REQUEST, tags)
 
     if response_headers is not None and integration_config.is_header_tracing_configured:
-        _store_response_headers(dict(response_headers), span, integration_config)
+        _collect_header_tags(response_headers, integration_config, RESPONSE, tags)
 
     if retries_remain is not None:
-        span.set_tag_str(http.RETRIES_REMAIN, str(retries_remain))
+        tags[http.RETRIES_REMAIN] = str(retries_remain)
+
+    if route is not None:
+        tags[http.ROUTE] = route
+
+    span._set_tags_str(tags)
 
     if span.span_type == SpanTypes.WEB and config._appsec_enabled:
         from ddtrace.appsec._asm_request_context import set_waf_address
@@ -514,27 +539,20 @@ def set_http_meta(
 
         status_code = str(status_code) if status_code is not None else None
 
-        addresses = {
-            k: v
-            for k, v in [
-                (SPAN_DATA_NAMES.REQUEST_URI_RAW, raw_uri),
-                (SPAN_DATA_NAMES.REQUEST_METHOD, method),
-                (SPAN_DATA_NAMES.REQUEST_COOKIES, request_cookies),
-                (SPAN_DATA_NAMES.REQUEST_QUERY, parsed_query),
-                (SPAN_DATA_NAMES.REQUEST_HEADERS_NO_COOKIES, request_headers),
-                (SPAN_DATA_NAMES.RESPONSE_HEADERS_NO_COOKIES, response_headers),
-                (SPAN_DATA_NAMES.RESPONSE_STATUS, status_code),
-                (SPAN_DATA_NAMES.REQUEST_PATH_PARAMS, request_path_params),
-                (SPAN_DATA_NAMES.REQUEST_BODY, request_body),
-                (SPAN_DATA_NAMES.REQUEST_HTTP_IP, request_ip),
-            ]
-            if v is not None
-        }
-        for k, v in addresses.items():
-            set_waf_address(k, v, span)
-
-    if route is not None:
-        span.set_tag_str(http.ROUTE, route)
+        for k, v in (
+            (SPAN_DATA_NAMES.REQUEST_URI_RAW, raw_uri),
+            (SPAN_DATA_NAMES.REQUEST_METHOD, method),
+            (SPAN_DATA_NAMES.REQUEST_COOKIES, request_cookies),
+            (SPAN_DATA_NAMES.REQUEST_QUERY, parsed_query),
+            (SPAN_DATA_NAMES.REQUEST_HEADERS_NO_COOKIES, request_headers),
+            (SPAN_DATA_NAMES.RESPONSE_HEADERS_NO_COOKIES, response_headers),
+            (SPAN_DATA_NAMES.RESPONSE_STATUS, status_code),
+            (SPAN_DATA_NAMES.REQUEST_PATH_PARAMS, request_path_params),
+            (SPAN_DATA_NAMES.REQUEST_BODY, request_body),
+            (SPAN_DATA_NAMES.REQUEST_HTTP_IP, request_ip),
+        ):
+            if v is not None:
+                set_waf_address(k, v, span)
 
 
 def activate_distributed_headers(tracer, int_config=None, request_headers=None, override=None):
@@ -19,7 +19,20 @@ the ``DD_DYNAMIC_INSTRUMENTATION_ENABLED`` variable, or programmatically with::
     DynamicInstrumentation.disable()
 """
 
-from ddtrace.debugging._debugger import Debugger as DynamicInstrumentation
+from ddtrace.internal.compat import ensure_pep562
 
 
 __all__ = ["DynamicInstrumentation"]
+
+
+def __getattr__(name):
+    # The debugger is imported on first access so that importing the
+    # configuration, e.g. by ddtrace-run, does not load it when it is disabled.
+    if name == "DynamicInstrumentation":
+        from ddtrace.debugging._debugger import Debugger
+
+        return Debugger
+    raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+
+
+ensure_pep562(__name__)
@@ -9,7 +9,7 @@ from ddtrace.internal import compat
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.periodic import AwakeablePeriodicService
 from ddtrace.internal.runtime import container
-from ddtrace.internal.utils.http import connector
+from ddtrace.internal.utils.http import ConnectionPool
 
 
 log = get_logger(__name__)
@@ -44,7 +44,7 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
 
         if config._tags_in_qs and config.tags:
             self.ENDPOINT += "?ddtags=" + config.tags
-        self._connect = connector(config._intake_url, timeout=config.upload_timeout)
+        self._conn_pool = ConnectionPool(config._intake_url, timeout=config.upload_timeout)
         self._retry_upload = tenacity.Retrying(
             # Retry RETRY_ATTEMPTS times within the first half of the processing
             # interval, using a Fibonacci policy with jitter
@@ -64,7 +64,7 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
     def _write(self, payload):
         # type: (str) -> None
         try:
-            with self._connect() as conn:
+            with self._conn_pool.connection() as conn:
                 conn.request(
                     "POST",
                     self.ENDPOINT,
@@ -72,8 +72,10 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
                     headers=self._headers,
                 )
                 resp = compat.get_connection_response(conn)
+                # Consume the body so that the connection can be reused
+                body = resp.read()
                 if not (200 <= resp.status < 300):
-                    log.error("Failed to upload payload: [%d] %r", resp.status, resp.read())
+                    log.error("Failed to upload payload: [%d] %r", resp.status, body)
                     meter.increment("upload.error", tags={"status": str(resp.status)})
                 else:
                     meter.increment("upload.success")
@@ -100,4 +102,9 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
             except Exception:
                 log.debug("Cannot upload logs payload", exc_info=True)
 
-    on_shutdown = periodic
+    def on_shutdown(self):
+        # type: () -> None
+        try:
+            self.periodic()
+        finally:
+            self._conn_pool.close()
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from ddtrace.provider import _DD_CONTEXTVAR
+from ddtrace.provider import _get_active_item
 from ddtrace.span import Span
 
 
@@ -17,7 +17,7 @@ if TYPE_CHECKING:  # pragma: no cover
 def get_item(key, span=None):
     # type: (str, Optional[Span]) -> Optional[Any]
     """Get and item from the context of a trace."""
-    ctx = span if span is not None else _DD_CONTEXTVAR.get()
+    ctx = span if span is not None else _get_active_item()
     if not isinstance(ctx, Span) or ctx._local_root is None:
         raise ValueError("No context found")
     return ctx._local_root._get_ctx_item(key)
@@ -26,7 +26,7 @@ def get_item(key, span=None):
 def get_items(keys, span=None):
     # type: (List[str], Optional[Span]) -> List[Optional[Any]]
     """Get multiple items from the context of a trace."""
-    ctx = span if span is not None else _DD_CONTEXTVAR.get()  # type: Optional[Union[Context, Span]]
+    ctx = span if span is not None else _get_active_item()  # type: Optional[Union[Context, Span]]
     if not isinstance(ctx, Span) or ctx._local_root is None:
         raise ValueError("No context found")
     return [ctx._local_root._get_ctx_item(k) for k in keys]
@@ -35,7 +35,7 @@ def get_items(keys, span=None):
 def set_item(key, val, span=None):
     # type: (str, Any, Optional[Span]) -> None
     """Set an item in the context of a trace."""
-    ctx = span if span is not None else _DD_CONTEXTVAR.get()  # type: Optional[Union[Context, Span]]
+    ctx = span if span is not None else _get_active_item()  # type: Optional[Union[Context, Span]]
     if not isinstance(ctx, Span) or ctx._local_root is None:
         raise ValueError("No context found")
     ctx._local_root._set_ctx_item(key, val)
@@ -44,7 +44,7 @@ def set_item(key, val, span=None):
 def set_items(kvs, span=None):
     # type: (Dict[str, Any], Optional[Span]) -> None
     """Set multiple items in the context of a trace."""
-    ctx = span if span is not None else _DD_CONTEXTVAR.get()  # type: Optional[Union[Context, Span]]
+    ctx = span if span is not None else _get_active_item()  # type: Optional[Union[Context, Span]]
     if not isinstance(ctx, Span) or ctx._local_root is None:
         raise ValueError("No context found")
     ctx._local_root._set_ctx_items(kvs)
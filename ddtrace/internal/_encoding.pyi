@@ -38,4 +38,5 @@ class MsgpackEncoderBase(BufferedEncoder):
 class MsgpackEncoderV03(MsgpackEncoderBase): ...
 class MsgpackEncoderV05(MsgpackEncoderBase): ...
 
+def estimate_span_size(span: Span) -> int: ...
 def packb(o: Any, **kwargs) -> bytes: ...
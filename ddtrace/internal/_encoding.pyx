@@ -22,6 +22,7 @@ from ..constants import ORIGIN_KEY
 
 DEF MSGPACK_ARRAY_LENGTH_PREFIX_SIZE = 5
 DEF MSGPACK_STRING_TABLE_LENGTH_PREFIX_SIZE = 6
+DEF INITIAL_BUFFER_SIZE = 1 << 20
 
 
 cdef extern from "Python.h":
@@ -32,6 +33,8 @@ cdef extern from "pack.h":
         char* buf
         size_t length
         size_t buf_size
+        size_t max_buf_size
+        int overflow
 
     int msgpack_pack_nil(msgpack_packer* pk)
     int msgpack_pack_long(msgpack_packer* pk, long d)
@@ -55,6 +58,23 @@ cdef extern from "pack.h":
 cdef long long ITEM_LIMIT = (2**32)-1
 
 
+cdef inline void _shrink_buffer(msgpack_packer *pk, size_t size):
+    """Give back the memory that a buffer grew past ``size``.
+
+    Buffers grow on demand when a large payload is packed. Shrinking them once
+    the payload has been flushed keeps the memory footprint flat after bursts.
+    """
+    cdef char *buf
+
+    if pk.buf_size <= size or pk.length > size:
+        return
+
+    buf = <char*> PyMem_Realloc(pk.buf, size)
+    if buf != NULL:
+        pk.buf = buf
+        pk.buf_size = size
+
+
 cdef inline int PyBytesLike_CheckExact(object o):
     return PyBytes_CheckExact(o) or PyByteArray_CheckExact(o)
 
@@ -80,6 +100,49 @@ cdef const char * _ORIGIN_KEY = string_to_buff(ORIGIN_KEY)
 cdef size_t _ORIGIN_KEY_LEN = <size_t> len(ORIGIN_KEY)
 
 
+# Upper bound of the encoded size of the fields of a span other than its
+# strings and tags: the field names of the v0.4 format, the ids, the timings
+# and the type headers.
+DEF SPAN_FIXED_SIZE = 160
+# Type headers of a tag name and value
+DEF META_ITEM_OVERHEAD = 10
+# Type header of a metric name, and the metric value as a float64
+DEF METRICS_ITEM_OVERHEAD = 14
+
+
+cdef inline Py_ssize_t _text_size(object s):
+    return len(s) if s is not None else 0
+
+
+cpdef Py_ssize_t estimate_span_size(object span):
+    """Return an estimate of the size in bytes of a span once encoded.
+
+    The estimate is meant to be cheap rather than exact: strings are counted
+    as one byte per character, and the size of the fixed fields is an upper
+    bound for every supported format.
+    """
+    cdef Py_ssize_t size = SPAN_FIXED_SIZE
+    cdef Py_ssize_t pos = 0
+    cdef PyObject* key
+    cdef PyObject* value
+
+    size += _text_size(span.service) + _text_size(span.name) + _text_size(span._resource[0])
+    size += _text_size(span.span_type)
+
+    meta = span._meta_dict
+    if meta is not None:
+        while PyDict_Next(meta, &pos, &key, &value):
+            size += len(<object>key) + len(<object>value) + META_ITEM_OVERHEAD
+
+    metrics = span._metrics_dict
+    if metrics is not None:
+        pos = 0
+        while PyDict_Next(metrics, &pos, &key, &value):
+            size += len(<object>key) + METRICS_ITEM_OVERHEAD
+
+    return size
+
+
 cdef inline int array_prefix_size(stdint.uint32_t l):
     if l < 16:
         return 1
@@ -224,12 +287,16 @@ cdef class MsgpackStringTable(StringTable):
     cdef stdint.uint32_t _sp_id
     cdef object _lock
     cdef size_t _reset_size
+    cdef size_t _initial_buf_size
 
     def __init__(self, max_size):
-        self.pk.buf_size = min(max_size, 1 << 20)
+        self.pk.buf_size = self._initial_buf_size = min(max_size, INITIAL_BUFFER_SIZE)
         self.pk.buf = <char*> PyMem_Malloc(self.pk.buf_size)
         if self.pk.buf == NULL:
             raise MemoryError("Unable to allocate internal buffer.")
+        # The string table also receives the packed traces on flush, which are
+        # bounded by the table size check in append_raw.
+        self.pk.max_buf_size = max_size + MSGPACK_STRING_TABLE_LENGTH_PREFIX_SIZE
         self.max_size = max_size
         self.pk.length = MSGPACK_STRING_TABLE_LENGTH_PREFIX_SIZE
         self._sp_len = 0
@@ -260,6 +327,14 @@ cdef class MsgpackStringTable(StringTable):
 
         ret = pack_text(&self.pk, string)
         if ret != 0:
+            if self.pk.overflow:
+                # The encoded string is longer than its length in characters
+                self.pk.overflow = 0
+                raise ValueError(
+                    "Cannot insert '%s': string table is full (current size: %d, max size: %d)." % (
+                        string, self.pk.length, self.max_size
+                    )
+                )
             raise RuntimeError("Failed to add string to msgpack string table")
 
     cdef savepoint(self):
@@ -318,6 +393,7 @@ cdef class MsgpackStringTable(StringTable):
         self._next_id = 2
         self.pk.length = self._reset_size
         self._sp_len = 0
+        _shrink_buffer(&self.pk, self._initial_buf_size)
 
     cpdef flush(self):
         with self._lock:
@@ -399,16 +475,23 @@ cdef class MsgpackEncoderBase(BufferedEncoder):
 
     cdef msgpack_packer pk
     cdef stdint.uint32_t _count
+    cdef size_t _initial_buf_size
 
     def __cinit__(self, size_t max_size, size_t max_item_size):
-        cdef int buf_size = 1024*1024
-        self.pk.buf = <char*> PyMem_Malloc(buf_size)
-        if self.pk.buf == NULL:
-            raise MemoryError("Unable to allocate internal buffer.")
+        cdef size_t buf_size
 
         self.max_size = max_size
-        self.pk.buf_size = buf_size
         self.max_item_size = max_item_size if max_item_size < max_size else max_size
+
+        # DEV: A full buffer plus one item of the maximum size is all we need
+        # to hold to decide whether the item fits. Cap the buffer growth there
+        # instead of letting it double while packing an oversized trace.
+        self.pk.max_buf_size = max_size + self.max_item_size + MSGPACK_ARRAY_LENGTH_PREFIX_SIZE
+        buf_size = min(INITIAL_BUFFER_SIZE, self.pk.max_buf_size)
+        self.pk.buf = <char*> PyMem_Malloc(buf_size)
+        if self.pk.buf == NULL:
+            raise MemoryError("Unable to allocate internal buffer.")
+        self.pk.buf_size = self._initial_buf_size = buf_size
         self._lock = threading.RLock()
         self._reset_buffer()
 
@@ -428,6 +511,8 @@ cdef class MsgpackEncoderBase(BufferedEncoder):
     cdef _reset_buffer(self):
         self._count = 0
         self.pk.length = MSGPACK_ARRAY_LENGTH_PREFIX_SIZE  # Leave room for array length prefix
+        self.pk.overflow = 0
+        _shrink_buffer(&self.pk, self._initial_buf_size)
 
     cpdef encode(self):
         with self._lock:
@@ -501,10 +586,8 @@ cdef class MsgpackEncoderBase(BufferedEncoder):
                     raise RuntimeError("internal error")
 
                 # DEV: msgpack avoids buffer overflows by calling PyMem_Realloc so
-                # we must check sizes manually.
-                # TODO: We should probably ensure that the buffer size doesn't
-                # grow arbitrarily because of the PyMem_Realloc and if it does then
-                # free and reallocate with the appropriate size.
+                # we must check sizes manually. The buffer growth itself is
+                # capped by max_buf_size, see the overflow handling below.
                 if self.size - size_before > self.max_item_size:
                     raise BufferItemTooLarge(self.size - size_before)
 
@@ -514,7 +597,13 @@ cdef class MsgpackEncoderBase(BufferedEncoder):
                 self._count += 1
             except Exception:
                 # rollback
+                item_size = self.pk.length - len_before
                 self.pk.length = len_before
+                if self.pk.overflow:
+                    # The buffer only overflows when the trace is larger than
+                    # the maximum item size.
+                    self.pk.overflow = 0
+                    raise BufferItemTooLarge(item_size)
                 raise
 
     @property
@@ -604,10 +693,15 @@ cdef class MsgpackEncoderV03(MsgpackEncoderBase):
         cdef int has_meta
         cdef int has_metrics
 
+        # DEV: read the raw tag slots, the ``_meta``/``_metrics`` properties
+        # would allocate empty dictionaries for spans without tags.
+        meta = span._meta_dict
+        metrics = span._metrics_dict
+
         has_error = <bint> (span.error != 0)
         has_span_type = <bint> (span.span_type is not None)
-        has_meta = <bint> (len(span._meta) > 0 or dd_origin is not NULL)
-        has_metrics = <bint> (len(span._metrics) > 0)
+        has_meta = <bint> ((meta is not None and len(meta) > 0) or dd_origin is not NULL)
+        has_metrics = <bint> (metrics is not None and len(metrics) > 0)
         has_parent_id = <bint> (span.parent_id is not None)
 
         L = 7 + has_span_type + has_meta + has_metrics + has_error + has_parent_id
@@ -692,7 +786,7 @@ cdef class MsgpackEncoderV03(MsgpackEncoderBase):
                 ret = pack_bytes(&self.pk, <char *> b"meta", 4)
                 if ret != 0:
                     return ret
-                ret = self._pack_meta(span._meta, <char *> dd_origin)
+                ret = self._pack_meta(meta if meta is not None else {}, <char *> dd_origin)
                 if ret != 0:
                     return ret
 
@@ -700,7 +794,7 @@ cdef class MsgpackEncoderV03(MsgpackEncoderBase):
                 ret = pack_bytes(&self.pk, <char *> b"metrics", 7)
                 if ret != 0:
                     return ret
-                ret = self._pack_metrics(span._metrics)
+                ret = self._pack_metrics(metrics)
                 if ret != 0:
                     return ret
 
@@ -792,11 +886,12 @@ cdef class MsgpackEncoderV05(MsgpackEncoderBase):
         if ret != 0:
             return ret
 
-        ret = msgpack_pack_map(&self.pk, len(span._meta) + (dd_origin is not NULL))
+        meta = span._meta_dict
+        ret = msgpack_pack_map(&self.pk, (len(meta) if meta is not None else 0) + (dd_origin is not NULL))
         if ret != 0:
             return ret
-        if span._meta:
-            for k, v in span._meta.items():
+        if meta:
+            for k, v in meta.items():
                 ret = self._pack_string(k)
                 if ret != 0:
                     return ret
@@ -811,11 +906,12 @@ cdef class MsgpackEncoderV05(MsgpackEncoderBase):
             if ret != 0:
                 return ret
 
-        ret = msgpack_pack_map(&self.pk, len(span._metrics))
+        metrics = span._metrics_dict
+        ret = msgpack_pack_map(&self.pk, len(metrics) if metrics is not None else 0)
         if ret != 0:
             return ret
-        if span._metrics:
-            for k, v in span._metrics.items():
+        if metrics:
+            for k, v in metrics.items():
                 ret = self._pack_string(k)
                 if ret != 0:
                     return ret
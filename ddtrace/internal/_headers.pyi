@@ -0,0 +1,7 @@
+from typing import Any
+from typing import Dict
+from typing import Iterable
+
+class HeaderCollector(object):
+    def __init__(self, names: Iterable[str]) -> None: ...
+    def collect(self, headers: Any) -> Dict[str, str]: ...
@@ -0,0 +1,138 @@
+"""
+Single pass lookup of a known set of headers in a header carrier.
+
+The carriers handled are:
+
+- mappings of header names to values, e.g. ``{"X-Datadog-Trace-Id": "1234"}``
+- WSGI environ dictionaries, e.g. ``{"HTTP_X_DATADOG_TRACE_ID": "1234"}``
+- ASGI header lists, e.g. ``[(b"x-datadog-trace-id", b"1234")]``
+
+Header names are matched case insensitively, and values are returned as native
+strings keyed by the lowercase name they were registered with.
+"""
+from cpython.dict cimport PyDict_CheckExact
+from cpython.dict cimport PyDict_Next
+from cpython.object cimport PyObject
+
+from .compat import ensure_str
+
+
+DEF MAX_NAME_LENGTH = 64
+
+
+cdef inline object _native_str(object value):
+    if type(value) is str:
+        return value
+    return ensure_str(value, errors="backslashreplace")
+
+
+cdef inline bint _equals_ignore_case(unicode header, bytes alias):
+    # ``alias`` is lowercase ASCII of the same length as ``header``
+    cdef Py_ssize_t i
+    cdef Py_UCS4 ch
+    cdef unsigned int c
+    cdef const unsigned char* expected = alias
+
+    for i in range(len(alias)):
+        ch = header[i]
+        c = ch
+        if c >= 0x41 and c <= 0x5A:
+            c += 0x20
+        if c != expected[i]:
+            return False
+    return True
+
+
+cdef inline bint _bytes_equals_ignore_case(bytes header, bytes alias):
+    cdef Py_ssize_t i
+    cdef unsigned char c
+    cdef const unsigned char* actual = header
+    cdef const unsigned char* expected = alias
+
+    for i in range(len(alias)):
+        c = actual[i]
+        if c >= 0x41 and c <= 0x5A:
+            c += 0x20
+        if c != expected[i]:
+            return False
+    return True
+
+
+cdef class HeaderCollector(object):
+    """Find the registered headers in a carrier, looking at each header once."""
+
+    # Exact spellings of the registered names, mapped to the name
+    cdef dict _names
+    # Lowercase spellings of the registered names, grouped by length, as
+    # (ASCII bytes, name) pairs, so that most unrelated headers are told apart
+    # by their length or by their first characters without folding their case
+    cdef list _by_length
+
+    def __cinit__(self, names):
+        self._names = {}
+        self._by_length = [() for _ in range(MAX_NAME_LENGTH)]
+
+        for name in names:
+            name = name.lower()
+            wsgi_name = "HTTP_" + name.upper().replace("-", "_")
+            for alias in (name, wsgi_name.lower()):
+                if len(alias) >= MAX_NAME_LENGTH:
+                    raise ValueError("header name too long: %r" % alias)
+                encoded = alias.encode("ascii")
+                self._by_length[len(alias)] += ((encoded, name),)
+                self._names[alias] = name
+                self._names[encoded] = name
+            # WSGI environments use upper case names
+            self._names[wsgi_name] = name
+
+    cdef inline object _lookup(self, object header):
+        cdef Py_ssize_t length
+        cdef tuple candidate
+
+        # Exact matches are the most common, and the hash of the header name is
+        # usually already computed as it is a dict key
+        name = self._names.get(header)
+        if name is not None:
+            return name
+
+        if isinstance(header, unicode):
+            length = len(<unicode>header)
+            if length >= MAX_NAME_LENGTH:
+                return None
+            for candidate in self._by_length[length]:
+                if _equals_ignore_case(<unicode>header, <bytes>candidate[0]):
+                    return candidate[1]
+        elif isinstance(header, bytes):
+            length = len(<bytes>header)
+            if length >= MAX_NAME_LENGTH:
+                return None
+            for candidate in self._by_length[length]:
+                if _bytes_equals_ignore_case(<bytes>header, <bytes>candidate[0]):
+                    return candidate[1]
+        return None
+
+    cpdef dict collect(self, object headers):
+        """Return the registered headers found in ``headers``.
+
+        When a header is given more than once, the last value is kept.
+        """
+        cdef dict found = {}
+        cdef Py_ssize_t pos = 0
+        cdef PyObject* key
+        cdef PyObject* value
+
+        if PyDict_CheckExact(headers):
+            while PyDict_Next(headers, &pos, &key, &value):
+                name = self._lookup(<object>key)
+                if name is not None:
+                    found[name] = _native_str(<object>value)
+            return found
+
+        # Other mappings, or ASGI style lists of (name, value) pairs
+        items = headers.items() if hasattr(headers, "items") else headers
+        for header, v in items:
+            name = self._lookup(header)
+            if name is not None:
+                found[name] = _native_str(v)
+
+        return found
@@ -0,0 +1,19 @@
+from typing import Optional
+
+class RateLimiter(object):
+    rate_limit: int
+    max_tokens: int
+    last_update_ns: float
+    current_window_ns: float
+    tokens_allowed: int
+    tokens_total: int
+    def __init__(self, rate_limit: int) -> None: ...
+    @property
+    def tokens(self) -> float: ...
+    @property
+    def prev_window_rate(self) -> Optional[float]: ...
+    @property
+    def effective_rate(self) -> float: ...
+    def is_allowed(self, timestamp_ns: float) -> bool: ...
+    def is_allowed_n(self, n: int, timestamp_ns: float) -> int: ...
+    def _is_allowed(self, timestamp_ns: float) -> bool: ...
@@ -0,0 +1,191 @@
+"""
+Token bucket rate limiter.
+
+The limiter is thread-safe without a lock: each of its methods only runs C
+code on C fields and never calls back into Python, so it is executed as a
+single step under the GIL, like the generator of ``_rand``. Threads checking
+the limiter at the same time therefore never block on each other, whether
+tokens are available or not.
+"""
+from libc.stdint cimport int64_t
+
+from .compat import monotonic_ns
+
+
+cdef class RateLimiter(object):
+    """
+    A token bucket rate limiter implementation
+    """
+
+    cdef readonly object rate_limit
+    cdef readonly object max_tokens
+    cdef double _rate
+    cdef double _tokens
+    # DEV: timestamps are doubles, as callers may pass floats beyond the
+    # range of 64-bit integers. They keep a nanosecond precision for over 100
+    # days of monotonic clock.
+    cdef readonly double last_update_ns
+    cdef readonly double current_window_ns
+    cdef readonly int64_t tokens_allowed
+    cdef readonly int64_t tokens_total
+    cdef double _prev_window_rate
+    cdef bint _has_prev_window
+
+    def __init__(self, rate_limit):
+        # type: (int) -> None
+        """
+        Constructor for RateLimiter
+
+        :param rate_limit: The rate limit to apply for number of requests per second.
+            rate limit > 0 max number of requests to allow per second,
+            rate limit == 0 to disallow all requests,
+            rate limit < 0 to allow all requests
+        :type rate_limit: :obj:`int`
+        """
+        self.rate_limit = rate_limit
+        self.max_tokens = rate_limit
+        self._rate = rate_limit
+        self._tokens = rate_limit
+
+        self.last_update_ns = monotonic_ns()
+
+        self.current_window_ns = 0
+        self.tokens_allowed = 0
+        self.tokens_total = 0
+        self._has_prev_window = False
+
+    @property
+    def tokens(self):
+        # type: () -> float
+        return self._tokens
+
+    @property
+    def prev_window_rate(self):
+        # type: () -> Optional[float]
+        return self._prev_window_rate if self._has_prev_window else None
+
+    def is_allowed(self, double timestamp_ns):
+        # type: (int) -> bool
+        """
+        Check whether the current request is allowed or not
+
+        This method will also reduce the number of available tokens by 1
+
+        :param int timestamp_ns: timestamp in nanoseconds for the current request.
+        :returns: Whether the current request is allowed or not
+        :rtype: :obj:`bool`
+        """
+        cdef int64_t allowed = self._take(1, timestamp_ns)
+        # Update counts used to determine effective rate
+        self._update_rate_counts(allowed, 1, timestamp_ns)
+        return allowed == 1
+
+    def is_allowed_n(self, int64_t n, double timestamp_ns):
+        # type: (int, int) -> int
+        """
+        Check how many of ``n`` requests made at the same time are allowed
+
+        This is equivalent to, but cheaper than, calling :meth:`is_allowed`
+        ``n`` times with the same timestamp.
+
+        :param int n: the number of requests.
+        :param int timestamp_ns: timestamp in nanoseconds for the requests.
+        :returns: The number of requests allowed, between 0 and ``n``
+        :rtype: :obj:`int`
+        """
+        cdef int64_t allowed
+
+        if n <= 0:
+            return 0
+        allowed = self._take(n, timestamp_ns)
+        self._update_rate_counts(allowed, n, timestamp_ns)
+        return allowed
+
+    def _is_allowed(self, double timestamp_ns):
+        # type: (int) -> bool
+        return self._take(1, timestamp_ns) == 1
+
+    cdef inline void _update_rate_counts(self, int64_t allowed, int64_t total, double timestamp_ns):
+        # No tokens have been seen yet, start a new window
+        if not self.current_window_ns:
+            self.current_window_ns = timestamp_ns
+
+        # If more than 1 second has past since last window, reset
+        # DEV: We are comparing nanoseconds, so 1e9 is 1 second
+        elif timestamp_ns - self.current_window_ns >= 1e9:
+            # Store previous window's rate to average with current for `.effective_rate`
+            self._prev_window_rate = self._current_window_rate()
+            self._has_prev_window = True
+            self.tokens_allowed = 0
+            self.tokens_total = 0
+            self.current_window_ns = timestamp_ns
+
+        # Keep track of total tokens seen vs allowed
+        self.tokens_allowed += allowed
+        self.tokens_total += total
+
+    cdef inline int64_t _take(self, int64_t n, double timestamp_ns):
+        # Rate limit of 0 blocks everything
+        if self._rate == 0:
+            return 0
+
+        # Negative rate limit disables rate limiting
+        elif self._rate < 0:
+            return n
+
+        self._replenish(timestamp_ns)
+
+        if self._tokens < n:
+            # Whole tokens only
+            n = <int64_t>self._tokens
+        self._tokens -= n
+        return n
+
+    cdef inline void _replenish(self, double timestamp_ns):
+        cdef double elapsed
+
+        # If we are at the max, we do not need to add any more
+        if self._tokens == self._rate:
+            self.last_update_ns = timestamp_ns
+            return
+
+        # Add more available tokens based on how much time has passed
+        # DEV: We store as nanoseconds, convert to seconds
+        elapsed = (timestamp_ns - self.last_update_ns) / 1e9
+        self.last_update_ns = timestamp_ns
+
+        # Update the number of available tokens, but ensure we do not exceed the max
+        self._tokens = min(self._rate, self._tokens + elapsed * self._rate)
+
+    cdef inline double _current_window_rate(self):
+        # No tokens have been seen, effectively 100% sample rate
+        # DEV: This is to avoid division by zero error
+        if not self.tokens_total:
+            return 1.0
+
+        # Get rate of tokens allowed
+        return <double>self.tokens_allowed / self.tokens_total
+
+    @property
+    def effective_rate(self):
+        # type: () -> float
+        """
+        Return the effective sample rate of this rate limiter
+
+        :returns: Effective sample rate value 0.0 <= rate <= 1.0
+        :rtype: :obj:`float``
+        """
+        # If we have not had a previous window yet, return current rate
+        if not self._has_prev_window:
+            return self._current_window_rate()
+
+        return (self._current_window_rate() + self._prev_window_rate) / 2.0
+
+    def __repr__(self):
+        return "{}(rate_limit={!r}, tokens={!r}, last_update_ns={!r}, effective_rate={!r})".format(
+            self.__class__.__name__,
+            self.rate_limit,
+            self.tokens,
+            self.last_update_ns,
+            self.effective_rate,
+        )
@@ -2,12 +2,14 @@ import os
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 
 import ddtrace
 from ddtrace import config
 from ddtrace.vendor.dogstatsd import DogStatsd
 
 from .. import agent
+from .. import compression
 from .. import service
 from ...sampler import BasePrioritySampler
 from ...sampler import BaseSampler
@@ -24,7 +26,13 @@ from .encoder import CIVisibilityCoverageEncoderV02
 from .encoder import CIVisibilityEncoderV01
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ddtrace.span import Span
+
+
 class CIVisibilityEventClient(WriterClientBase):
+    CONTENT_ENCODINGS = (compression.GZIP,)
+
     def __init__(self):
         encoder = CIVisibilityEncoderV01(0, 0)
         encoder.set_metadata(
@@ -73,6 +81,7 @@ class CIVisibilityWriter(HTTPWriter):
         reuse_connections=None,  # type: Optional[bool]
         headers=None,  # type: Optional[Dict[str, str]]
         use_evp=False,  # type: bool
+        compression=None,  # type: Optional[str]
     ):
         if config._ci_visibility_agentless_url:
             intake_url = config._ci_visibility_agentless_url
@@ -96,8 +105,20 @@ class CIVisibilityWriter(HTTPWriter):
             sync_mode=sync_mode,
             reuse_connections=reuse_connections,
             headers=headers,
+            compression=compression,
         )
 
+    def write(self, spans=None):
+        if spans is not None:
+            # The encoders keep the spans until the buffer is flushed, so they
+            # are never handed back.
+            self._hold_spans(spans)
+        super(CIVisibilityWriter, self).write(spans=spans)
+
+    def _release_spans(self, spans):
+        # type: (List[Span]) -> None
+        pass
+
     def stop(self, timeout=None):
         if self.status != service.ServiceStatus.STOPPED:
             super(CIVisibilityWriter, self).stop(timeout=timeout)
@@ -108,8 +129,9 @@ class CIVisibilityWriter(HTTPWriter):
             intake_url=self.intake_url,
             sampler=self._sampler,
             priority_sampler=self._priority_sampler,
-            processing_interval=self._interval,
+            processing_interval=self._base_interval,
             timeout=self._timeout,
             dogstatsd=self.dogstatsd,
             sync_mode=self._sync_mode,
+            compression=self._compression,
         )
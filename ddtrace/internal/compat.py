@@ -175,7 +175,13 @@ else:
 
 
 if PYTHON_VERSION_INFO[0:2] >= (3, 5):
-    from asyncio import iscoroutinefunction
+
+    def iscoroutinefunction(fn):
+        # type: (Any) -> bool
+        # DEV: asyncio is imported on first use as it is expensive to import at startup
+        from asyncio import iscoroutinefunction
+
+        return iscoroutinefunction(fn)
 
     # Execute from a string to get around syntax errors from `yield from`
     # DEV: The idea to do this was stolen from `six`
@@ -184,7 +190,6 @@ if PYTHON_VERSION_INFO[0:2] >= (3, 5):
         textwrap.dedent(
             """
     import functools
-    import asyncio
 
 
     def make_async_decorator(tracer, coro, *params, **kw_params):
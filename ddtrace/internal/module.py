@@ -1,4 +1,5 @@
 from collections import defaultdict
+import os
 from os.path import abspath
 from os.path import expanduser
 from os.path import isdir
@@ -19,9 +20,12 @@ from typing import Type
 from typing import Union
 from typing import cast
 
+from ddtrace.internal import atexit
 from ddtrace.internal.compat import PY2
+from ddtrace.internal.compat import monotonic_ns
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.utils import get_argument_value
+from ddtrace.internal.utils.formats import asbool
 
 
 log = get_logger(__name__)
@@ -147,6 +151,49 @@ else:
 
 LEGACY_DICT_COPY = sys.version_info < (3, 6)
 
+# The attributes that the module watchdog takes from the wrapped sys.modules
+# dictionary. Any other attribute is looked up on the watchdog first.
+_DICT_ATTRIBUTES = frozenset(dir(dict))
+
+
+class ImportProfile(object):
+    """Time spent by the module watchdogs on each import.
+
+    The overhead of an import is the time the watchdogs add to the execution
+    of the module, including the time spent in the import hooks, which is also
+    reported on its own.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.overhead = defaultdict(int)  # type: DefaultDict[str, int]
+        self.hooks = defaultdict(int)  # type: DefaultDict[str, int]
+
+    def report(self, top=20):
+        # type: (int) -> str
+        """Return a summary of the imports with the highest overhead."""
+        total = sum(self.overhead.values())
+        lines = [
+            "%d imports, %.3fms watchdog overhead, %.3fms in hooks"
+            % (len(self.overhead), total / 1e6, sum(self.hooks.values()) / 1e6)
+        ]
+        for name in sorted(self.overhead, key=self.overhead.__getitem__, reverse=True)[:top]:
+            lines.append(
+                "  %s: %.3fms overhead, %.3fms in hooks" % (name, self.overhead[name] / 1e6, self.hooks[name] / 1e6)
+            )
+        return "\n".join(lines)
+
+
+def _log_import_profile(profile):
+    # type: (ImportProfile) -> None
+    log.info("Module watchdog import profile: %s", profile.report())
+
+
+_import_profile = None  # type: Optional[ImportProfile]
+if asbool(os.getenv("_DD_TRACE_MODULE_WATCHDOG_PROFILE")):
+    _import_profile = ImportProfile()
+    atexit.register(_log_import_profile, _import_profile)
+
 
 class _ImportHookChainedLoader(Loader):
     def __init__(self, loader):
@@ -193,6 +240,10 @@ class _ImportHookChainedLoader(Loader):
         return self.loader.create_module(spec)
 
     def _exec_module(self, module):
+        profile = _import_profile
+        if profile is not None:
+            start = monotonic_ns()
+
         # Collect and run only the first hook that matches the module.
         pre_exec_hook = None
 
@@ -210,14 +261,23 @@ class _ImportHookChainedLoader(Loader):
             if pre_exec_hook is not None:
                 break
 
+        if profile is not None:
+            exec_start = monotonic_ns()
+
         if pre_exec_hook:
             pre_exec_hook(self, module)
         else:
             self.loader.exec_module(module)
 
+        if profile is not None:
+            exec_end = monotonic_ns()
+
         for callback in self.callbacks.values():
             callback(module)
 
+        if profile is not None:
+            profile.overhead[module.__name__] += exec_start - start + monotonic_ns() - exec_end
+
 
 class ModuleWatchdog(dict):
     """Module watchdog.
@@ -240,6 +300,10 @@ class ModuleWatchdog(dict):
         self._modules = sys.modules  # type: Union[dict, ModuleWatchdog]
         self._finding = set()  # type: Set[str]
         self._pre_exec_module_hooks = []  # type: List[Tuple[PreExecHookCond, PreExecHookType]]
+        # The origins with registered hooks. The origin of the imported modules
+        # is only computed when there are such hooks, or when the origin map is
+        # in use, as it requires a file system lookup.
+        self._origins = set()  # type: Set[str]
 
     def __getitem__(self, item):
         # type: (str) -> ModuleType
@@ -285,20 +349,28 @@ class ModuleWatchdog(dict):
 
     def after_import(self, module):
         # type: (ModuleType) -> None
-        path = origin(module)
-        self._origin_map[path] = module
+        hook_map = self._hook_map
 
         # Collect all hooks by module origin and name
         hooks = []
-        if path in self._hook_map:
-            hooks.extend(self._hook_map[path])
-        if module.__name__ in self._hook_map:
-            hooks.extend(self._hook_map[module.__name__])
+        if self._om is not None or self._origins:
+            path = origin(module)
+            if self._om is not None:
+                self._om[path] = module
+            if path in self._origins:
+                hooks.extend(hook_map[path])
+        if module.__name__ in hook_map:
+            hooks.extend(hook_map[module.__name__])
 
         if hooks:
             log.debug("Calling %d registered hooks on import of module '%s'", len(hooks), module.__name__)
+            profile = _import_profile
+            if profile is not None:
+                start = monotonic_ns()
             for hook in hooks:
                 hook(module)
+            if profile is not None:
+                profile.hooks[module.__name__] += monotonic_ns() - start
 
     @classmethod
     def get_by_origin(cls, _origin):
@@ -326,17 +398,26 @@ class ModuleWatchdog(dict):
 
     def __delitem__(self, name):
         # type: (str) -> None
-        try:
-            path = origin(sys.modules[name])
-            # Drop the module reference to reclaim memory
-            del self._origin_map[path]
-        except KeyError:
-            pass
+        if self._om is not None:
+            try:
+                path = origin(sys.modules[name])
+                # Drop the module reference to reclaim memory
+                del self._om[path]
+            except KeyError:
+                pass
 
         self._modules.__delitem__(name)
 
     def __getattribute__(self, name):
         # type: (str) -> Any
+        if name not in _DICT_ATTRIBUTES:
+            # This is an attribute of the watchdog, which is looked up on every
+            # import, so we avoid trying with sys.modules first.
+            try:
+                return super(ModuleWatchdog, self).__getattribute__(name)
+            except AttributeError:
+                pass
+
         if LEGACY_DICT_COPY and name == "keys":
             # This is a potential attempt to make a copy of sys.modules using
             # dict(sys.modules) on a Python version that uses the C API to
@@ -446,6 +527,7 @@ class ModuleWatchdog(dict):
         log.debug("Registering hook '%r' on path '%s'", hook, path)
         instance = cast(ModuleWatchdog, cls._instance)
         instance._hook_map[path].append(hook)
+        instance._origins.add(path)
         try:
             module = instance._origin_map[path]
         except KeyError:
@@ -478,6 +560,7 @@ class ModuleWatchdog(dict):
                 hooks.remove(hook)
                 if not hooks:
                     del instance._hook_map[path]
+                    instance._origins.discard(path)
         except ValueError:
             raise ValueError("Hook %r not registered for origin %s" % (hook, origin))
 
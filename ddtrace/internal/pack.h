@@ -30,6 +30,8 @@ typedef struct msgpack_packer {
     char *buf;
     size_t length;
     size_t buf_size;
+    size_t max_buf_size;  // Hard limit on the buffer size, 0 means unbounded
+    int overflow;  // Set when a write was refused because of max_buf_size
 } msgpack_packer;
 
 typedef struct Packer Packer;
@@ -42,7 +44,15 @@ static inline int msgpack_pack_write(msgpack_packer* pk, const char *data, size_
     size_t len = pk->length;
 
     if (len + l > bs) {
+        if (pk->max_buf_size && len + l > pk->max_buf_size) {
+            // Refuse to grow past the hard limit. No Python exception is set,
+            // the caller is expected to check the overflow flag.
+            pk->overflow = 1;
+            return -1;
+        }
         bs = (len + l) * 2;
+        if (pk->max_buf_size && bs > pk->max_buf_size)
+            bs = pk->max_buf_size;
         buf = (char*)PyMem_Realloc(buf, bs);
         if (!buf) {
             PyErr_NoMemory();
@@ -99,6 +99,50 @@ class AwakeablePeriodicThread(PeriodicThread):
             self._on_shutdown()
 
 
+class NotifiablePeriodicThread(PeriodicThread):
+    """Periodic thread whose next run can be brought forward.
+
+    Unlike :class:`AwakeablePeriodicThread`, notifying the thread does not wait
+    for the target function to run, so it is safe to do it from application
+    threads.
+    """
+
+    def __init__(
+        self,
+        interval,  # type: float
+        target,  # type: typing.Callable[[], typing.Any]
+        name=None,  # type: typing.Optional[str]
+        on_shutdown=None,  # type: typing.Optional[typing.Callable[[], typing.Any]]
+    ):
+        # type: (...) -> None
+        """Create a periodic thread that can be notified to run early."""
+        super(NotifiablePeriodicThread, self).__init__(interval, target, name, on_shutdown)
+        self.notified = forksafe.Event()
+
+    def notify(self):
+        # type: () -> None
+        """Run the target function as soon as possible, without waiting for it."""
+        self.notified.set()
+
+    def stop(self):
+        """Stop the thread."""
+        super(NotifiablePeriodicThread, self).stop()
+        if self.is_alive():
+            self.notified.set()
+
+    def run(self):
+        """Run the target function periodically or when notified."""
+        while True:
+            self.notified.wait(self.interval)
+            self.notified.clear()
+            if self.quit.is_set():
+                break
+            self._target()
+
+        if self._on_shutdown is not None:
+            self._on_shutdown()
+
+
 @attr.s(eq=False)
 class PeriodicService(service.Service):
     """A service that runs periodically."""
@@ -164,3 +208,14 @@ class AwakeablePeriodicService(PeriodicService):
     def awake(self):
         # type: (...) -> None
         self._worker.awake()
+
+
+class NotifiablePeriodicService(PeriodicService):
+    """A service that runs periodically but whose next run can be brought forward."""
+
+    __thread_class__ = NotifiablePeriodicThread
+
+    def notify(self):
+        # type: (...) -> None
+        if self._worker is not None:
+            self._worker.notify()
@@ -1,4 +1,5 @@
 # coding: utf-8
+from array import array
 from collections import defaultdict
 import os
 import typing
@@ -6,6 +7,7 @@ import typing
 from ddsketch import LogCollapsingLowestDenseDDSketch
 from ddsketch.pb.proto import DDSketchProto
 import six
+from six.moves import intern as _intern
 import tenacity
 
 import ddtrace
@@ -15,13 +17,13 @@ from ddtrace.span import _is_top_level
 from . import SpanProcessor
 from ...constants import SPAN_MEASURED_KEY
 from .._encoding import packb
-from ..agent import get_connection
 from ..compat import get_connection_response
 from ..compat import httplib
 from ..forksafe import Lock
 from ..hostname import get_hostname
 from ..logger import get_logger
 from ..periodic import PeriodicService
+from ..utils.http import ConnectionPool
 from ..writer import _human_size
 
 
@@ -34,6 +36,8 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 
     from ddtrace import Span
 
+    _Buckets = DefaultDict[int, DefaultDict["SpanAggrKey", "SpanAggrStats"]]
+
 
 log = get_logger(__name__)
 
@@ -41,7 +45,7 @@ log = get_logger(__name__)
 def _is_measured(span):
     # type: (Span) -> bool
     """Return whether the span is flagged to be measured or not."""
-    return span._metrics.get(SPAN_MEASURED_KEY) == 1
+    return span.get_metric(SPAN_MEASURED_KEY) == 1
 
 
 """
@@ -61,20 +65,71 @@ SpanAggrKey = typing.Tuple[
 ]
 
 
-class SpanAggrStats(object):
-    """Aggregated span statistics."""
+# Durations are buffered in arrays of doubles, which hold nanosecond durations
+# exactly up to 2**53 ns (~104 days) and are available on all platforms.
+_DURATIONS_TYPECODE = "d"
+
+# Maximum number of durations of a buffer. Once a buffer is full, the next
+# durations go to a new one instead of growing it, so that appending a duration
+# never copies a large buffer while the processor lock is held.
+MAX_BUFFERED_DURATIONS = 1 << 14
+
 
-    __slots__ = ("hits", "top_level_hits", "errors", "duration", "ok_distribution", "err_distribution")
+def _new_distribution():
+    # type: () -> LogCollapsingLowestDenseDDSketch
+    # Match the relative accuracy of the sketch implementation used in the backend
+    # which is 0.775%.
+    return LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=2048)
+
+
+class SpanAggrStats(object):
+    """Aggregated span statistics.
+
+    Span durations are appended to compact buffers and only merged into the
+    distributions when the stats are serialized, by the thread flushing them
+    and without holding the processor lock, to keep the cost of aggregating a
+    span low. The buffers use 8 bytes per duration.
+    """
+
+    __slots__ = (
+        "hits",
+        "top_level_hits",
+        "errors",
+        "duration",
+        "ok_distribution",
+        "err_distribution",
+        "ok_durations",
+        "err_durations",
+    )
 
     def __init__(self):
         self.hits = 0
         self.top_level_hits = 0
         self.errors = 0
         self.duration = 0
-        # Match the relative accuracy of the sketch implementation used in the backend
-        # which is 0.775%.
-        self.ok_distribution = LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=2048)
-        self.err_distribution = LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=2048)
+        self.ok_distribution = _new_distribution()
+        self.err_distribution = _new_distribution()
+        self.ok_durations = [array(_DURATIONS_TYPECODE)]  # type: List[array]
+        self.err_durations = [array(_DURATIONS_TYPECODE)]  # type: List[array]
+
+    def merge_durations(self):
+        # type: () -> None
+        """Merge the buffered durations into the distributions."""
+        for buffers, distribution in (
+            (self.ok_durations, self.ok_distribution),
+            (self.err_durations, self.err_distribution),
+        ):
+            add = distribution.add
+            for durations in buffers:
+                for duration in durations:
+                    add(duration)
+            del buffers[1:]
+            del buffers[0][:]
+
+
+def _new_buckets():
+    # type: () -> _Buckets
+    return defaultdict(lambda: defaultdict(SpanAggrStats))
 
 
 def _span_aggr_key(span):
@@ -88,6 +143,24 @@ def _span_aggr_key(span):
     return span.name, service, resource, _type, int(status_code), synthetics
 
 
+def _intern_aggr_key(key):
+    # type: (SpanAggrKey) -> SpanAggrKey
+    """Intern the strings of a new aggregation key.
+
+    Keys are stored for every bucket they are seen in, interning lets all of
+    them share the same strings.
+    """
+    name, service, resource, _type, status_code, synthetics = key
+    return (
+        _intern(name) if type(name) is str else name,
+        _intern(service) if type(service) is str else service,
+        _intern(resource) if type(resource) is str else resource,
+        _intern(_type) if type(_type) is str else _type,
+        status_code,
+        synthetics,
+    )
+
+
 class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
     """SpanProcessor for computing, collecting and submitting span metrics to the Datadog Agent."""
 
@@ -100,11 +173,10 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
         self._endpoint = "/v0.6/stats"
         self._agent_endpoint = "%s%s" % (self._agent_url, self._endpoint)
         self._timeout = timeout
+        self._conn_pool = ConnectionPool(agent_url, timeout)
         # Have the bucket size match the interval in which flushes occur.
         self._bucket_size_ns = int(interval * 1e9)  # type: int
-        self._buckets = defaultdict(
-            lambda: defaultdict(SpanAggrStats)
-        )  # type: DefaultDict[int, DefaultDict[SpanAggrKey, SpanAggrStats]]
+        self._buckets = _new_buckets()
         self._headers = {
             "Datadog-Meta-Lang": "python",
             "Datadog-Meta-Tracer-Version": ddtrace.__version__,
@@ -142,7 +214,10 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
             span_end_ns = span.start_ns + span.duration_ns
             bucket_time_ns = span_end_ns - (span_end_ns % self._bucket_size_ns)
             aggr_key = _span_aggr_key(span)
-            stats = self._buckets[bucket_time_ns][aggr_key]
+            bucket = self._buckets[bucket_time_ns]
+            stats = bucket.get(aggr_key)
+            if stats is None:
+                stats = bucket[_intern_aggr_key(aggr_key)] = SpanAggrStats()
 
             stats.hits += 1
             stats.duration += span.duration_ns
@@ -150,24 +225,28 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
                 stats.top_level_hits += 1
             if span.error:
                 stats.errors += 1
-                stats.err_distribution.add(span.duration_ns)
+                buffers = stats.err_durations
             else:
-                stats.ok_distribution.add(span.duration_ns)
-
-    def _serialize_buckets(self):
-        # type: () -> List[Dict]
-        """Serialize and update the buckets.
-
-        The current bucket is left in case any other spans are added.
+                buffers = stats.ok_durations
+            durations = buffers[-1]
+            durations.append(span.duration_ns)
+            if len(durations) >= MAX_BUFFERED_DURATIONS:
+                buffers.append(array(_DURATIONS_TYPECODE))
+
+    def _serialize_buckets(self, buckets):
+        # type: (_Buckets) -> List[Dict]
+        """Serialize the buckets taken out of the processor.
+
+        The buffered durations are merged into the distributions here, so the
+        buckets must no longer be updated by the spans that finish.
         """
         serialized_buckets = []
-        serialized_bucket_keys = []
-        for bucket_time_ns, bucket in self._buckets.items():
+        for bucket_time_ns, bucket in buckets.items():
             bucket_aggr_stats = []
-            serialized_bucket_keys.append(bucket_time_ns)
 
             for aggr_key, stat_aggr in bucket.items():
                 name, service, resource, _type, http_status, synthetics = aggr_key
+                stat_aggr.merge_durations()
                 serialized_bucket = {
                     u"Name": six.ensure_text(name),
                     u"Resource": six.ensure_text(resource),
@@ -193,18 +272,16 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
                 }
             )
 
-        # Clear out buckets that have been serialized
-        for key in serialized_bucket_keys:
-            del self._buckets[key]
-
         return serialized_buckets
 
     def _flush_stats(self, payload):
         # type: (bytes) -> None
         try:
-            conn = get_connection(self._agent_url, self._timeout)
-            conn.request("PUT", self._endpoint, payload, self._headers)
-            resp = get_connection_response(conn)
+            with self._conn_pool.connection() as conn:
+                conn.request("PUT", self._endpoint, payload, self._headers)
+                resp = get_connection_response(conn)
+                # Consume the body so that the connection can be reused
+                body = resp.read()
         except Exception:
             log.error("failed to submit span stats to the Datadog agent at %s", self._agent_endpoint, exc_info=True)
             raise
@@ -220,7 +297,7 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
                     "failed to send stats payload, %s (%s) (%s) response from Datadog agent at %s",
                     resp.status,
                     resp.reason,
-                    resp.read(),
+                    body,
                     self._agent_endpoint,
                 )
             else:
@@ -229,8 +306,12 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
     def periodic(self):
         # type: (...) -> None
 
+        # Only take the buckets out while holding the lock: the spans that
+        # finish meanwhile are aggregated in new buckets, and are not blocked
+        # while the durations are merged.
         with self._lock:
-            serialized_stats = self._serialize_buckets()
+            buckets, self._buckets = self._buckets, _new_buckets()
+        serialized_stats = self._serialize_buckets(buckets)
 
         if not serialized_stats:
             # No stats to report, short-circuit.
@@ -254,3 +335,4 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
         # type: (Optional[float]) -> None
         self.periodic()
         self.stop(timeout)
+        self._conn_pool.close()
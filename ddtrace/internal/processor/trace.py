@@ -1,10 +1,12 @@
 import abc
 from collections import defaultdict
+from collections import deque
 import threading
 from typing import DefaultDict
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 
 import attr
 import six
@@ -13,6 +15,7 @@ from ddtrace import config
 from ddtrace.constants import SAMPLING_PRIORITY_KEY
 from ddtrace.constants import USER_KEEP
 from ddtrace.internal import gitmetadata
+from ddtrace.internal._encoding import estimate_span_size
 from ddtrace.internal.constants import HIGHER_ORDER_TRACE_ID_BITS
 from ddtrace.internal.constants import MAX_UINT_64BITS
 from ddtrace.internal.logger import get_logger
@@ -26,8 +29,22 @@ from ddtrace.span import _get_64_highest_order_bits_as_hex
 from ddtrace.span import _is_top_level
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Deque
+    from typing import Tuple
+
+    from ddtrace.internal.span_pool import SpanPool
+
+
 log = get_logger(__name__)
 
+# Number of partitions of the traces being aggregated by SpanAggregator
+DEFAULT_AGGREGATOR_SHARDS = 16
+# Estimated size of the finished spans of a trace that triggers a partial
+# flush. Disabled by default so that the size of the spans is only estimated
+# when it is explicitly configured.
+DEFAULT_PARTIAL_FLUSH_MIN_BYTES = 0
+
 
 @attr.s
 class TraceProcessor(six.with_metaclass(abc.ABCMeta)):
@@ -153,79 +170,163 @@ class SpanAggregator(SpanProcessor):
         - The collection is assumed to be complete. A collection of spans is
           assumed to be complete if all the spans that have been created with
           the trace_id have finished; or
-        - A minimum threshold of spans (``partial_flush_min_spans``) have been
-          finished in the collection and ``partial_flush_enabled`` is True.
+        - A minimum threshold of spans (``partial_flush_min_spans``), or of
+          their estimated encoded size in bytes (``partial_flush_min_bytes``,
+          only estimated when set), have been finished in the collection and
+          ``partial_flush_enabled`` is True.
+
+    Traces are partitioned by trace_id into ``num_shards`` shards, each with
+    its own lock, so that threads working on different traces rarely contend.
+    The flushed chunks are processed and written outside of any lock. The
+    chunks of a trace are written in the order they were flushed: the thread
+    that flushes a chunk while another chunk of the same trace is being
+    written queues it instead, and the writing thread writes the queued
+    chunks once it is done.
     """
 
     @attr.s
     class _Trace(object):
         spans = attr.ib(default=attr.Factory(list))  # type: List[Span]
         num_finished = attr.ib(type=int, default=0)  # type: int
+        # Estimated encoded size of the finished spans
+        size = attr.ib(type=int, default=0)  # type: int
+        # Whether a thread is writing the chunks of the trace
+        flushing = attr.ib(type=bool, default=False)  # type: bool
+        # Chunks waiting for the thread writing the trace, and whether their
+        # spans can be released to the span pool
+        pending = attr.ib(default=None)  # type: Optional[Deque[Tuple[List[Span], bool]]]
+
+    @attr.s
+    class _Shard(object):
+        traces = attr.ib(
+            factory=lambda: defaultdict(lambda: SpanAggregator._Trace()),
+            type=DefaultDict[int, "SpanAggregator._Trace"],
+        )
+        lock = attr.ib(factory=threading.Lock)
 
     _partial_flush_enabled = attr.ib(type=bool)
     _partial_flush_min_spans = attr.ib(type=int)
     _trace_processors = attr.ib(type=Iterable[TraceProcessor])
     _writer = attr.ib(type=TraceWriter)
-    _traces = attr.ib(
-        factory=lambda: defaultdict(lambda: SpanAggregator._Trace()),
-        init=False,
-        type=DefaultDict[int, "_Trace"],
-        repr=False,
-    )
-    _lock = attr.ib(init=False, factory=threading.Lock, repr=False)
+    _partial_flush_min_bytes = attr.ib(type=int, default=0)
+    _num_shards = attr.ib(type=int, default=DEFAULT_AGGREGATOR_SHARDS)
+    _span_pool = attr.ib(type=Optional["SpanPool"], default=None)
+    _shards = attr.ib(init=False, type=List["SpanAggregator._Shard"], repr=False)
+
+    @_shards.default
+    def _make_shards(self):
+        # type: () -> List[SpanAggregator._Shard]
+        if self._num_shards < 1:
+            raise ValueError("The number of shards must be positive")
+        return [SpanAggregator._Shard() for _ in range(self._num_shards)]
+
+    def _shard(self, trace_id):
+        # type: (int) -> SpanAggregator._Shard
+        return self._shards[trace_id % self._num_shards]
 
     def on_span_start(self, span):
         # type: (Span) -> None
-        with self._lock:
-            trace = self._traces[span.trace_id]
+        shard = self._shard(span.trace_id)
+        with shard.lock:
+            trace = shard.traces[span.trace_id]
             trace.spans.append(span)
 
     def on_span_finish(self, span):
         # type: (Span) -> None
-        with self._lock:
-            trace = self._traces[span.trace_id]
+        shard = self._shard(span.trace_id)
+        with shard.lock:
+            trace = shard.traces[span.trace_id]
             trace.num_finished += 1
-            should_partial_flush = self._partial_flush_enabled and trace.num_finished >= self._partial_flush_min_spans
-            if trace.num_finished == len(trace.spans) or should_partial_flush:
-                trace_spans = trace.spans
-                trace.spans = []
-                if trace.num_finished < len(trace_spans):
-                    finished = []
-                    for s in trace_spans:
-                        if s.finished:
-                            finished.append(s)
-                        else:
-                            trace.spans.append(s)
-
-                else:
-                    finished = trace_spans
-
-                num_finished = len(finished)
-
-                if should_partial_flush:
-                    log.debug("Partially flushing %d spans for trace %d", num_finished, span.trace_id)
-                    finished[0].set_metric("_dd.py.partial_flush", num_finished)
-
-                trace.num_finished -= num_finished
-
-                if len(trace.spans) == 0:
-                    del self._traces[span.trace_id]
-
-                spans = finished  # type: Optional[List[Span]]
-                for tp in self._trace_processors:
-                    try:
-                        if spans is None:
-                            return
-                        spans = tp.process_trace(spans)
-                    except Exception:
-                        log.error("error applying processor %r", tp, exc_info=True)
-
-                self._writer.write(spans)
-                return
-
-            log.debug("trace %d has %d spans, %d finished", span.trace_id, len(trace.spans), trace.num_finished)
+            should_partial_flush = False
+            if self._partial_flush_enabled:
+                if self._partial_flush_min_bytes and trace.num_finished != len(trace.spans):
+                    # Only the spans finished before the trace is complete
+                    # can be partially flushed and need to be accounted for.
+                    trace.size += estimate_span_size(span)
+                should_partial_flush = trace.num_finished >= self._partial_flush_min_spans or (
+                    0 < self._partial_flush_min_bytes <= trace.size
+                )
+            if trace.num_finished != len(trace.spans) and not should_partial_flush:
+                log.debug("trace %d has %d spans, %d finished", span.trace_id, len(trace.spans), trace.num_finished)
+                return None
+
+            trace_spans = trace.spans
+            trace.spans = []
+            if trace.num_finished < len(trace_spans):
+                finished = []
+                for s in trace_spans:
+                    if s.finished:
+                        finished.append(s)
+                    else:
+                        trace.spans.append(s)
+
+            else:
+                finished = trace_spans
+
+            num_finished = len(finished)
+            trace.num_finished -= num_finished
+            # Only unfinished spans are left
+            trace.size = 0
+
+            if len(trace.spans) == 0:
+                del shard.traces[span.trace_id]
+
+            if should_partial_flush:
+                log.debug("Partially flushing %d spans for trace %d", num_finished, span.trace_id)
+                finished[0].set_metric("_dd.py.partial_flush", num_finished)
+
+            # The spans of the partially flushed chunks are still referenced
+            # by the spans of the trace that are not finished yet, so only
+            # complete traces are handed over to the span pool.
+            release = not trace.spans and self._span_pool is not None
+            if trace.flushing:
+                # Written after the chunks being written by another thread
+                if trace.pending is None:
+                    trace.pending = deque()
+                trace.pending.append((finished, release))
+                return None
+            if trace.pending:
+                # Left by a thread that failed to write them
+                trace.pending.append((finished, release))
+                finished, release = trace.pending.popleft()
+            # Unless the trace is complete, other chunks can be queued while
+            # this one is written.
+            trace.flushing = writes_pending = bool(trace.spans or trace.pending)
+
+        if not writes_pending:
+            self._flush(finished, release)
             return None
 
+        try:
+            while True:
+                self._flush(finished, release)
+                with shard.lock:
+                    if not trace.pending:
+                        trace.flushing = False
+                        return None
+                    finished, release = trace.pending.popleft()
+        except BaseException:
+            with shard.lock:
+                trace.flushing = False
+            raise
+
+    def _flush(self, finished, release):
+        # type: (List[Span], bool) -> None
+        # The writer flags the spans it still references once it returns, see
+        # SpanPool.
+        spans = finished  # type: Optional[List[Span]]
+        for tp in self._trace_processors:
+            try:
+                if spans is None:
+                    return
+                spans = tp.process_trace(spans)
+            except Exception:
+                log.error("error applying processor %r", tp, exc_info=True)
+
+        self._writer.write(spans)
+        if release:
+            self._span_pool.release(finished)  # type: ignore[union-attr]
+
     def shutdown(self, timeout):
         # type: (Optional[float]) -> None
         """
@@ -11,12 +11,20 @@ CPU_PERCENT = "runtime.python.cpu.percent"
 CTX_SWITCH_VOLUNTARY = "runtime.python.cpu.ctx_switch.voluntary"
 CTX_SWITCH_INVOLUNTARY = "runtime.python.cpu.ctx_switch.involuntary"
 
+# Only reported when the span pool is enabled
+SPAN_POOL_HITS = "runtime.python.span_pool.hits"
+SPAN_POOL_MISSES = "runtime.python.span_pool.misses"
+SPAN_POOL_REJECTED = "runtime.python.span_pool.rejected"
+SPAN_POOL_HIT_RATE = "runtime.python.span_pool.hit_rate"
+
 GC_RUNTIME_METRICS = set([GC_COUNT_GEN0, GC_COUNT_GEN1, GC_COUNT_GEN2])
 
 PSUTIL_RUNTIME_METRICS = set(
     [THREAD_COUNT, MEM_RSS, CTX_SWITCH_VOLUNTARY, CTX_SWITCH_INVOLUNTARY, CPU_TIME_SYS, CPU_TIME_USER, CPU_PERCENT]
 )
 
+SPAN_POOL_RUNTIME_METRICS = set([SPAN_POOL_HITS, SPAN_POOL_MISSES, SPAN_POOL_REJECTED, SPAN_POOL_HIT_RATE])
+
 DEFAULT_RUNTIME_METRICS = GC_RUNTIME_METRICS | PSUTIL_RUNTIME_METRICS
 
 SERVICE = "service"
@@ -12,6 +12,10 @@ from .constants import GC_COUNT_GEN0
 from .constants import GC_COUNT_GEN1
 from .constants import GC_COUNT_GEN2
 from .constants import MEM_RSS
+from .constants import SPAN_POOL_HITS
+from .constants import SPAN_POOL_HIT_RATE
+from .constants import SPAN_POOL_MISSES
+from .constants import SPAN_POOL_REJECTED
 from .constants import THREAD_COUNT
 
 
@@ -92,3 +96,35 @@ class PSUtilRuntimeMetricCollector(RuntimeMetricCollector):
             ]
 
             return metrics
+
+
+class SpanPoolRuntimeMetricCollector(RuntimeMetricCollector):
+    """Collector for the span pool of the global tracer.
+
+    The counts are the ones since the previous collection. Nothing is
+    collected when the span pool is not enabled.
+    """
+
+    required_modules = ["ddtrace"]
+    stored_value = (0, 0, 0)
+
+    def collect_fn(self, keys):
+        pool = self.modules["ddtrace"].tracer._span_pool
+        if pool is None:
+            return []
+
+        hits_total, misses_total, _, rejected_total = pool.stats()
+        hits = hits_total - self.stored_value[0]
+        misses = misses_total - self.stored_value[1]
+        rejected = rejected_total - self.stored_value[2]
+        self.stored_value = (hits_total, misses_total, rejected_total)
+
+        metrics = [
+            (SPAN_POOL_HITS, hits),
+            (SPAN_POOL_MISSES, misses),
+            (SPAN_POOL_REJECTED, rejected),
+        ]
+        if hits + misses:
+            metrics.append((SPAN_POOL_HIT_RATE, hits / float(hits + misses)))
+
+        return metrics
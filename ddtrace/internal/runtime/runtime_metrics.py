@@ -15,8 +15,10 @@ from ..dogstatsd import get_dogstatsd_client
 from ..logger import get_logger
 from .constants import DEFAULT_RUNTIME_METRICS
 from .constants import DEFAULT_RUNTIME_TAGS
+from .constants import SPAN_POOL_RUNTIME_METRICS
 from .metric_collectors import GCRuntimeMetricCollector
 from .metric_collectors import PSUtilRuntimeMetricCollector
+from .metric_collectors import SpanPoolRuntimeMetricCollector
 from .tag_collectors import PlatformTagCollector
 from .tag_collectors import TracerTagCollector
 
@@ -50,10 +52,11 @@ class RuntimeTags(RuntimeCollectorsIterable):
 
 
 class RuntimeMetrics(RuntimeCollectorsIterable):
-    ENABLED = DEFAULT_RUNTIME_METRICS
+    ENABLED = DEFAULT_RUNTIME_METRICS | SPAN_POOL_RUNTIME_METRICS
     COLLECTORS = [
         GCRuntimeMetricCollector,
         PSUtilRuntimeMetricCollector,
+        SpanPoolRuntimeMetricCollector,
     ]
 
 
@@ -0,0 +1,174 @@
+"""
+Per-thread free lists of finished spans, reused by the tracer to start new
+spans instead of allocating them.
+
+The spans of complete traces are handed over to the pool once they have
+been given to the writer, and the pool owns them from then on: the
+application must not keep references to finished spans when the pool is
+enabled. The writer may still reference them though, e.g. when it encodes
+traces asynchronously, so it flags the spans it still references once
+``write`` returns with ``Span._in_writer`` until it is done encoding them.
+The spans of a chunk are reclaimed together, once the writer released all of
+them. Chunks that are weakly referenced (e.g. by the profiler) are left to
+the garbage collector.
+
+The active span of an execution can outlive its trace, e.g. in the context
+copied by a task that did not start any span. The generation of a span is
+incremented whenever it is reused, and the context providers record it when
+they activate the span, so that a span reused since it was activated is not
+returned as the active span of another trace.
+"""
+from collections import deque
+import threading
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
+from weakref import getweakrefcount
+
+from ddtrace.span import Span
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable
+    from typing import Deque
+    from typing import Iterable
+
+    from ddtrace.context import Context
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class _FreeLists(threading.local):
+    def __init__(self):
+        # type: () -> None
+        self.free = []  # type: List[Span]
+        # Chunks of released spans that have not been checked yet
+        self.pending = deque()  # type: Deque[Tuple[Span, ...]]
+        self.n_pending = 0
+
+
+class SpanPool(object):
+    """Pool of finished spans, with a free list per thread.
+
+    :param max_size: the maximum number of spans kept by each thread, in its
+        free list and waiting to be reclaimed.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        # type: (int) -> None
+        if max_size < 1:
+            raise ValueError("The size of the span pool must be positive")
+        self.max_size = max_size
+        self._lists = _FreeLists()
+
+        # Approximate counters, updated without synchronization
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.rejected = 0
+
+    def new_span(
+        self,
+        name,  # type: str
+        service=None,  # type: Optional[str]
+        resource=None,  # type: Optional[str]
+        span_type=None,  # type: Optional[str]
+        trace_id=None,  # type: Optional[int]
+        span_id=None,  # type: Optional[int]
+        parent_id=None,  # type: Optional[int]
+        start=None,  # type: Optional[int]
+        context=None,  # type: Optional[Context]
+        on_finish=None,  # type: Optional[List[Callable[[Span], None]]]
+    ):
+        # type: (...) -> Span
+        """Return a span started with the given attributes, reused from the
+        free list of the current thread when possible. The arguments are the
+        ones of :class:`ddtrace.Span`."""
+        lists = self._lists
+        if not lists.free and len(lists.pending) > 1:
+            self._reclaim(lists)
+
+        if lists.free:
+            self.hits += 1
+            span = lists.free.pop()
+            span._reuse(name, service, resource, span_type, trace_id, span_id, parent_id, start, context, on_finish)
+            return span
+
+        self.misses += 1
+        return Span(
+            name,
+            service=service,
+            resource=resource,
+            span_type=span_type,
+            trace_id=trace_id,
+            span_id=span_id,
+            parent_id=parent_id,
+            start=start,
+            context=context,
+            on_finish=on_finish,
+        )
+
+    def release(self, spans):
+        # type: (Iterable[Span]) -> None
+        """Hand the spans of a complete trace over to the pool.
+
+        The spans are only reused, on a later call to :meth:`new_span`, once
+        the writer has cleared their ``_in_writer`` flag.
+        """
+        chunk = tuple(spans)
+        if not chunk:
+            return
+
+        lists = self._lists
+        self.released += len(chunk)
+        lists.pending.append(chunk)
+        lists.n_pending += len(chunk)
+        while lists.n_pending > self.max_size:
+            evicted = lists.pending.popleft()
+            lists.n_pending -= len(evicted)
+            self.rejected += len(evicted)
+
+    def _reclaim(self, lists):
+        # type: (_FreeLists) -> None
+        # The most recent chunk is left for the next time, so that the code
+        # that finished the trace can still read its spans until it starts
+        # another one.
+        free = lists.free
+        while len(lists.pending) > 1:
+            chunk = lists.pending[0]
+            if any(span._in_writer for span in chunk):
+                # The writer encodes the chunks in the order they were written
+                break
+            lists.pending.popleft()
+            lists.n_pending -= len(chunk)
+            if any(getweakrefcount(span) for span in chunk) or len(free) + len(chunk) > self.max_size:
+                # Observed elsewhere, e.g. by the profiler, and never reusable
+                self.rejected += len(chunk)
+                continue
+            for span in chunk:
+                self._reset(span)
+            free.extend(chunk)
+
+    @staticmethod
+    def _reset(span):
+        # type: (Span) -> None
+        # Drop everything the span references, so that finished spans do not
+        # keep tag values alive. The tag dictionaries are owned by the span
+        # and kept for reuse, its context may be shared with the application
+        # and is not.
+        span._parent = None
+        span._local_root = None
+        span._store = None
+        span._ignored_exceptions = None
+        span._on_finish_callbacks = None  # type: ignore[assignment]
+        span._context = None
+        if span._meta_dict is not None:
+            span._meta_dict.clear()
+        if span._metrics_dict is not None:
+            span._metrics_dict.clear()
+
+    def stats(self):
+        # type: () -> Tuple[int, int, int, int]
+        """Return the number of hits, misses, released and rejected spans."""
+        return self.hits, self.misses, self.released, self.rejected
@@ -12,7 +12,6 @@ from typing import Union
 from ...internal import atexit
 from ...internal import forksafe
 from ...settings import _config as config
-from ..agent import get_connection
 from ..agent import get_trace_url
 from ..compat import get_connection_response
 from ..compat import httplib
@@ -22,6 +21,7 @@ from ..periodic import PeriodicService
 from ..runtime import get_runtime_id
 from ..service import ServiceStatus
 from ..utils.formats import asbool
+from ..utils.http import ConnectionPool
 from ..utils.time import StopWatch
 from ..utils.version import _pep440_to_semver
 from .constants import TELEMETRY_METRIC_TYPE_COUNT
@@ -58,6 +58,7 @@ class _TelemetryClient:
         # type: (str) -> None
         self._agent_url = get_trace_url()
         self._endpoint = endpoint
+        self._conn_pool = ConnectionPool(self._agent_url)
         self._encoder = JSONEncoderV2()
         self._headers = {
             "Content-Type": "application/json",
@@ -73,23 +74,21 @@ class _TelemetryClient:
         # type: (Dict) -> Optional[httplib.HTTPResponse]
         """Sends a telemetry request to the trace agent"""
         resp = None
-        conn = None
         try:
             rb_json = self._encoder.encode(request)
             headers = self.get_headers(request)
             with StopWatch() as sw:
-                conn = get_connection(self._agent_url)
-                conn.request("POST", self._endpoint, rb_json, headers)
-                resp = get_connection_response(conn)
+                with self._conn_pool.connection() as conn:
+                    conn.request("POST", self._endpoint, rb_json, headers)
+                    resp = get_connection_response(conn)
+                    # Consume the body so that the connection can be reused
+                    resp.read()
             if resp.status < 300:
                 log.debug("sent %d in %.5fs to %s. response: %s", len(rb_json), sw.elapsed(), self.url, resp.status)
             else:
                 log.debug("failed to send telemetry to the Datadog Agent at %s. response: %s", self.url, resp.status)
         except Exception:
             log.debug("failed to send telemetry to the Datadog Agent at %s.", self.url, exc_info=True)
-        finally:
-            if conn is not None:
-                conn.close()
         return resp
 
     def get_headers(self, request):
@@ -366,7 +365,10 @@ class TelemetryLogsMetricsWriter(TelemetryBase):
         self.add_event(payload, TELEMETRY_TYPE_LOGS)
 
     def on_shutdown(self):
-        self.periodic()
+        try:
+            self.periodic()
+        finally:
+            self._client._conn_pool.close()
 
     def reset_queues(self):
         # type: () -> None
@@ -502,7 +504,10 @@ class TelemetryWriter(TelemetryBase):
 
     def on_shutdown(self):
         self._app_closing_event()
-        self.periodic()
+        try:
+            self.periodic()
+        finally:
+            self._client._conn_pool.close()
 
     def reset_queues(self):
         # type: () -> None
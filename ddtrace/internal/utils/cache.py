@@ -1,7 +1,10 @@
+from collections import deque
 from threading import RLock
 from typing import Any
 from typing import Callable
+from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Type
 from typing import TypeVar
 
@@ -9,6 +12,10 @@ from ddtrace.internal.compat import getfullargspec
 from ddtrace.internal.compat import is_not_void_function
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Deque
+
+
 miss = object()
 
 T = TypeVar("T")
@@ -20,15 +27,52 @@ class LFUCache(dict):
     """Simple LFU cache implementation.
 
     This cache is designed for memoizing functions with a single hashable
-    argument. The eviction policy is LFU, i.e. the least frequently used values
-    are evicted when the cache is full. The amortized cost of shrinking the
-    cache when it grows beyond the requested size is O(log(size)).
+    argument. The eviction policy is LFU, i.e. the least frequently used value
+    is evicted when the cache is full, and the least recently added one among
+    those that are used as frequently.
+
+    Keys are kept in buckets of the same access frequency, so that the entry to
+    evict is found in constant time. Frequencies are capped to
+    ``MAX_FREQUENCY``. Cache hits do not take the lock: they only increase the
+    frequency of the entry, and the entry is moved to the matching bucket the
+    next time an eviction looks at it. The number of hits, misses and evictions
+    are tracked for introspection.
     """
 
+    MAX_FREQUENCY = 15
+
     def __init__(self, maxsize=256):
         # type: (int) -> None
         self.maxsize = maxsize
         self.lock = RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Keys by the frequency they had when they were placed, in insertion
+        # order. Index 0 is unused.
+        self._buckets = [deque() for _ in range(self.MAX_FREQUENCY + 1)]  # type: List[Deque[Any]]
+
+    def _evict(self):
+        # type: () -> None
+        buckets = self._buckets
+        frequency = 1
+        bucket = buckets[1]
+        while True:
+            if not bucket:
+                if frequency == self.MAX_FREQUENCY:
+                    return
+                frequency += 1
+                bucket = buckets[frequency]
+                continue
+            key = bucket.popleft()
+            entry_frequency = self[key][1]
+            if entry_frequency > frequency:
+                # The entry was used since it was placed in this bucket
+                buckets[entry_frequency].append(key)
+                continue
+            del self[key]
+            self.evictions += 1
+            return
 
     def get(self, key, f):  # type: ignore[override]
         # type: (T, F) -> Any
@@ -38,29 +82,41 @@ class LFUCache(dict):
         function ``f`` is called on the key to generate it. The return value is
         then stored in the cache and returned to the caller.
         """
-        if len(self) >= self.maxsize:
-            for _, h in zip(range(self.maxsize >> 1), sorted(self, key=lambda h: self[h][1])):
-                del self[h]
-
-        _ = super(LFUCache, self).get(key, miss)
-        if _ is not miss:
-            value, count = _
-            self[key] = (value, count + 1)
-            return value
+        # DEV: dict methods are called directly as they are much cheaper than
+        # going through super()
+        entry = dict.get(self, key, miss)
+        if entry is not miss:
+            if entry[1] < self.MAX_FREQUENCY:
+                entry[1] += 1
+            self.hits += 1
+            return entry[0]
 
         with self.lock:
-            _ = super(LFUCache, self).get(key, miss)
-            if _ is not miss:
-                value, count = _
-                self[key] = (value, count + 1)
-                return value
-
+            entry = dict.get(self, key, miss)
+            if entry is not miss:
+                if entry[1] < self.MAX_FREQUENCY:
+                    entry[1] += 1
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
             value = f(key)
 
-            self[key] = (value, 1)
+            if len(self) >= self.maxsize:
+                self._evict()
+
+            self[key] = [value, 1]
+            self._buckets[1].append(key)
 
             return value
 
+    def clear(self):
+        # type: () -> None
+        with self.lock:
+            super(LFUCache, self).clear()
+            for bucket in self._buckets:
+                bucket.clear()
+
 
 def cached(maxsize=256):
     # type: (int) -> Callable[[F], F]
@@ -75,6 +131,7 @@ def cached(maxsize=256):
             return cache.get(key, f)
 
         cached_f.invalidate = cache.clear  # type: ignore[attr-defined]
+        cached_f.cache = cache  # type: ignore[attr-defined]
 
         return cached_f
 
@@ -1,11 +1,14 @@
 from contextlib import contextmanager
 from json import loads
 import logging
+import os
 import re
+import select
 from typing import Any
 from typing import Callable
 from typing import ContextManager
 from typing import Generator
+from typing import List
 from typing import Optional
 from typing import Pattern
 from typing import Tuple
@@ -15,6 +18,8 @@ import six
 
 from ddtrace.constants import USER_ID_KEY
 from ddtrace.internal import compat
+from ddtrace.internal import forksafe
+from ddtrace.internal.compat import monotonic
 from ddtrace.internal.compat import parse
 from ddtrace.internal.constants import W3C_TRACESTATE_ORIGIN_KEY
 from ddtrace.internal.constants import W3C_TRACESTATE_SAMPLING_PRIORITY_KEY
@@ -32,6 +37,8 @@ _W3C_TRACESTATE_INVALID_CHARS_REGEX_VALUE = re.compile(r",|;|~|[^\x20-\x7E]+")
 _W3C_TRACESTATE_INVALID_CHARS_REGEX_KEY = re.compile(r",| |=|[^\x20-\x7E]+")
 
 DEFAULT_TIMEOUT = 2.0
+DEFAULT_POOL_SIZE = 2
+DEFAULT_POOL_MAX_IDLE_TIME = 30.0
 
 
 Connector = Callable[[], ContextManager[compat.httplib.HTTPConnection]]
@@ -292,6 +299,144 @@ def get_connection(url, timeout=DEFAULT_TIMEOUT):
     raise ValueError("Unsupported protocol '%s'" % parsed.scheme)
 
 
+# select.poll is not available on Windows
+_HAS_POLL = hasattr(select, "poll")
+
+
+def _is_connection_alive(conn):
+    # type: (ConnectionType) -> bool
+    """Check that an idle keep-alive connection can still be used.
+
+    An idle connection has no pending response, so its socket should never be
+    readable. If it is, the peer either closed it or sent unexpected data, and
+    the connection must be discarded.
+    """
+    sock = conn.sock
+    if sock is None:
+        # Not connected yet, or closed by the peer via ``Connection: close``.
+        return False
+    try:
+        if _HAS_POLL:
+            # select.select cannot check file descriptors above FD_SETSIZE
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return not poller.poll(0)
+        readable, _, _ = select.select([sock], [], [], 0)
+    except Exception:
+        # The socket cannot be polled (e.g. it has been closed already)
+        return False
+    return not readable
+
+
+class ConnectionPool(object):
+    """Pool of keep-alive HTTP connections to a single URL.
+
+    Connections are handed out with :meth:`connection` and returned to the
+    pool when the block exits without errors. Idle connections that have been
+    unused for longer than ``max_idle_time`` seconds, or whose socket has been
+    closed by the peer, are discarded instead of being reused. Any URL accepted
+    by :func:`get_connection` is supported, including ``unix://`` sockets.
+
+    Example::
+        >>> pool = ConnectionPool("http://localhost:8126")
+        >>> with pool.connection() as conn:
+        ...     conn.request("PUT", "/v0.4/traces", payload, headers)
+        ...     resp = Response.from_http_response(conn.getresponse())
+
+    The response must be read in full before leaving the block, otherwise the
+    connection cannot be used for the next request.
+    """
+
+    def __init__(
+        self,
+        url,  # type: str
+        timeout=DEFAULT_TIMEOUT,  # type: float
+        maxsize=DEFAULT_POOL_SIZE,  # type: int
+        max_idle_time=DEFAULT_POOL_MAX_IDLE_TIME,  # type: float
+    ):
+        # type: (...) -> None
+        verify_url(url)
+        self.url = url
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.max_idle_time = max_idle_time
+        # Idle connections with the time they were released, most recent last.
+        self._idle = []  # type: List[Tuple[ConnectionType, float]]
+        # Reset in the child process, another thread may hold it when forking
+        self._lock = forksafe.Lock()
+        self._pid = os.getpid()
+
+    def _new_connection(self):
+        # type: () -> ConnectionType
+        log.debug("creating new connection to %s with timeout %d", self.url, self.timeout)
+        return get_connection(self.url, self.timeout)
+
+    def acquire(self):
+        # type: () -> ConnectionType
+        """Return a healthy idle connection, or a new one if none is available."""
+        stale = []  # type: List[ConnectionType]
+        conn = None  # type: Optional[ConnectionType]
+        now = monotonic()
+        with self._lock:
+            pid = os.getpid()
+            if pid != self._pid:
+                # Sockets inherited from the parent process must not be used
+                # by the child.
+                self._pid = pid
+                stale.extend(c for c, _ in self._idle)
+                self._idle = []
+
+            while self._idle and now - self._idle[0][1] > self.max_idle_time:
+                stale.append(self._idle.pop(0)[0])
+
+            while self._idle:
+                candidate, _ = self._idle.pop()
+                if _is_connection_alive(candidate):
+                    conn = candidate
+                    break
+                stale.append(candidate)
+
+        for c in stale:
+            c.close()
+
+        return conn if conn is not None else self._new_connection()
+
+    def release(self, conn, reuse=True):
+        # type: (ConnectionType, bool) -> None
+        """Return a connection to the pool, or close it if it cannot be reused."""
+        if reuse and conn.sock is not None:
+            with self._lock:
+                if self._pid == os.getpid() and len(self._idle) < self.maxsize:
+                    self._idle.append((conn, monotonic()))
+                    return
+        conn.close()
+
+    @contextmanager
+    def connection(self):
+        # type: () -> Generator[ConnectionType, None, None]
+        conn = self.acquire()
+        try:
+            yield conn
+        except BaseException:
+            # The state of the connection is unknown, so never reuse it.
+            self.release(conn, reuse=False)
+            raise
+        else:
+            self.release(conn)
+
+    def close(self):
+        # type: () -> None
+        """Close all the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._idle)
+
+
 def verify_url(url):
     # type: (str) -> parse.ParseResult
     """Validates that the given URL can be used as an intake
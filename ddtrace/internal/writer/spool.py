@@ -0,0 +1,166 @@
+from collections import deque
+import mmap
+import os
+import threading
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
+
+import attr
+
+from ..logger import get_logger
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Deque
+
+
+log = get_logger(__name__)
+
+
+@attr.s(slots=True, frozen=True)
+class SpooledPayload(object):
+    """A payload stored in the spool, along with what is needed to send it again."""
+
+    offset = attr.ib(type=int)
+    size = attr.ib(type=int)
+    n_traces = attr.ib(type=int)
+    endpoint = attr.ib(type=str)
+    content_encoding = attr.ib(type=Optional[str], default=None)
+
+
+class PayloadSpool(object):
+    """Size-capped ring of encoded payloads backed by a memory-mapped file.
+
+    Payloads that could not be uploaded are appended to the ring, and read back
+    oldest first with :meth:`peek` and :meth:`pop` once the intake is
+    reachable again. When the ring is full, the oldest payloads are evicted to
+    make room for the new ones.
+
+    The payloads live in a file mapped in memory, so the kernel can write them
+    out under memory pressure instead of growing the heap of the process. Only
+    the small per-payload metadata is kept in memory. The file is created on
+    the first payload and is removed when the spool is closed. It belongs to the
+    process that created it: a forked child must use a spool of its own.
+    """
+
+    def __init__(
+        self,
+        path,  # type: str
+        max_size,  # type: int
+    ):
+        # type: (...) -> None
+        self.path = path
+        self.max_size = max_size
+        self._payloads = deque()  # type: Deque[SpooledPayload]
+        self._map = None  # type: Optional[mmap.mmap]
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._payloads)
+
+    @property
+    def n_traces(self):
+        # type: () -> int
+        """Number of traces in the spooled payloads."""
+        with self._lock:
+            return sum(p.n_traces for p in self._payloads)
+
+    def _open(self):
+        # type: () -> mmap.mmap
+        if self._map is None:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.ftruncate(fd, self.max_size)
+                self._map = mmap.mmap(fd, self.max_size)
+            finally:
+                # The mapping keeps a reference to the file
+                os.close(fd)
+        return self._map
+
+    def _allocate(self, size):
+        # type: (int) -> Tuple[int, int]
+        """Find room for ``size`` bytes, evicting the oldest payloads if needed.
+
+        Return the offset of the free space and the number of evicted traces.
+        """
+        evicted = 0
+        while self._payloads:
+            head = self._payloads[0].offset
+            last = self._payloads[-1]
+            tail = last.offset + last.size
+            if last.offset >= head:
+                # The payloads are contiguous from head to tail, the free space
+                # is after the tail and before the head.
+                if self.max_size - tail >= size:
+                    return tail, evicted
+                if head >= size:
+                    return 0, evicted
+            elif head - tail >= size:
+                # The payloads wrap around the end of the file, the free space
+                # is between the tail and the head.
+                return tail, evicted
+            evicted += self._payloads.popleft().n_traces
+        return 0, evicted
+
+    def put(
+        self,
+        payload,  # type: bytes
+        n_traces,  # type: int
+        endpoint,  # type: str
+        content_encoding=None,  # type: Optional[str]
+    ):
+        # type: (...) -> Tuple[bool, int]
+        """Append a payload to the spool.
+
+        Return whether the payload was spooled, and the number of traces of the
+        older payloads that were evicted to make room for it.
+        """
+        size = len(payload)
+        if size > self.max_size:
+            return False, 0
+
+        with self._lock:
+            try:
+                m = self._open()
+            except (OSError, IOError, ValueError):
+                log.warning("failed to create the payload spool file %s", self.path, exc_info=True)
+                return False, 0
+            offset, evicted = self._allocate(size)
+            m[offset : offset + size] = payload
+            self._payloads.append(SpooledPayload(offset, size, n_traces, endpoint, content_encoding))
+            return True, evicted
+
+    def peek(self):
+        # type: () -> Optional[Tuple[SpooledPayload, bytes]]
+        """Return the oldest payload without removing it from the spool."""
+        with self._lock:
+            if not self._payloads or self._map is None:
+                return None
+            p = self._payloads[0]
+            return p, self._map[p.offset : p.offset + p.size]
+
+    def pop(self):
+        # type: () -> Optional[SpooledPayload]
+        """Remove the oldest payload from the spool."""
+        with self._lock:
+            return self._payloads.popleft() if self._payloads else None
+
+    def close(self):
+        # type: () -> None
+        """Discard the spooled payloads and remove the spool file."""
+        with self._lock:
+            self._payloads.clear()
+            if self._map is None:
+                return
+            self._map.close()
+            self._map = None
+            if os.getpid() != self._pid:
+                # The file belongs to the parent process
+                return
+            try:
+                os.unlink(self.path)
+            except OSError:
+                log.debug("failed to remove the payload spool file %s", self.path, exc_info=True)
@@ -1,26 +1,28 @@
 import abc
 import binascii
 from collections import defaultdict
+from collections import deque
 import logging
 import os
 import sys
-import threading
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import TextIO
+from typing import Tuple
 
 import six
 import tenacity
 
 import ddtrace
 from ddtrace import config
-from ddtrace.appsec._remoteconfiguration import enable_appsec_rc
 from ddtrace.vendor.dogstatsd import DogStatsd
 
 from .. import agent
 from .. import compat
+from .. import compression
+from .. import forksafe
 from .. import periodic
 from .. import service
 from ...constants import KEEP_SPANS_RATE_KEY
@@ -28,17 +30,20 @@ from ...internal.serverless import in_gcp_function
 from ...internal.telemetry import telemetry_lifecycle_writer
 from ...internal.utils.formats import asbool
 from ...internal.utils.formats import parse_tags_str
+from ...internal.utils.http import ConnectionPool
+from ...internal.utils.http import DEFAULT_POOL_SIZE
 from ...internal.utils.http import Response
 from ...internal.utils.time import StopWatch
 from ...sampler import BasePrioritySampler
 from ...sampler import BaseSampler
 from .._encoding import BufferFull
 from .._encoding import BufferItemTooLarge
-from ..agent import get_connection
+from .._encoding import estimate_span_size
 from ..encoding import JSONEncoderV2
 from ..logger import get_logger
 from ..runtime import container
 from ..sma import SimpleMovingAverage
+from .spool import PayloadSpool
 from .writer_client import AgentWriterClientV3
 from .writer_client import AgentWriterClientV4
 from .writer_client import WRITER_CLIENTS
@@ -46,9 +51,9 @@ from .writer_client import WriterClientBase
 
 
 if TYPE_CHECKING:  # pragma: no cover
-    from ddtrace import Span
+    from typing import Deque
 
-    from .agent import ConnectionType
+    from ddtrace import Span
 
 
 log = get_logger(__name__)
@@ -70,6 +75,60 @@ DEFAULT_BUFFER_SIZE = 8 << 20  # 8 MB
 DEFAULT_MAX_PAYLOAD_SIZE = 8 << 20  # 8 MB
 DEFAULT_PROCESSING_INTERVAL = 1.0
 DEFAULT_REUSE_CONNECTIONS = False
+DEFAULT_ASYNC_ENCODING = False
+# Upper bound on the number of traces waiting to be encoded by the writer
+# thread when asynchronous encoding is enabled. The traces waiting are also
+# limited to the size of the encoder buffer, as estimated before encoding.
+DEFAULT_ASYNC_QUEUE_SIZE = 1 << 14
+DEFAULT_ADAPTIVE_FLUSH = False
+# With adaptive flushing, a flush is triggered as soon as the encoder buffer
+# (or the asynchronous encoding queue) is filled past this fraction.
+FLUSH_HIGH_WATERMARK = 0.5
+# With adaptive flushing, the flush interval is doubled, up to
+# MAX_FLUSH_INTERVAL_BACKOFF times the configured one, while uploads take more
+# than SLOW_FLUSH_RATIO of the interval on average. It is halved back once they
+# take less than FAST_FLUSH_RATIO of it.
+SLOW_FLUSH_RATIO = 0.5
+FAST_FLUSH_RATIO = 0.1
+MAX_FLUSH_INTERVAL_BACKOFF = 8
+# Payload compression is disabled by default. When enabled, only payloads of at
+# least DEFAULT_COMPRESSION_MIN_SIZE bytes are compressed, below that the
+# CPU cost is not worth the bytes saved.
+DEFAULT_COMPRESSION = ""
+DEFAULT_COMPRESSION_MIN_SIZE = 4 << 10  # 4 KB
+# Payloads that fail to upload are dropped unless a spool directory is set
+DEFAULT_SPOOL_SIZE = 64 << 20  # 64 MB
+# Client errors after which the spooled payloads are kept to be sent again,
+# like after server errors. The other client errors drop the payload.
+SPOOL_RETRY_STATUSES = frozenset([408, 429])
+
+
+def _is_spool_retryable(status):
+    # type: (int) -> bool
+    """Return whether a payload that got a response with the given status is
+    spooled, or kept in the spool, to be sent again later."""
+    return status in SPOOL_RETRY_STATUSES or status >= 500
+
+
+def _split_trace(spans, n):
+    # type: (List[Span], int) -> List[List[Span]]
+    """Split a trace in ``n`` chunks of consecutive spans.
+
+    The first span of every chunk gets the trace level tags, as with a partial
+    flush, so that each chunk can be processed on its own by the agent.
+    """
+    # DEV: inline import to avoid a circular import, traces are rarely split
+    from ..processor.trace import TraceTagsProcessor
+
+    size = -(-len(spans) // n)
+    chunks = [spans[i : i + size] for i in range(0, len(spans), size)]
+    tagger = TraceTagsProcessor()
+    keep_rate = spans[0].get_metric(KEEP_SPANS_RATE_KEY)
+    for chunk in chunks[1:]:
+        tagger.process_trace(chunk)
+        if keep_rate is not None:
+            chunk[0].set_metric(KEEP_SPANS_RATE_KEY, keep_rate)
+    return chunks
 
 
 def get_writer_buffer_size():
@@ -92,6 +151,40 @@ def get_writer_reuse_connections():
     return asbool(os.getenv("DD_TRACE_WRITER_REUSE_CONNECTIONS", DEFAULT_REUSE_CONNECTIONS))
 
 
+def get_writer_async_encoding():
+    # type: () -> bool
+    return asbool(os.getenv("DD_TRACE_WRITER_ASYNC_ENCODING", DEFAULT_ASYNC_ENCODING))
+
+
+def get_writer_adaptive_flush():
+    # type: () -> bool
+    return asbool(os.getenv("DD_TRACE_WRITER_ADAPTIVE_FLUSH", DEFAULT_ADAPTIVE_FLUSH))
+
+
+def get_writer_compression():
+    # type: () -> str
+    encoding = os.getenv("DD_TRACE_WRITER_COMPRESSION", default=DEFAULT_COMPRESSION).strip().lower()
+    if encoding and encoding not in compression.COMPRESSORS:
+        log.warning("unsupported payload compression %r, payloads will not be compressed", encoding)
+        return ""
+    return encoding
+
+
+def get_writer_compression_min_size():
+    # type: () -> int
+    return int(os.getenv("DD_TRACE_WRITER_COMPRESSION_MIN_SIZE_BYTES", default=DEFAULT_COMPRESSION_MIN_SIZE))
+
+
+def get_writer_spool_dir():
+    # type: () -> Optional[str]
+    return os.getenv("DD_TRACE_WRITER_SPOOL_DIR") or None
+
+
+def get_writer_spool_size():
+    # type: () -> int
+    return int(os.getenv("DD_TRACE_WRITER_SPOOL_SIZE_BYTES", default=DEFAULT_SPOOL_SIZE))
+
+
 def _human_size(nbytes):
     """Return a human-readable size."""
     i = 0
@@ -166,7 +259,7 @@ class LogWriter(TraceWriter):
         pass
 
 
-class HTTPWriter(periodic.PeriodicService, TraceWriter):
+class HTTPWriter(periodic.NotifiablePeriodicService, TraceWriter):
     """Writer to an arbitrary HTTP intake endpoint."""
 
     RETRY_ATTEMPTS = 3
@@ -189,10 +282,15 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
         sync_mode=False,  # type: bool
         reuse_connections=None,  # type: Optional[bool]
         headers=None,  # type: Optional[Dict[str, str]]
+        async_encoding=None,  # type: Optional[bool]
+        adaptive_flush=None,  # type: Optional[bool]
+        compression=None,  # type: Optional[str]
+        spool_dir=None,  # type: Optional[str]
     ):
         # type: (...) -> None
 
         super(HTTPWriter, self).__init__(interval=processing_interval)
+        self._base_interval = processing_interval
         self.intake_url = intake_url
         self._buffer_size = buffer_size
         self._max_payload_size = max_payload_size
@@ -206,11 +304,6 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
         self._metrics_reset()
         self._drop_sma = SimpleMovingAverage(DEFAULT_SMA_WINDOW)
         self._sync_mode = sync_mode
-        self._conn = None  # type: Optional[ConnectionType]
-        # The connection has to be locked since there exists a race between
-        # the periodic thread of HTTPWriter and other threads that might
-        # force a flush with `flush_queue()`.
-        self._conn_lck = threading.RLock()  # type: threading.RLock
         self._retry_upload = tenacity.Retrying(
             # Retry RETRY_ATTEMPTS times within the first half of the processing
             # interval, using a Fibonacci policy with jitter
@@ -223,6 +316,41 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
         )
         self._log_error_payloads = asbool(os.environ.get("_DD_TRACE_WRITER_LOG_ERROR_PAYLOADS", False))
         self._reuse_connections = get_writer_reuse_connections() if reuse_connections is None else reuse_connections
+        # Concurrent flushes (e.g. the periodic thread and an explicit
+        # ``flush_queue()``) each get their own connection from the pool. When
+        # connections are not reused the pool does not keep any idle one.
+        self._conn_pool = ConnectionPool(
+            self.intake_url, self._timeout, maxsize=DEFAULT_POOL_SIZE if self._reuse_connections else 0
+        )
+        # When asynchronous encoding is enabled, ``write`` only hands the trace
+        # over to the writer thread through this queue. Appending to and
+        # popping from a deque are atomic, so application threads never wait
+        # on the encoder or on the connection lock.
+        self._async_encoding = get_writer_async_encoding() if async_encoding is None else async_encoding
+        self._pending = deque()  # type: Deque[Tuple[List[Span], int]]
+        self._pending_max_size = DEFAULT_ASYNC_QUEUE_SIZE
+        # Estimated size in bytes of the traces in the queue. The lock only
+        # guards this counter and is never held while encoding.
+        self._pending_bytes = 0
+        self._pending_max_bytes = buffer_size or get_writer_buffer_size()
+        self._pending_lock = forksafe.Lock()
+        self._adaptive_flush = get_writer_adaptive_flush() if adaptive_flush is None else adaptive_flush
+        self._flush_time_sma = SimpleMovingAverage(DEFAULT_SMA_WINDOW)
+        # Payloads are only compressed for the clients whose endpoint accepts
+        # the configured content encoding.
+        self._compression = get_writer_compression() if compression is None else compression
+        self._compression_min_size = get_writer_compression_min_size()
+        # Payloads that cannot be uploaded after all the retries are kept in
+        # the spool, if enabled, and sent again once an upload succeeds.
+        self._spool_dir = get_writer_spool_dir() if spool_dir is None else spool_dir
+        self._spool = (
+            PayloadSpool(
+                os.path.join(self._spool_dir, "ddtrace-%d-%x.spool" % (os.getpid(), id(self))), get_writer_spool_size()
+            )
+            if self._spool_dir
+            else None
+        )  # type: Optional[PayloadSpool]
+        self._spool_lock = forksafe.Lock()
 
     @property
     def _intake_endpoint(self):
@@ -269,45 +397,30 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
 
     def _reset_connection(self):
         # type: () -> None
-        with self._conn_lck:
-            if self._conn:
-                self._conn.close()
-                self._conn = None
+        self._conn_pool.close()
 
     def _put(self, data, headers, client):
         # type: (bytes, Dict[str, str], WriterClientBase) -> Response
         sw = StopWatch()
         sw.start()
-        with self._conn_lck:
-            if self._conn is None:
-                log.debug("creating new intake connection to %s with timeout %d", self.intake_url, self._timeout)
-                self._conn = get_connection(self.intake_url, self._timeout)
-            try:
-                log.debug("Sending request: %s %s %s %s", self.HTTP_METHOD, client.ENDPOINT, data, headers)
-                self._conn.request(
-                    self.HTTP_METHOD,
-                    client.ENDPOINT,
-                    data,
-                    headers,
-                )
-                resp = compat.get_connection_response(self._conn)
-                log.debug("Got response: %s %s", resp.status, resp.reason)
-                t = sw.elapsed()
-                if t >= self.interval:
-                    log_level = logging.WARNING
-                else:
-                    log_level = logging.DEBUG
-                log.log(log_level, "sent %s in %.5fs to %s", _human_size(len(data)), t, self._intake_endpoint)
-            except Exception:
-                # Always reset the connection when an exception occurs
-                self._reset_connection()
-                raise
+        with self._conn_pool.connection() as conn:
+            log.debug("Sending request: %s %s %s %s", self.HTTP_METHOD, client.ENDPOINT, data, headers)
+            conn.request(
+                self.HTTP_METHOD,
+                client.ENDPOINT,
+                data,
+                headers,
+            )
+            resp = compat.get_connection_response(conn)
+            log.debug("Got response: %s %s", resp.status, resp.reason)
+            t = sw.elapsed()
+            if t >= self.interval:
+                log_level = logging.WARNING
             else:
-                return Response.from_http_response(resp)
-            finally:
-                # Reset the connection if reusing connections is disabled.
-                if not self._reuse_connections:
-                    self._reset_connection()
+                log_level = logging.DEBUG
+            log.log(log_level, "sent %s in %.5fs to %s", _human_size(len(data)), t, self._intake_endpoint)
+            # Read the whole response before the connection goes back to the pool
+            return Response.from_http_response(resp)
 
     def _get_finalized_headers(self, count, client):
         # type: (int, WriterClientBase) -> dict
@@ -315,8 +428,29 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
         headers.update({"Content-Type": client.encoder.content_type})  # type: ignore[attr-defined]
         return headers
 
-    def _send_payload(self, payload, count, client):
+    def _compress_payload(self, payload, client):
+        # type: (bytes, WriterClientBase) -> Tuple[bytes, Optional[str]]
+        """Compress the payload if the endpoint of the client supports it.
+
+        Return the payload to send along with its content encoding, if any.
+        """
+        encoding = self._compression
+        if not encoding or encoding not in client.CONTENT_ENCODINGS or len(payload) < self._compression_min_size:
+            return payload, None
+
+        try:
+            compressed = compression.COMPRESSORS[encoding](payload)
+        except Exception:
+            log.warning("failed to compress payload with %s, sending it uncompressed", encoding, exc_info=True)
+            return payload, None
+
+        self._metrics_dist("http.compression.saved.bytes", len(payload) - len(compressed))
+        return compressed, encoding
+
+    def _send_payload(self, payload, count, client, content_encoding=None):
         headers = self._get_finalized_headers(count, client)
+        if content_encoding is not None:
+            headers["Content-Encoding"] = content_encoding
 
         self._metrics_dist("http.requests")
 
@@ -328,6 +462,9 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             self._metrics_dist("http.sent.bytes", len(payload))
 
         if response.status not in (404, 415) and response.status >= 400:
+            if self._spool is not None and _is_spool_retryable(response.status):
+                # The caller spools the payload, or keeps it in the spool
+                return response
             msg = "failed to send traces to intake at %s: HTTP error status %s, reason %s"
             log_args = (
                 self._intake_endpoint,
@@ -349,13 +486,6 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
         return response
 
     def write(self, spans=None):
-        for client in self._clients:
-            self._write_with_client(client, spans=spans)
-        if self._sync_mode:
-            self.flush_queue()
-
-    def _write_with_client(self, client, spans=None):
-        # type: (WriterClientBase, Optional[List[Span]]) -> None
         if spans is None:
             return
 
@@ -368,13 +498,158 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             except service.ServiceStatusError:
                 pass
 
+            if self._async_encoding:
+                self._enqueue(spans)
+                return
+
+        for client in self._clients:
+            self._write_with_client(client, spans=spans)
+            if self._adaptive_flush and not self._sync_mode and self._above_high_watermark(client):
+                self._request_early_flush()
+        if self._sync_mode:
+            self.flush_queue()
+
+    def _enqueue(self, spans):
+        # type: (List[Span]) -> None
+        size = sum(estimate_span_size(span) for span in spans)
+        # The spans are flagged before the writer thread can encode them
+        self._hold_spans(spans)
+        with self._pending_lock:
+            full = (
+                len(self._pending) >= self._pending_max_size
+                # A trace larger than the limit is accepted in an empty queue
+                or (len(self._pending) > 0 and self._pending_bytes + size > self._pending_max_bytes)
+            )
+            if not full:
+                self._pending.append((spans, size))
+                self._pending_bytes += size
+                above_high_watermark = (
+                    len(self._pending) >= self._pending_max_size * FLUSH_HIGH_WATERMARK
+                    or self._pending_bytes >= self._pending_max_bytes * FLUSH_HIGH_WATERMARK
+                )
+        if full:
+            n_clients = len(self._clients)
+            self._metrics_dist("writer.accepted.traces", n_clients)
+            self._metrics_dist("buffer.dropped.traces", n_clients, tags=["reason:full"])
+            self._metrics_dist("buffer.dropped.bytes", size * n_clients, tags=["reason:full"])
+            self._release_spans(spans)
+            return
+        if self._adaptive_flush and above_high_watermark:
+            self._request_early_flush()
+
+    @staticmethod
+    def _above_high_watermark(client):
+        # type: (WriterClientBase) -> bool
+        encoder = client.encoder
+        return encoder.size >= encoder.max_size * FLUSH_HIGH_WATERMARK
+
+    def _request_early_flush(self):
+        # type: () -> None
+        worker = self._worker
+        # Only notify the writer thread once until it wakes up
+        if worker is not None and not worker.notified.is_set():
+            self._metrics_dist("writer.flush.early", tags=["reason:high_watermark"])
+            self.notify()
+
+    def _adjust_interval(self, flush_time):
+        # type: (float) -> None
+        """Back off the flush interval while the intake is slow to respond."""
+        interval = self.interval
+        self._flush_time_sma.set(min(flush_time, interval), interval)
+        ratio = self._flush_time_sma.get()
+        max_interval = self._base_interval * MAX_FLUSH_INTERVAL_BACKOFF
+        if ratio > SLOW_FLUSH_RATIO and interval < max_interval:
+            self.interval = min(interval * 2, max_interval)
+            self._metrics_dist("writer.flush.backoff")
+            log.debug("intake %s is slow to respond, flush interval set to %.3fs", self.intake_url, self.interval)
+        elif ratio < FAST_FLUSH_RATIO and interval > self._base_interval:
+            self.interval = max(interval / 2, self._base_interval)
+            self._metrics_dist("writer.flush.recover")
+            log.debug("flush interval set back to %.3fs", self.interval)
+
+    def _drain_pending(self):
+        # type: () -> None
+        """Encode the traces handed over by ``write`` in asynchronous mode.
+
+        This is normally called from the writer thread. Concurrent callers
+        (e.g. an explicit ``flush_queue``) are safe since each trace is popped
+        exactly once.
+
+        The queue can hold more traces than the encoder buffer, so the buffer
+        is flushed whenever it is full rather than dropping the rest of the
+        queue.
+        """
+        pending = self._pending
+        while True:
+            with self._pending_lock:
+                try:
+                    spans, size = pending.popleft()
+                except IndexError:
+                    return
+                self._pending_bytes -= size
+            for client in self._clients:
+                self._write_with_client(client, spans=spans, flush_when_full=True)
+                if self._adaptive_flush and self._above_high_watermark(client):
+                    # We are already flushing, so make room for the rest of
+                    # the queue straight away.
+                    self._flush_early(client, "high_watermark")
+            self._release_spans(spans)
+
+    def _hold_spans(self, spans):
+        # type: (List[Span]) -> None
+        """Flag the spans of a trace that are still referenced once ``write`` returns.
+
+        The span pool does not reuse them until they are released with
+        :meth:`_release_spans`. The spans written synchronously are encoded
+        before ``write`` returns and are never flagged.
+        """
+        for span in spans:
+            span._in_writer = True
+
+    def _release_spans(self, spans):
+        # type: (List[Span]) -> None
+        """Hand the spans of a trace back once all the clients encoded them."""
+        for span in spans:
+            span._in_writer = False
+
+    def _flush_early(self, client, reason):
+        # type: (WriterClientBase, str) -> None
+        self._metrics_dist("writer.flush.early", tags=["reason:%s" % reason])
+        try:
+            self._flush_queue_with_client(client)
+        finally:
+            # The metrics collected so far have been reported
+            self._set_drop_rate()
+            self._metrics_reset()
+
+    def _write_with_client(self, client, spans=None, flush_when_full=False):
+        # type: (WriterClientBase, Optional[List[Span]], bool) -> None
+        if spans is None:
+            return
+
         self._metrics_dist("writer.accepted.traces")
         self._set_keep_rate(spans)
+        self._put_with_client(client, spans, flush_when_full)
 
+    def _put_with_client(self, client, spans, flush_when_full=False):
+        # type: (WriterClientBase, List[Span], bool) -> None
         try:
             client.encoder.put(spans)
         except BufferItemTooLarge as e:
             payload_size = e.args[0]
+            if len(spans) > 1:
+                # Send the trace in smaller chunks rather than dropping it.
+                # The size is only a lower bound when the encoder gave up
+                # packing the trace, chunks that are still too large are
+                # split again.
+                n = min(len(spans), max(2, -(-2 * payload_size // client.encoder.max_item_size)))
+                log.debug(
+                    "trace (%db) larger than payload buffer item limit, splitting it in %d chunks", payload_size, n
+                )
+                self._metrics_dist("buffer.split.traces", 1)
+                for chunk in _split_trace(spans, n):
+                    self._put_with_client(client, chunk, flush_when_full)
+                return
             log.warning(
                 "trace (%db) larger than payload buffer item limit (%db), dropping",
                 payload_size,
@@ -383,6 +658,11 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             self._metrics_dist("buffer.dropped.traces", 1, tags=["reason:t_too_big"])
             self._metrics_dist("buffer.dropped.bytes", payload_size, tags=["reason:t_too_big"])
         except BufferFull as e:
+            if flush_when_full and len(client.encoder):
+                # Make room for the trace, which fits in an empty buffer
+                self._flush_early(client, "full")
+                self._put_with_client(client, spans)
+                return
             payload_size = e.args[0]
             log.warning(
                 "trace buffer (%s traces %db/%db) cannot fit trace of size %db, dropping (writer status: %s)",
@@ -401,7 +681,11 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             self._metrics_dist("buffer.accepted.spans", len(spans))
 
     def flush_queue(self, raise_exc=False):
+        self._drain_pending()
         try:
+            if self._spool is not None and len(self._spool):
+                # Send the payloads spooled during an outage before the new ones
+                self._replay_spool()
             for client in self._clients:
                 self._flush_queue_with_client(client, raise_exc=raise_exc)
         finally:
@@ -420,23 +704,47 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             self._metrics_dist("encoder.dropped.traces", n_traces)
             return
 
+        # Compress once, retries send the same payload
+        payload, content_encoding = self._compress_payload(encoded, client)
+
+        sw = StopWatch()
+        sw.start()
         try:
-            self._retry_upload(self._send_payload, encoded, n_traces, client)
+            response = self._retry_upload(self._send_payload, payload, n_traces, client, content_encoding)
         except tenacity.RetryError as e:
             self._metrics_dist("http.errors", tags=["type:err"])
-            self._metrics_dist("http.dropped.bytes", len(encoded))
-            self._metrics_dist("http.dropped.traces", n_traces)
+            spooled = self._spool_payload(payload, n_traces, client, content_encoding)
+            if not spooled:
+                self._metrics_dist("http.dropped.bytes", len(payload))
+                self._metrics_dist("http.dropped.traces", n_traces)
             if raise_exc:
                 e.reraise()
             else:
                 log.error(
-                    "failed to send, dropping %d traces to intake at %s after %d retries (%s)",
+                    "failed to send, %s %d traces to intake at %s after %d retries (%s)",
+                    "spooling" if spooled else "dropping",
                     n_traces,
                     self._intake_endpoint,
                     e.last_attempt.attempt_number,
                     e.last_attempt.exception(),
                 )
+        else:
+            if self._spool is not None and _is_spool_retryable(response.status):
+                spooled = self._spool_payload(payload, n_traces, client, content_encoding)
+                if not spooled:
+                    self._metrics_dist("http.dropped.bytes", len(payload))
+                    self._metrics_dist("http.dropped.traces", n_traces)
+                log.error(
+                    "failed to send, %s %d traces to intake at %s: HTTP error status %s, reason %s",
+                    "spooling" if spooled else "dropping",
+                    n_traces,
+                    self._intake_endpoint,
+                    response.status,
+                    response.reason,
+                )
         finally:
+            if self._adaptive_flush:
+                self._adjust_interval(sw.elapsed())
             if config.health_metrics_enabled and self.dogstatsd:
                 namespace = self.STATSD_NAMESPACE
                 # Note that we cannot use the batching functionality of dogstatsd because
@@ -450,6 +758,53 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
                         "datadog.%s.%s" % (namespace, name), metric["count"], tags=metric["tags"]
                     )
 
+    def _spool_payload(self, payload, n_traces, client, content_encoding=None):
+        # type: (bytes, int, WriterClientBase, Optional[str]) -> bool
+        if self._spool is None:
+            return False
+
+        spooled, evicted = self._spool.put(payload, n_traces, client.ENDPOINT, content_encoding)
+        if spooled:
+            self._metrics_dist("spool.accepted.traces", n_traces)
+        if evicted:
+            self._metrics_dist("http.dropped.traces", evicted, tags=["reason:spool_full"])
+        return spooled
+
+    def _replay_spool(self):
+        # type: () -> None
+        """Send the spooled payloads, oldest first, until one fails to upload."""
+        # Concurrent flushes must not send the same payload twice
+        with self._spool_lock:
+            while True:
+                spooled = self._spool.peek()  # type: ignore[union-attr]
+                if spooled is None:
+                    return
+                p, payload = spooled
+
+                # The endpoint might not be available anymore, e.g. after an API downgrade
+                for client in self._clients:
+                    if client.ENDPOINT == p.endpoint:
+                        break
+                else:
+                    self._spool.pop()  # type: ignore[union-attr]
+                    self._metrics_dist("http.dropped.traces", p.n_traces, tags=["reason:spool_endpoint"])
+                    continue
+
+                try:
+                    response = self._send_payload(payload, p.n_traces, client, p.content_encoding)
+                except (compat.httplib.HTTPException, OSError, IOError):
+                    log.debug("failed to send spooled payload to intake at %s", self._intake_endpoint, exc_info=True)
+                    return
+                if _is_spool_retryable(response.status):
+                    # The intake is not ready yet, keep the payload for the next flush
+                    return
+                self._spool.pop()  # type: ignore[union-attr]
+                if response.status >= 400 and response.status not in (404, 415):
+                    # The intake will never accept this payload
+                    self._metrics_dist("http.dropped.traces", p.n_traces, tags=["reason:spool_rejected"])
+                else:
+                    self._metrics_dist("spool.sent.traces", p.n_traces)
+
     def periodic(self):
         self.flush_queue(raise_exc=False)
 
@@ -467,6 +822,14 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             self.periodic()
         finally:
             self._reset_connection()
+            if self._spool is not None:
+                if len(self._spool):
+                    log.warning(
+                        "dropping %d spooled traces that could not be sent to intake at %s",
+                        self._spool.n_traces,
+                        self._intake_endpoint,
+                    )
+                self._spool.close()
 
 
 class AgentWriter(HTTPWriter):
@@ -498,6 +861,10 @@ class AgentWriter(HTTPWriter):
         api_version=None,  # type: Optional[str]
         reuse_connections=None,  # type: Optional[bool]
         headers=None,  # type: Optional[Dict[str, str]]
+        async_encoding=None,  # type: Optional[bool]
+        adaptive_flush=None,  # type: Optional[bool]
+        compression=None,  # type: Optional[str]
+        spool_dir=None,  # type: Optional[str]
     ):
         # type: (...) -> None
         if buffer_size is not None and buffer_size <= 0:
@@ -567,6 +934,10 @@ class AgentWriter(HTTPWriter):
             sync_mode=sync_mode,
             reuse_connections=reuse_connections,
             headers=_headers,
+            async_encoding=async_encoding,
+            adaptive_flush=adaptive_flush,
+            compression=compression,
+            spool_dir=spool_dir,
         )
 
     def recreate(self):
@@ -575,13 +946,17 @@ class AgentWriter(HTTPWriter):
             agent_url=self.agent_url,
             sampler=self._sampler,
             priority_sampler=self._priority_sampler,
-            processing_interval=self._interval,
+            processing_interval=self._base_interval,
             buffer_size=self._buffer_size,
             max_payload_size=self._max_payload_size,
             timeout=self._timeout,
             dogstatsd=self.dogstatsd,
             sync_mode=self._sync_mode,
             api_version=self._api_version,
+            async_encoding=self._async_encoding,
+            adaptive_flush=self._adaptive_flush,
+            compression=self._compression,
+            spool_dir=self._spool_dir,
         )
 
     @property
@@ -611,8 +986,8 @@ class AgentWriter(HTTPWriter):
             return payload
         raise ValueError()
 
-    def _send_payload(self, payload, count, client):
-        response = super(AgentWriter, self)._send_payload(payload, count, client)
+    def _send_payload(self, payload, count, client, content_encoding=None):
+        response = super(AgentWriter, self)._send_payload(payload, count, client, content_encoding)
         if response.status in [404, 415]:
             log.debug("calling endpoint '%s' but received %s; downgrading API", client.ENDPOINT, response.status)
             try:
@@ -626,7 +1001,7 @@ class AgentWriter(HTTPWriter):
                 )
             else:
                 if payload is not None:
-                    self._send_payload(payload, count, client)
+                    self._send_payload(payload, count, client, content_encoding)
         elif response.status < 400 and (self._priority_sampler or isinstance(self._sampler, BasePrioritySampler)):
             result_traces_json = response.get_json()
             if result_traces_json and "rate_by_service" in result_traces_json:
@@ -641,6 +1016,7 @@ class AgentWriter(HTTPWriter):
                         )
                 except ValueError:
                     log.error("sample_rate is negative, cannot update the rate samplers")
+        return response
 
     def start(self):
         super(AgentWriter, self).start()
@@ -648,7 +1024,10 @@ class AgentWriter(HTTPWriter):
             telemetry_lifecycle_writer.enable()
 
             # appsec remote config should be enabled/started after the global tracer and configs
-            # are initialized
+            # are initialized. It is imported here to keep the remote config client out of the
+            # import of ddtrace.
+            from ddtrace.appsec._remoteconfiguration import enable_appsec_rc
+
             enable_appsec_rc()
         except service.ServiceStatusError:
             pass
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 from .._encoding import BufferedEncoder
 from ..encoding import MSGPACK_ENCODERS
 
@@ -6,6 +8,8 @@ class WriterClientBase(object):
     """A class encapsulating an endpoint/encoder pair that a TraceWriter can send payloads to"""
 
     ENDPOINT = ""
+    # Content encodings (e.g. "gzip") that the endpoint accepts for the payloads
+    CONTENT_ENCODINGS = ()  # type: Tuple[str, ...]
 
     def __init__(
         self,
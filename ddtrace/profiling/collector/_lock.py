@@ -3,15 +3,17 @@ from __future__ import absolute_import
 import abc
 import os.path
 import sys
+import types
 import typing
 
 import attr
 from six.moves import _thread
+from six.moves import intern
 
-from ddtrace.internal import compat
 from ddtrace.profiling import _threading
 from ddtrace.profiling import collector
 from ddtrace.profiling import event
+from ddtrace.profiling.collector import _profiled_lock
 from ddtrace.profiling.collector import _task
 from ddtrace.profiling.collector import _traceback
 from ddtrace.settings.profiling import config
@@ -40,6 +42,16 @@ class LockReleaseEvent(LockEventBase):
     locked_for_ns = attr.ib(default=0, type=int)
 
 
+@event.event_class
+class LockSiteEvent(LockEventBase):
+    """The captured acquires of a lock at an acquisition site."""
+
+    acquire_count = attr.ib(default=0, type=int)
+    wait_time_ns = attr.ib(default=0, type=int)
+    release_count = attr.ib(default=0, type=int)
+    locked_for_ns = attr.ib(default=0, type=int)
+
+
 def _current_thread():
     # type: (...) -> typing.Tuple[int, str]
     thread_id = _thread.get_ident()
@@ -60,112 +72,6 @@ else:
         del _w
 
 
-class _ProfiledLock(wrapt.ObjectProxy):
-
-    ACQUIRE_EVENT_CLASS = LockAcquireEvent
-    RELEASE_EVENT_CLASS = LockReleaseEvent
-
-    def __init__(self, wrapped, recorder, tracer, max_nframes, capture_sampler, endpoint_collection_enabled):
-        wrapt.ObjectProxy.__init__(self, wrapped)
-        self._self_recorder = recorder
-        self._self_tracer = tracer
-        self._self_max_nframes = max_nframes
-        self._self_capture_sampler = capture_sampler
-        self._self_endpoint_collection_enabled = endpoint_collection_enabled
-        frame = sys._getframe(2 if WRAPT_C_EXT else 3)
-        code = frame.f_code
-        self._self_name = "%s:%d" % (os.path.basename(code.co_filename), frame.f_lineno)
-
-    def __aenter__(self):
-        return self.__wrapped__.__aenter__()
-
-    def __aexit__(self, *args, **kwargs):
-        return self.__wrapped__.__aexit__(*args, **kwargs)
-
-    def acquire(self, *args, **kwargs):
-        if not self._self_capture_sampler.capture():
-            return self.__wrapped__.acquire(*args, **kwargs)
-
-        start = compat.monotonic_ns()
-        try:
-            return self.__wrapped__.acquire(*args, **kwargs)
-        finally:
-            try:
-                end = self._self_acquired_at = compat.monotonic_ns()
-                thread_id, thread_name = _current_thread()
-                task_id, task_name, task_frame = _task.get_task(thread_id)
-
-                if task_frame is None:
-                    frame = sys._getframe(1)
-                else:
-                    frame = task_frame
-
-                frames, nframes = _traceback.pyframe_to_frames(frame, self._self_max_nframes)
-
-                event = self.ACQUIRE_EVENT_CLASS(
-                    lock_name=self._self_name,
-                    frames=frames,
-                    nframes=nframes,
-                    thread_id=thread_id,
-                    thread_name=thread_name,
-                    task_id=task_id,
-                    task_name=task_name,
-                    wait_time_ns=end - start,
-                    sampling_pct=self._self_capture_sampler.capture_pct,
-                )
-
-                if self._self_tracer is not None:
-                    event.set_trace_info(self._self_tracer.current_span(), self._self_endpoint_collection_enabled)
-
-                self._self_recorder.push_event(event)
-            except Exception:
-                pass
-
-    def release(self, *args, **kwargs):
-        # type (typing.Any, typing.Any) -> None
-        try:
-            return self.__wrapped__.release(*args, **kwargs)
-        finally:
-            try:
-                if hasattr(self, "_self_acquired_at"):
-                    try:
-                        end = compat.monotonic_ns()
-                        thread_id, thread_name = _current_thread()
-                        task_id, task_name, task_frame = _task.get_task(thread_id)
-
-                        if task_frame is None:
-                            frame = sys._getframe(1)
-                        else:
-                            frame = task_frame
-
-                        frames, nframes = _traceback.pyframe_to_frames(frame, self._self_max_nframes)
-
-                        event = self.RELEASE_EVENT_CLASS(
-                            lock_name=self._self_name,
-                            frames=frames,
-                            nframes=nframes,
-                            thread_id=thread_id,
-                            thread_name=thread_name,
-                            task_id=task_id,
-                            task_name=task_name,
-                            locked_for_ns=end - self._self_acquired_at,
-                            sampling_pct=self._self_capture_sampler.capture_pct,
-                        )
-
-                        if self._self_tracer is not None:
-                            event.set_trace_info(
-                                self._self_tracer.current_span(), self._self_endpoint_collection_enabled
-                            )
-
-                        self._self_recorder.push_event(event)
-                    finally:
-                        del self._self_acquired_at
-            except Exception:
-                pass
-
-    acquire_lock = acquire
-
-
 class FunctionWrapper(wrapt.FunctionWrapper):
     # Override the __get__ method: whatever happens, _allocate_lock is always considered by Python like a "static"
     # method, even when used as a class attribute. Python never tried to "bind" it to a method, because it sees it is a
@@ -178,12 +84,19 @@ class FunctionWrapper(wrapt.FunctionWrapper):
 class LockCollector(collector.CaptureSamplerCollector):
     """Record lock usage."""
 
+    PROFILED_LOCK_CLASS = _profiled_lock.ProfiledLock
+    ACQUIRE_EVENT_CLASS = LockAcquireEvent
+    RELEASE_EVENT_CLASS = LockReleaseEvent
+
     nframes = attr.ib(type=int, default=config.max_frames)
     endpoint_collection_enabled = attr.ib(type=bool, default=config.endpoint_collection)
 
     tracer = attr.ib(default=None)
 
+    aggregate = attr.ib(type=bool, default=config.lock.aggregation)
+
     _original = attr.ib(init=False, repr=False, type=typing.Any, cmp=False)
+    _profiler = attr.ib(init=False, repr=False, default=None, cmp=False)
 
     @abc.abstractmethod
     def _get_original(self):
@@ -209,6 +122,78 @@ class LockCollector(collector.CaptureSamplerCollector):
         super(LockCollector, self)._stop_service()
         self.unpatch()
 
+    def _push_event(
+        self,
+        event_class,  # type: typing.Type[LockEventBase]
+        lock_name,  # type: str
+        frame,  # type: typing.Optional[types.FrameType]
+        **kwargs  # type: typing.Any
+    ):
+        # type: (...) -> None
+        thread_id, thread_name = _current_thread()
+        task_id, task_name, task_frame = _task.get_task(thread_id)
+
+        if task_frame is not None:
+            frame = task_frame
+
+        frames, nframes = _traceback.pyframe_to_frames(frame, self.nframes)
+
+        event = event_class(
+            lock_name=lock_name,
+            frames=frames,
+            nframes=nframes,
+            thread_id=thread_id,
+            thread_name=thread_name,
+            task_id=task_id,
+            task_name=task_name,
+            sampling_pct=self.capture_pct,
+            **kwargs
+        )
+
+        if self.tracer is not None:
+            event.set_trace_info(self.tracer.current_span(), self.endpoint_collection_enabled)
+
+        self.recorder.push_event(event)
+
+    def _acquired(
+        self,
+        lock_name,  # type: str
+        frame,  # type: typing.Optional[types.FrameType]
+        wait_time_ns,  # type: int
+    ):
+        # type: (...) -> None
+        self._push_event(self.ACQUIRE_EVENT_CLASS, lock_name, frame, wait_time_ns=wait_time_ns)
+
+    def _released(
+        self,
+        lock_name,  # type: str
+        frame,  # type: typing.Optional[types.FrameType]
+        locked_for_ns,  # type: int
+    ):
+        # type: (...) -> None
+        self._push_event(self.RELEASE_EVENT_CLASS, lock_name, frame, locked_for_ns=locked_for_ns)
+
+    def snapshot(self):
+        # type: (...) -> typing.Optional[typing.List[typing.List[LockSiteEvent]]]
+        """Return the lock usage aggregated by acquisition site since the last snapshot."""
+        if self._profiler is None or not self._profiler.aggregate:
+            return None
+        return [
+            [
+                LockSiteEvent(
+                    lock_name=site.lock_name,
+                    frames=site.frames,
+                    nframes=site.nframes,
+                    sampling_pct=self.capture_pct,
+                    acquire_count=site.acquire_count,
+                    wait_time_ns=site.wait_time_ns,
+                    release_count=site.release_count,
+                    locked_for_ns=site.locked_for_ns,
+                )
+                for site in self._profiler.collect()
+            ]
+        ]
+
     def patch(self):
         # type: (...) -> None
         """Patch the module for tracking lock allocation."""
@@ -216,11 +201,19 @@ class LockCollector(collector.CaptureSamplerCollector):
         # Nobody should use locks from `_thread`; if they do so, then it's deliberate and we don't profile.
         self.original = self._get_original()
 
+        if self.aggregate:
+            profiler = _profiled_lock.LockProfiler(self.capture_pct, self.nframes)
+        else:
+            profiler = _profiled_lock.LockProfiler(self.capture_pct, self.nframes, self._acquired, self._released)
+        self._profiler = profiler
+        profiled_lock_class = self.PROFILED_LOCK_CLASS
+
         def _allocate_lock(wrapped, instance, args, kwargs):
             lock = wrapped(*args, **kwargs)
-            return self.PROFILED_LOCK_CLASS(
-                lock, self.recorder, self.tracer, self.nframes, self._capture_sampler, self.endpoint_collection_enabled
-            )
+            frame = sys._getframe(1 if WRAPT_C_EXT else 2)
+            code = frame.f_code
+            name = intern("%s:%d" % (os.path.basename(code.co_filename), frame.f_lineno))
+            return profiled_lock_class(lock, profiler, name)
 
         self._set_original(FunctionWrapper(self.original, _allocate_lock))
 
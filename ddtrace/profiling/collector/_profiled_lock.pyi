@@ -0,0 +1,53 @@
+import types
+import typing
+
+from .. import event
+
+class LockSite(object):
+    lock_name: str
+    frames: typing.Tuple[event.FrameType, ...]
+    nframes: int
+    acquire_count: int
+    wait_time_ns: int
+    release_count: int
+    locked_for_ns: int
+
+_LockCallback = typing.Callable[[str, typing.Optional[types.FrameType], int], None]
+
+class LockProfiler(object):
+    capture_pct: float
+    max_nframes: int
+    def __init__(
+        self,
+        capture_pct: float,
+        max_nframes: int,
+        on_acquire: typing.Optional[_LockCallback] = ...,
+        on_release: typing.Optional[_LockCallback] = ...,
+    ) -> None: ...
+    @property
+    def aggregate(self) -> bool: ...
+    def collect(self) -> typing.List[LockSite]: ...
+
+class _ProfiledLockBase(object):
+    __wrapped__: typing.Any
+    name: str
+    def __init__(self, wrapped: typing.Any, profiler: LockProfiler, name: str) -> None: ...
+    def __enter__(self) -> typing.Any: ...
+    def __exit__(self, *args: typing.Any) -> typing.Any: ...
+
+class ProfiledLock(_ProfiledLockBase):
+    def __getattr__(self, name: str) -> typing.Any: ...
+    def acquire(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any: ...
+    def acquire_lock(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any: ...
+    def release(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any: ...
+    def __aenter__(self) -> typing.Any: ...
+    def __aexit__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any: ...
+
+class ProfiledThreadingLock(_ProfiledLockBase):
+    def acquire(self, blocking: typing.Any = ..., timeout: typing.Any = ...) -> typing.Any: ...
+    def acquire_lock(self, blocking: typing.Any = ..., timeout: typing.Any = ...) -> typing.Any: ...
+    def release(self) -> None: ...
+    def release_lock(self) -> None: ...
+    def locked(self) -> bool: ...
+    def locked_lock(self) -> bool: ...
+    def _at_fork_reinit(self) -> None: ...
@@ -0,0 +1,338 @@
+"""Native wrapper of the locks profiled by the lock collectors.
+
+Acquiring and releasing a lock that is not captured by the sampler only
+updates a counter in C before calling the wrapped lock, and only checks a C
+field when releasing it. The captured acquires are either reported to Python
+callbacks, that record one event per acquire and release, or aggregated in
+place by acquisition site.
+"""
+from cpython.object cimport PyObject
+from cpython.pythread cimport NOWAIT_LOCK
+from cpython.pythread cimport PyThread_acquire_lock
+from cpython.pythread cimport PyThread_allocate_lock
+from cpython.pythread cimport PyThread_free_lock
+from cpython.pythread cimport PyThread_release_lock
+from cpython.pythread cimport PyThread_type_lock
+from cpython.pythread cimport WAIT_LOCK
+from libc.stdint cimport int64_t
+
+from ddtrace.internal import compat
+from ddtrace.profiling.collector import _traceback
+
+
+cdef extern from "<Python.h>":
+    ctypedef struct PyFrameObject
+    PyFrameObject* PyEval_GetFrame()
+
+
+cdef inline object _call(method, tuple args, dict kwargs):
+    if kwargs:
+        return method(*args, **kwargs)
+    if not args:
+        return method()
+    return method(*args)
+
+
+cdef inline object _current_frame():
+    # The functions of this module do not have Python frames, so this is the
+    # frame of the code using the lock.
+    cdef PyFrameObject* frame = PyEval_GetFrame()
+    if frame is NULL:
+        return None
+    return <object><PyObject*>frame
+
+
+cdef class LockSite(object):
+    """Usage of a lock at an acquisition site."""
+
+    cdef readonly object lock_name
+    cdef readonly tuple frames
+    cdef readonly int nframes
+    cdef readonly int64_t acquire_count
+    cdef readonly int64_t wait_time_ns
+    cdef readonly int64_t release_count
+    cdef readonly int64_t locked_for_ns
+    # The collection of the profiler this site is aggregated in
+    cdef Py_ssize_t _generation
+
+    def __init__(self, lock_name, frames, nframes):
+        self.lock_name = lock_name
+        self.frames = frames
+        self.nframes = nframes
+
+
+cdef class LockProfiler(object):
+    """Sample the acquires of the locks profiled by a collector.
+
+    If ``on_acquire`` and ``on_release`` are given, they are called with the
+    name of the lock, the frame using it and the time waited for, or the time
+    the lock was held, in nanoseconds. Otherwise, the captured acquires are
+    aggregated by lock name and stack of the acquisition site, until the
+    sites are collected with :meth:`collect`.
+
+    The aggregated sites and their stack table are shared by all the threads
+    using the profiled locks, and are only accessed with the lock of the
+    profiler held. That lock is never waited for: an acquire or release is
+    not aggregated if the lock is already held, e.g. by a finalizer run by
+    the garbage collector while the same thread aggregates an acquire.
+
+    :param capture_pct: The percentage of acquires to capture.
+    :param max_nframes: The maximum number of frames of the acquisition sites.
+    :param on_acquire: The function called when a captured acquire returns.
+    :param on_release: The function called when a lock acquired by a captured acquire is released.
+    """
+
+    cdef readonly double capture_pct
+    cdef readonly int max_nframes
+    cdef double _counter
+    cdef object _on_acquire
+    cdef object _on_release
+    cdef object _stack_table
+    cdef dict _sites
+    cdef Py_ssize_t _generation
+    cdef PyThread_type_lock _lock
+
+    def __cinit__(self, *args, **kwargs):
+        self._lock = PyThread_allocate_lock()
+        if self._lock is NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        if self._lock is not NULL:
+            PyThread_free_lock(self._lock)
+
+    def __init__(self, capture_pct, max_nframes, on_acquire=None, on_release=None):
+        if capture_pct < 0 or capture_pct > 100:
+            raise ValueError("Capture percentage should be between 0 and 100 included")
+        if (on_acquire is None) != (on_release is None):
+            raise ValueError("Both on_acquire and on_release must be given to report the captured acquires")
+        self.capture_pct = capture_pct
+        self.max_nframes = max_nframes
+        self._counter = 0
+        self._on_acquire = on_acquire
+        self._on_release = on_release
+        self._stack_table = _traceback.StackTable()
+        self._sites = {}
+        self._generation = 0
+
+    @property
+    def aggregate(self):
+        # type: (...) -> bool
+        return self._on_acquire is None
+
+    cdef inline bint _capture(self):
+        self._counter += self.capture_pct
+        if self._counter >= 100:
+            self._counter -= 100
+            return True
+        return False
+
+    cdef LockSite _site(self, lock_name, tuple frames, int nframes):
+        cdef LockSite site
+
+        # The site keeps the interned frames alive, so their identity is not
+        # reused while the site is in the table.
+        key = (lock_name, id(frames))
+        site = self._sites.get(key)
+        if site is None:
+            site = self._sites[key] = LockSite(lock_name, frames, nframes)
+            site._generation = self._generation
+        return site
+
+    cdef LockSite _acquired(self, lock_name, frame, int64_t wait_time_ns):
+        cdef LockSite site
+
+        if not PyThread_acquire_lock(self._lock, NOWAIT_LOCK):
+            return None
+        try:
+            frames, nframes = self._stack_table.pyframe_to_frames(frame, self.max_nframes)
+            site = self._site(lock_name, frames, nframes)
+            site.acquire_count += 1
+            site.wait_time_ns += wait_time_ns
+            return site
+        finally:
+            PyThread_release_lock(self._lock)
+
+    cdef void _released(self, LockSite site, int64_t locked_for_ns):
+        if not PyThread_acquire_lock(self._lock, NOWAIT_LOCK):
+            return
+        try:
+            # The lock was acquired before the last collection: its release
+            # is aggregated in the site of the current one.
+            if site._generation != self._generation:
+                site = self._site(site.lock_name, site.frames, site.nframes)
+            site.release_count += 1
+            site.locked_for_ns += locked_for_ns
+        finally:
+            PyThread_release_lock(self._lock)
+
+    def collect(self):
+        # type: (...) -> typing.List[LockSite]
+        """Return the lock sites aggregated since the last collection, and start aggregating new ones."""
+        # The GIL is released while waiting, so the thread holding the lock can
+        # run until it releases it.
+        with nogil:
+            PyThread_acquire_lock(self._lock, WAIT_LOCK)
+        try:
+            sites, self._sites = self._sites, {}
+            self._generation += 1
+        finally:
+            PyThread_release_lock(self._lock)
+        return list(sites.values())
+
+
+cdef class _ProfiledLockBase(object):
+    cdef readonly object __wrapped__
+    cdef readonly object name
+    cdef LockProfiler _profiler
+    cdef object _acquire
+    cdef object _release
+    cdef object _enter
+    cdef object _exit
+    # When the lock was acquired, if the acquire was captured, or 0
+    cdef int64_t _acquired_at
+    cdef LockSite _acquired_site
+    cdef object __weakref__
+
+    def __init__(self, wrapped, LockProfiler profiler, name):
+        self.__wrapped__ = wrapped
+        self.name = name
+        self._profiler = profiler
+        self._acquire = wrapped.acquire
+        self._release = wrapped.release
+        self._enter = getattr(wrapped, "__enter__", None)
+        self._exit = getattr(wrapped, "__exit__", None)
+        self._acquired_at = 0
+
+    def __repr__(self):
+        return "<%s at 0x%x for %r>" % (type(self).__name__, id(self), self.__wrapped__)
+
+    def __enter__(self):
+        if self._enter is None:
+            raise AttributeError("__enter__")
+        return self._do_acquire(self._enter, (), None)
+
+    def __exit__(self, *args):
+        if self._exit is None:
+            raise AttributeError("__exit__")
+        return self._do_release(self._exit, args, None)
+
+    cdef inline object _do_acquire(self, method, tuple args, dict kwargs):
+        cdef int64_t start
+        cdef int64_t end
+        cdef LockProfiler profiler = self._profiler
+
+        if not profiler._capture():
+            return _call(method, args, kwargs)
+
+        start = compat.monotonic_ns()
+        result = _call(method, args, kwargs)
+        # Failed attempts to acquire the lock without blocking are not captured
+        if result is False:
+            return result
+        end = compat.monotonic_ns()
+
+        try:
+            frame = _current_frame()
+            if profiler._on_acquire is None:
+                site = profiler._acquired(self.name, frame, end - start)
+                if site is None:
+                    return result
+                self._acquired_site = site
+            else:
+                profiler._on_acquire(self.name, frame, end - start)
+        except Exception:
+            pass
+        else:
+            self._acquired_at = end
+        return result
+
+    cdef inline object _do_release(self, method, tuple args, dict kwargs):
+        cdef int64_t acquired_at = self._acquired_at
+        cdef int64_t locked_for_ns
+        cdef LockSite site
+
+        if acquired_at == 0:
+            return _call(method, args, kwargs)
+
+        # Once released, the lock can be acquired again by another thread
+        locked_for_ns = compat.monotonic_ns() - acquired_at
+        site = self._acquired_site
+        self._acquired_at = 0
+        self._acquired_site = None
+
+        result = _call(method, args, kwargs)
+
+        try:
+            if site is not None:
+                self._profiler._released(site, locked_for_ns)
+            elif self._profiler._on_release is not None:
+                self._profiler._on_release(self.name, _current_frame(), locked_for_ns)
+        except Exception:
+            pass
+        return result
+
+
+cdef class ProfiledLock(_ProfiledLockBase):
+    """Proxy of a lock whose acquires are sampled by a :class:`LockProfiler`.
+
+    :param wrapped: The lock.
+    :param profiler: The profiler of the lock.
+    :param name: The name of the lock.
+    """
+
+    def __getattr__(self, name):
+        return getattr(self.__wrapped__, name)
+
+    def acquire(self, *args, **kwargs):
+        return self._do_acquire(self._acquire, args, kwargs)
+
+    acquire_lock = acquire
+
+    def release(self, *args, **kwargs):
+        return self._do_release(self._release, args, kwargs)
+
+    def __aenter__(self):
+        return self.__wrapped__.__aenter__()
+
+    def __aexit__(self, *args, **kwargs):
+        return self.__wrapped__.__aexit__(*args, **kwargs)
+
+
+cdef class ProfiledThreadingLock(_ProfiledLockBase):
+    """Proxy of a :class:`threading.Lock` whose acquires are sampled by a :class:`LockProfiler`.
+
+    Unlike :class:`ProfiledLock`, only the methods of :class:`threading.Lock`
+    are proxied: falling back on the wrapped lock for the other attributes
+    would make looking up the methods of the proxy as slow as acquiring the
+    lock. The default arguments are not passed to the wrapped lock, whose
+    defaults may differ, e.g. with gevent.
+
+    :param wrapped: The lock.
+    :param profiler: The profiler of the lock.
+    :param name: The name of the lock.
+    """
+
+    def acquire(self, blocking=True, timeout=-1):
+        if timeout == -1:
+            if blocking is True:
+                return self._do_acquire(self._acquire, (), None)
+            return self._do_acquire(self._acquire, (blocking,), None)
+        return self._do_acquire(self._acquire, (blocking, timeout), None)
+
+    acquire_lock = acquire
+
+    def release(self):
+        return self._do_release(self._release, (), None)
+
+    release_lock = release
+
+    def locked(self):
+        return self.__wrapped__.locked()
+
+    locked_lock = locked
+
+    def _at_fork_reinit(self):
+        self.__wrapped__._at_fork_reinit()
+        self._acquired_at = 0
+        self._acquired_site = None
@@ -7,3 +7,16 @@ def traceback_to_frames(
     traceback: types.TracebackType, max_nframes: int
 ) -> typing.Tuple[typing.List[event.FrameType], int]: ...
 def pyframe_to_frames(frame: types.FrameType, max_nframes: int) -> typing.Tuple[typing.List[event.FrameType], int]: ...
+
+DEFAULT_STACK_TABLE_SIZE: int
+
+class StackTable(object):
+    max_size: int
+    hits: int
+    misses: int
+    def __init__(self, max_size: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def clear(self) -> None: ...
+    def pyframe_to_frames(
+        self, frame: types.FrameType, max_nframes: int
+    ) -> typing.Tuple[typing.Tuple[event.FrameType, ...], int]: ...
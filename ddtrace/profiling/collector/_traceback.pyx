@@ -1,12 +1,20 @@
 from types import CodeType
 from types import FrameType
 
+from cpython.object cimport PyObject
+from libc.stdint cimport uint64_t
+from libc.stdint cimport uintptr_t
+
 from ddtrace.internal.logger import get_logger
 
 
 log = get_logger(__name__)
 
 
+# Maximum number of stacks kept by a StackTable
+DEFAULT_STACK_TABLE_SIZE = 1024
+
+
 cpdef _extract_class_name(frame):
     # type: (...) -> str
     """Extract class name from a frame, if possible.
@@ -92,3 +100,113 @@ cpdef pyframe_to_frames(frame, max_nframes):
         nframes += 1
         frame = frame.f_back
     return frames, nframes
+
+
+cdef inline uint64_t _fnv1a(uint64_t h, uint64_t value):
+    return (h ^ value) * <uint64_t>0x100000001b3
+
+
+cdef class StackTable(object):
+    """Table of interned stacks.
+
+    Stacks are identified by the code objects of their frames and their line
+    numbers. Sampling a stack that is already in the table only walks its
+    frames, and returns the same tuple of frames as the previous samples of
+    the stack instead of building a new list of frame tuples.
+
+    The class name of a frame is derived from its locals, which is expensive,
+    so only the class name of the innermost frame identifies a stack. The
+    class names of the other frames are the ones of the first sample of the
+    stack.
+
+    A table is not thread-safe: it must only be used by one collector, that
+    serializes the calls to the table if it samples from several threads.
+
+    :param max_size: The maximum number of stacks in the table. The table is
+        emptied when it is full.
+    """
+
+    cdef dict _stacks
+    cdef readonly Py_ssize_t max_size
+    cdef readonly Py_ssize_t hits
+    cdef readonly Py_ssize_t misses
+
+    def __init__(self, max_size=DEFAULT_STACK_TABLE_SIZE):
+        if max_size < 1:
+            raise ValueError("The size of the stack table must be positive")
+        self.max_size = max_size
+        self._stacks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._stacks)
+
+    def clear(self):
+        """Remove all the stacks from the table."""
+        self._stacks.clear()
+
+    cpdef pyframe_to_frames(self, frame, max_nframes):
+        """Convert a Python frame to an interned tuple of frames.
+
+        :param frame: The frame object to serialize.
+        :param max_nframes: The maximum number of frames to return.
+        :return: The serialized frames and the number of frames present in the original traceback."""
+        cdef uint64_t key = 0xcbf29ce484222325
+        cdef list codes = []
+        cdef list linenos = []
+        cdef Py_ssize_t c_lineno
+        cdef tuple stack
+
+        # DEV: see pyframe_to_frames for the type checks
+        if not isinstance(frame, FrameType):
+            log.warning(
+                "Got object of type '%s' instead of a frame object for the top frame of a thread", type(frame).__name__
+            )
+            return (), 0
+
+        top = frame
+        nframes = 0
+
+        while frame is not None:
+            IF PY_MAJOR_VERSION > 3 or (PY_MAJOR_VERSION == 3 and PY_MINOR_VERSION >= 11):
+                if not isinstance(frame, FrameType):
+                    log.warning(
+                        "Got object of type '%s' instead of a frame object during stack unwinding", type(frame).__name__
+                    )
+                    return (), 0
+
+            if nframes < max_nframes:
+                code = frame.f_code
+                IF PY_MAJOR_VERSION > 3 or (PY_MAJOR_VERSION == 3 and PY_MINOR_VERSION >= 11):
+                    if not isinstance(code, CodeType):
+                        log.warning(
+                            "Got object of type '%s' instead of a code object during stack unwinding",
+                            type(code).__name__,
+                        )
+                        return (), 0
+
+                lineno = 0 if frame.f_lineno is None else frame.f_lineno
+                codes.append(code)
+                linenos.append(lineno)
+                c_lineno = lineno
+                key = _fnv1a(_fnv1a(key, <uintptr_t><PyObject*>code), <uint64_t>c_lineno)
+            nframes += 1
+            frame = frame.f_back
+
+        class_name = _extract_class_name(top)
+
+        stack = self._stacks.get(key)
+        # The code objects are kept alive by the table, so their identity is
+        # not reused while the stack is in the table.
+        if stack is not None and stack[2] == class_name and stack[0] == codes and stack[1] == linenos:
+            self.hits += 1
+            return stack[3], nframes
+
+        self.misses += 1
+        frames, nframes = pyframe_to_frames(top, max_nframes)
+        frames = tuple(frames)
+        if len(self._stacks) >= self.max_size:
+            self._stacks.clear()
+        self._stacks[key] = (codes, linenos, class_name, frames)
+        return frames, nframes
@@ -17,17 +17,12 @@ class AsyncioLockReleaseEvent(_lock.LockReleaseEvent):
     """An asyncio.Lock has been released."""
 
 
-class _ProfiledAsyncioLock(_lock._ProfiledLock):
-
-    ACQUIRE_EVENT_CLASS = AsyncioLockAcquireEvent
-    RELEASE_EVENT_CLASS = AsyncioLockReleaseEvent
-
-
 @attr.s
 class AsyncioLockCollector(_lock.LockCollector):
     """Record asyncio.Lock usage."""
 
-    PROFILED_LOCK_CLASS = _ProfiledAsyncioLock
+    ACQUIRE_EVENT_CLASS = AsyncioLockAcquireEvent
+    RELEASE_EVENT_CLASS = AsyncioLockReleaseEvent
 
     def _start_service(self):
         # type: (...) -> None
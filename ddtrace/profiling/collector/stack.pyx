@@ -1,6 +1,7 @@
 """CPU profiling collector."""
 from __future__ import absolute_import
 
+import heapq
 import sys
 import typing
 
@@ -102,9 +103,8 @@ IF UNAME_SYSNAME == "Linux":
                 self._last_thread_time[key] = cpu_time
 
             # Clear cache
-            keys = list(pthread_cpu_time.keys())
             for key in list(self._last_thread_time.keys()):
-                if key not in keys:
+                if key not in pthread_cpu_time:
                     del self._last_thread_time[key]
 
             return pthread_cpu_time
@@ -135,6 +135,98 @@ ELSE:
             }
 
 
+cdef class _ThreadSampler(object):
+    """Select the threads to sample at each collection.
+
+    The wall and CPU time of each thread are accumulated until it is sampled,
+    and the threads that accumulated the most are sampled first: idle threads
+    are sampled in round-robin, and threads using CPU more often. The number of
+    threads sampled at each collection is adjusted so that a collection does
+    not take more than a target time, whatever the number of threads.
+    """
+
+    cdef dict _pending
+    cdef double _threads_per_sample
+    cdef Py_ssize_t _nb_sampled
+    cdef object _sampled_at_ns
+    cdef double _thread_cost_ns
+
+    def __init__(self, threads_per_sample=1):
+        self._pending = {}
+        # Start low by default, the cost of sampling a thread is not known yet
+        self._threads_per_sample = threads_per_sample
+        self._nb_sampled = 0
+        self._sampled_at_ns = None
+        self._thread_cost_ns = 0
+
+    @property
+    def threads_per_sample(self):
+        return max(1, int(min(self._threads_per_sample, len(self._pending))))
+
+    def select(self, cpu_times, wall_time_ns):
+        """Select the threads to sample.
+
+        :param cpu_times: The CPU time used by every running thread since the last collection, by thread key.
+        :param wall_time_ns: The wall time elapsed since the last collection.
+        :return: The wall and CPU time to attribute to each sampled thread, by thread key.
+        """
+        cdef dict pending = {}
+        cdef list times
+
+        # The threads are kept from the one sampled the longest ago to the one sampled last.
+        # Threads that are not running anymore are forgotten.
+        for key, times in self._pending.items():
+            cpu_time = cpu_times.get(key)
+            if cpu_time is not None:
+                times[0] += wall_time_ns
+                times[1] += cpu_time
+                pending[key] = times
+        for key, cpu_time in cpu_times.items():
+            if key not in pending:
+                pending[key] = [wall_time_ns, cpu_time]
+        self._pending = pending
+
+        if len(pending) <= self._threads_per_sample:
+            selected = list(pending)
+        else:
+            # On equal time, the thread that was sampled the longest ago goes first
+            selected = heapq.nlargest(
+                int(self._threads_per_sample), pending, key=lambda key: pending[key][0] + pending[key][1]
+            )
+
+        cdef dict sampled = {}
+        for key in selected:
+            times = pending.pop(key)
+            sampled[key] = (times[0], times[1])
+            times[0] = times[1] = 0
+            pending[key] = times
+
+        self._nb_sampled = len(sampled)
+        self._sampled_at_ns = compat.monotonic_ns()
+        return sampled
+
+    def adjust(self, start_ns, end_ns, target_time_ns):
+        """Adjust the number of threads to sample to the cost of the last collection.
+
+        :param start_ns: When the last collection started.
+        :param end_ns: When the last collection ended.
+        :param target_time_ns: The time a collection should take.
+        """
+        if self._sampled_at_ns is None or self._nb_sampled == 0:
+            return
+
+        # Listing the threads has a fixed cost, only sampling them depends on the number of threads sampled
+        fixed_cost_ns = self._sampled_at_ns - start_ns
+        thread_cost_ns = max(1, end_ns - self._sampled_at_ns) / self._nb_sampled
+        # Smooth the cost to not overreact to a single slow collection
+        if self._thread_cost_ns:
+            thread_cost_ns = (self._thread_cost_ns + thread_cost_ns) / 2.0
+        self._thread_cost_ns = thread_cost_ns
+        # Sampling threads gets at least as much time as listing them, so that the fixed cost is amortized when
+        # there are too many threads to sample within the target time
+        self._threads_per_sample = max(1.0, max(target_time_ns - fixed_cost_ns, fixed_cost_ns) / thread_cost_ns)
+
+
 from cpython.object cimport PyObject
 
 
@@ -215,7 +307,7 @@ ELSE:
 
 
 
-cdef collect_threads(thread_id_ignore_list, thread_time, thread_span_links) with gil:
+cdef collect_threads(thread_id_ignore_list, thread_time, thread_sampler, wall_time, thread_span_links) with gil:
     cdef dict current_exceptions = {}
 
     IF UNAME_SYSNAME != "Windows" and PY_MAJOR_VERSION >= 3 and PY_MINOR_VERSION >= 7:
@@ -276,7 +368,15 @@ cdef collect_threads(thread_id_ignore_list, thread_time, thread_span_links) with
 
     cdef dict cpu_times = thread_time(running_threads.keys())
 
-    return tuple(
+    if thread_id_ignore_list:
+        cpu_times = {key: cpu_time for key, cpu_time in cpu_times.items() if key[0] not in thread_id_ignore_list}
+
+    if thread_sampler is None:
+        sampled = {key: (wall_time, cpu_time) for key, cpu_time in cpu_times.items()}
+    else:
+        sampled = thread_sampler.select(cpu_times, wall_time)
+
+    return set(pthread_id for pthread_id, native_thread_id in cpu_times), tuple(
         (
             pthread_id,
             native_thread_id,
@@ -284,15 +384,15 @@ cdef collect_threads(thread_id_ignore_list, thread_time, thread_span_links) with
             running_threads[pthread_id],
             current_exceptions.get(pthread_id),
             thread_span_links.get_active_span_from_thread_id(pthread_id) if thread_span_links else None,
+            thread_wall_time,
             cpu_time,
         )
-        for (pthread_id, native_thread_id), cpu_time in cpu_times.items()
-        if pthread_id not in thread_id_ignore_list
+        for (pthread_id, native_thread_id), (thread_wall_time, cpu_time) in sampled.items()
     )
 
 
 
-cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_time, thread_span_links, collect_endpoint):
+cdef stack_collect(ignore_profiler, thread_time, thread_sampler, stack_table, max_nframes, interval, wall_time, thread_span_links, collect_endpoint):
     # Do not use `threading.enumerate` to not mess with locking (gevent!)
     thread_id_ignore_list = {
         thread_id
@@ -300,16 +400,18 @@ cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_tim
         if getattr(thread, "_ddtrace_profiling_ignore", False)
     } if ignore_profiler else set()
 
-    running_threads = collect_threads(thread_id_ignore_list, thread_time, thread_span_links)
+    running_thread_ids, sampled_threads = collect_threads(
+        thread_id_ignore_list, thread_time, thread_sampler, wall_time, thread_span_links
+    )
 
     if thread_span_links:
         # FIXME also use native thread id
-        thread_span_links.clear_threads(set(thread[0] for thread in running_threads))
+        thread_span_links.clear_threads(running_thread_ids)
 
     stack_events = []
     exc_events = []
 
-    for thread_id, thread_native_id, thread_name, thread_pyframes, exception, span, cpu_time in running_threads:
+    for thread_id, thread_native_id, thread_name, thread_pyframes, exception, span, wall_time, cpu_time in sampled_threads:
         if thread_name is None:
             # A Python thread with no name is likely still initialising so we
             # ignore it to avoid reporting potentially misleading data.
@@ -325,7 +427,7 @@ cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_tim
             if task_pyframes is None:
                 continue
 
-            frames, nframes = _traceback.pyframe_to_frames(task_pyframes, max_nframes)
+            frames, nframes = stack_table.pyframe_to_frames(task_pyframes, max_nframes)
             if nframes:
                 stack_events.append(
                     stack_event.StackSampleEvent(
@@ -340,7 +442,7 @@ cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_tim
                     )
                 )
 
-        frames, nframes = _traceback.pyframe_to_frames(thread_pyframes, max_nframes)
+        frames, nframes = stack_table.pyframe_to_frames(thread_pyframes, max_nframes)
         if nframes:
             event = stack_event.StackSampleEvent(
                 thread_id=thread_id,
@@ -438,7 +540,10 @@ class StackCollector(collector.PeriodicCollector):
     ignore_profiler = attr.ib(type=bool, default=config.ignore_profiler)
     endpoint_collection_enabled = attr.ib(default=None)
     tracer = attr.ib(default=None)
+    adaptive_thread_sampling = attr.ib(type=bool, default=config.adaptive_thread_sampling)
     _thread_time = attr.ib(init=False, repr=False, eq=False)
+    _thread_sampler = attr.ib(default=None, init=False, repr=False, eq=False)
+    _stack_table = attr.ib(init=False, repr=False, eq=False)
     _last_wall_time = attr.ib(init=False, repr=False, eq=False, type=int)
     _thread_span_links = attr.ib(default=None, init=False, repr=False, eq=False)
 
@@ -450,6 +555,9 @@ class StackCollector(collector.PeriodicCollector):
     def _init(self):
         # type: (...) -> None
         self._thread_time = _ThreadTime()
+        if self.adaptive_thread_sampling:
+            self._thread_sampler = _ThreadSampler()
+        self._stack_table = _traceback.StackTable()
         self._last_wall_time = compat.monotonic_ns()
         if self.tracer is not None:
             self._thread_span_links = _ThreadSpanLinks()
@@ -471,6 +579,12 @@ class StackCollector(collector.PeriodicCollector):
         interval = (used_wall_time_ns / (self.max_time_usage_pct / 100.0)) - used_wall_time_ns
         return max(interval / 1e9, self.min_interval_time)
 
+    def _target_collect_time_ns(self):
+        # The time a collection can use while still collecting at the minimum interval
+        if self.max_time_usage_pct >= 100:
+            return float("inf")
+        return self.min_interval_time * 1e9 * self.max_time_usage_pct / (100.0 - self.max_time_usage_pct)
+
     def collect(self):
         # Compute wall time
         now = compat.monotonic_ns()
@@ -478,10 +592,13 @@ class StackCollector(collector.PeriodicCollector):
         self._last_wall_time = now
 
         all_events = stack_collect(
-            self.ignore_profiler, self._thread_time, self.nframes, self.interval, wall_time, self._thread_span_links, self.endpoint_collection_enabled
+            self.ignore_profiler, self._thread_time, self._thread_sampler, self._stack_table, self.nframes, self.interval, wall_time, self._thread_span_links, self.endpoint_collection_enabled
         )
 
-        used_wall_time_ns = compat.monotonic_ns() - now
+        end = compat.monotonic_ns()
+        used_wall_time_ns = end - now
         self.interval = self._compute_new_interval(used_wall_time_ns)
+        if self._thread_sampler is not None:
+            self._thread_sampler.adjust(now, end, self._target_collect_time_ns())
 
         return all_events
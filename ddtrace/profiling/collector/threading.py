@@ -6,6 +6,7 @@ import typing
 import attr
 
 from . import _lock
+from . import _profiled_lock
 from .. import event
 
 
@@ -19,17 +20,13 @@ class ThreadingLockReleaseEvent(_lock.LockReleaseEvent):
     """A threading.Lock has been released."""
 
 
-class _ProfiledThreadingLock(_lock._ProfiledLock):
-
-    ACQUIRE_EVENT_CLASS = ThreadingLockAcquireEvent
-    RELEASE_EVENT_CLASS = ThreadingLockReleaseEvent
-
-
 @attr.s
 class ThreadingLockCollector(_lock.LockCollector):
     """Record threading.Lock usage."""
 
-    PROFILED_LOCK_CLASS = _ProfiledThreadingLock
+    PROFILED_LOCK_CLASS = _profiled_lock.ProfiledThreadingLock
+    ACQUIRE_EVENT_CLASS = ThreadingLockAcquireEvent
+    RELEASE_EVENT_CLASS = ThreadingLockReleaseEvent
 
     def _get_original(self):
         # type: (...) -> typing.Any
@@ -10,7 +10,8 @@ _T = typing.TypeVar("_T")
 
 # (filename, line number, function name, class name)
 FrameType = typing.Tuple[str, int, str, str]
-StackTraceType = typing.List[FrameType]
+# Stack samples share interned tuples of frames, see _traceback.StackTable
+StackTraceType = typing.Sequence[FrameType]
 
 
 def event_class(
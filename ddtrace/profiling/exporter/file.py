@@ -34,6 +34,6 @@ class PprofFileExporter(pprof.PprofExporter):
         """
         profile, libs = super(PprofFileExporter, self).export(events, start_time_ns, end_time_ns)
         with gzip.open(self.prefix + (".%d.%d" % (os.getpid(), self._increment)), "wb") as f:
-            f.write(profile.SerializeToString())
+            profile.write_to(f)
         self._increment += 1
         return profile, libs
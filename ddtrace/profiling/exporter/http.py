@@ -182,7 +182,7 @@ class PprofHTTPExporter(pprof.PprofExporter):
         profile, libs = super(PprofHTTPExporter, self).export(events, start_time_ns, end_time_ns)
         pprof = six.BytesIO()
         with gzip.GzipFile(fileobj=pprof, mode="wb") as gz:
-            gz.write(profile.SerializeToString())
+            profile.write_to(gz)
 
         data = [
             {
@@ -1,6 +1,7 @@
 import typing
 from typing import Any
 
+from ddtrace.profiling import event
 from ddtrace.profiling import exporter
 from ddtrace.profiling import recorder as recorder
 from ddtrace.profiling.collector import _lock
@@ -20,112 +21,89 @@ class Package(typing.TypedDict):
     kind: typing.Literal["library"]
     paths: typing.List[str]
 
-class pprof_LocationType:
+class pprof_ValueType(typing.NamedTuple):
+    type: int
+    unit: int
+
+class pprof_LabelType(typing.NamedTuple):
+    key: int
+    str: int
+
+class pprof_SampleType(typing.NamedTuple):
+    location_id: typing.Tuple[int, ...]
+    value: typing.List[int]
+    label: typing.List[pprof_LabelType]
+
+class pprof_Mapping(typing.NamedTuple):
     id: int
+    filename: int
+
+class pprof_LineType(typing.NamedTuple):
+    function_id: int
+    line: int
 
-class pprof_Mapping:
+class pprof_LocationType(typing.NamedTuple):
+    id: int
+    line: typing.List[pprof_LineType]
+
+class pprof_FunctionType(typing.NamedTuple):
+    id: int
+    name: int
     filename: int
 
 class pprof_ProfileType:
-    id: int
-    string_table: typing.Dict[int, str]
+    sample_type: typing.List[pprof_ValueType]
+    sample: typing.List[pprof_SampleType]
     mapping: typing.List[pprof_Mapping]
+    location: typing.List[pprof_LocationType]
+    function: typing.List[pprof_FunctionType]
+    string_table: typing.List[str]
+    time_nanos: int
+    duration_nanos: int
+    period_type: pprof_ValueType
+    period: typing.Optional[int]
+    def __init__(
+        self,
+        sample_type: typing.List[pprof_ValueType],
+        sample: typing.List[pprof_SampleType],
+        mapping: typing.List[pprof_Mapping],
+        location: typing.List[pprof_LocationType],
+        function: typing.List[pprof_FunctionType],
+        string_table: typing.List[str],
+        time_nanos: int,
+        duration_nanos: int,
+        period_type: pprof_ValueType,
+        period: typing.Optional[int] = ...,
+    ) -> None: ...
+    def write_to(self, fp: typing.BinaryIO) -> None: ...
     def SerializeToString(self) -> bytes: ...
 
-class pprof_FunctionType:
-    id: int
-
 HashableStackTraceType: Any
 
 class _PprofConverter:
-    def convert_stack_event(
-        self,
-        thread_id: str,
-        thread_native_id: str,
-        thread_name: str,
-        task_id: str,
-        task_name: str,
-        local_root_span_id: str,
-        span_id: str,
-        trace_resource: str,
-        trace_type: str,
-        frames: HashableStackTraceType,
-        nframes: int,
-        samples: typing.List[stack_event.StackSampleEvent],
-    ) -> None: ...
-    def convert_memalloc_event(
-        self,
-        thread_id: str,
-        thread_native_id: str,
-        thread_name: str,
-        frames: HashableStackTraceType,
-        nframes: int,
-        events: typing.List[memalloc.MemoryAllocSampleEvent],
-    ) -> None: ...
+    def convert_stack_event(self, event: stack_event.StackSampleEvent) -> None: ...
+    def convert_memalloc_event(self, event: memalloc.MemoryAllocSampleEvent) -> None: ...
     def convert_memalloc_heap_event(self, event: memalloc.MemoryHeapSampleEvent) -> None: ...
-    def convert_lock_acquire_event(
-        self,
-        lock_name: str,
-        thread_id: str,
-        thread_name: str,
-        task_id: str,
-        task_name: str,
-        local_root_span_id: str,
-        span_id: str,
-        trace_resource: str,
-        trace_type: str,
-        frames: HashableStackTraceType,
-        nframes: int,
-        events: typing.List[_lock.LockAcquireEvent],
-        sampling_ratio: float,
-    ) -> None: ...
-    def convert_lock_release_event(
-        self,
-        lock_name: str,
-        thread_id: str,
-        thread_name: str,
-        task_id: str,
-        task_name: str,
-        local_root_span_id: str,
-        span_id: str,
-        trace_resource: str,
-        trace_type: str,
-        frames: HashableStackTraceType,
-        nframes: int,
-        events: typing.List[_lock.LockReleaseEvent],
-        sampling_ratio: float,
-    ) -> None: ...
-    def convert_stack_exception_event(
-        self,
-        thread_id: str,
-        thread_native_id: str,
-        thread_name: str,
-        local_root_span_id: str,
-        span_id: str,
-        trace_resource: str,
-        trace_type: str,
-        frames: HashableStackTraceType,
-        nframes: int,
-        exc_type_name: str,
-        events: typing.List[stack_event.StackExceptionSampleEvent],
-    ) -> None: ...
-    def __init__(
-        self,
-        functions: Any,
-        locations: Any,
-        string_table: Any,
-        last_location_id: Any,
-        last_func_id: Any,
-        location_values: Any,
-    ) -> None: ...
+    def convert_lock_acquire_event(self, event: _lock.LockAcquireEvent) -> None: ...
+    def convert_lock_release_event(self, event: _lock.LockReleaseEvent) -> None: ...
+    def convert_lock_site_event(self, event: _lock.LockSiteEvent) -> None: ...
+    def convert_stack_exception_event(self, event: stack_event.StackExceptionSampleEvent) -> None: ...
+    def convert_events(self, events: typing.Sequence[event.Event]) -> None: ...
+    def __init__(self) -> None: ...
     def __lt__(self, other: Any) -> Any: ...
     def __le__(self, other: Any) -> Any: ...
     def __gt__(self, other: Any) -> Any: ...
     def __ge__(self, other: Any) -> Any: ...
 
-StackEventGroupKey: Any
-LockEventGroupKey: Any
-StackExceptionEventGroupKey: Any
+class PprofAggregator:
+    event_types: typing.FrozenSet[typing.Type[event.Event]]
+    def push_events(self, events: typing.Sequence[event.Event]) -> None: ...
+    def reset(self) -> _PprofConverter: ...
+    def __init__(self) -> None: ...
+    def __lt__(self, other: Any) -> Any: ...
+    def __le__(self, other: Any) -> Any: ...
+    def __gt__(self, other: Any) -> Any: ...
+    def __ge__(self, other: Any) -> Any: ...
 
 class PprofExporter(exporter.Exporter):
     def export(
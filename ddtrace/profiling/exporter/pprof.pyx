@@ -5,9 +5,22 @@ import platform
 import sysconfig
 import typing
 
+cimport cython
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint64_t
+from libc.stdlib cimport free
+from libc.stdlib cimport malloc
+from libc.stdlib cimport realloc
+from libc.string cimport memcpy
+
 import attr
 import six
 
+
+cdef extern from "Python.h":
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size) except NULL
+
 from ddtrace import ext
 from ddtrace.internal._encoding import ListStringTable as _StringTable
 from ddtrace.internal.compat import ensure_str
@@ -84,30 +97,6 @@ if platstdlib_path is not None and platstdlib_path != stdlib_path:
     )
 
 
-def _protobuf_version():
-    # type: (...) -> typing.Tuple[int, int, int]
-    """Check if protobuf version is post 3.12"""
-    import google.protobuf
-
-    from ddtrace.internal.utils.version import parse_version
-
-    return parse_version(google.protobuf.__version__)
-
-
-# Load the appropriate pprof_pb2 module
-_pb_version = _protobuf_version()
-for v in [(4, 21), (3, 19), (3, 12)]:
-    if _pb_version >= v:
-        import sys
-        
-        pprof_module = "ddtrace.profiling.exporter.pprof_%s%s_pb2" % v
-        __import__(pprof_module)
-        pprof_pb2 = sys.modules[pprof_module]
-        break
-else:
-    from ddtrace.profiling.exporter import pprof_3_pb2 as pprof_pb2  # type: ignore[no-redef]
-
-
 _ITEMGETTER_ZERO = operator.itemgetter(0)
 _ITEMGETTER_ONE = operator.itemgetter(1)
 _ATTRGETTER_ID = operator.attrgetter("id")
@@ -132,28 +121,351 @@ cdef groupby(object collection, object key):
     return groups.items()
 
 
-class pprof_LocationType(object):
-    # pprof_pb2.Location
-    id: int
-
-
-class pprof_Mapping(object):
-    filename: int
+# The messages of the pprof format, see pprof.proto. Only the fields set by the exporter are listed.
+# Use this format because CPython does not support the class style declaration
+pprof_ValueType = typing.NamedTuple("pprof_ValueType", [("type", int), ("unit", int)])
+pprof_LabelType = typing.NamedTuple("pprof_LabelType", [("key", int), ("str", int)])
+pprof_SampleType = typing.NamedTuple(
+    "pprof_SampleType",
+    [("location_id", typing.Tuple[int, ...]), ("value", typing.List[int]), ("label", typing.List[pprof_LabelType])],
+)
+pprof_Mapping = typing.NamedTuple("pprof_Mapping", [("id", int), ("filename", int)])
+pprof_LineType = typing.NamedTuple("pprof_LineType", [("function_id", int), ("line", int)])
+pprof_LocationType = typing.NamedTuple("pprof_LocationType", [("id", int), ("line", typing.List[pprof_LineType])])
+pprof_FunctionType = typing.NamedTuple("pprof_FunctionType", [("id", int), ("name", int), ("filename", int)])
+
+
+# Protobuf wire types
+DEF WIRE_VARINT = 0
+DEF WIRE_LEN = 2
+
+# Size of the chunks of serialized profile passed to the file object
+DEF CHUNK_SIZE = 64 * 1024
+
+
+cdef inline size_t _varint_size(uint64_t value):
+    cdef size_t size = 1
+    while value >= 0x80:
+        value >>= 7
+        size += 1
+    return size
+
+
+cdef inline size_t _varint_field_size(uint64_t value):
+    # Default values are not serialized, and all the field numbers fit in a single byte key
+    return 1 + _varint_size(value) if value else 0
+
+
+cdef inline size_t _len_field_size(size_t size):
+    return 1 + _varint_size(size) + size
+
+
+@cython.final
+cdef class _ProtobufWriter(object):
+    """Serialize protobuf fields and write them to a file object by chunks.
+
+    The size of a field is computed before it is serialized: the space it needs
+    is reserved at once, and it is then written without any bound check.
+    """
+
+    cdef char *_buf
+    cdef size_t _len
+    cdef size_t _size
+    cdef object _write
+    # The values of the message being serialized, converted once
+    cdef uint64_t *_values
+    cdef size_t _values_size
+
+    def __cinit__(self, write):
+        self._buf = <char*>malloc(CHUNK_SIZE)
+        self._values = <uint64_t*>malloc(64 * sizeof(uint64_t))
+        if self._buf == NULL or self._values == NULL:
+            raise MemoryError("Unable to allocate the pprof serialization buffers")
+        self._size = CHUNK_SIZE
+        self._values_size = 64
+        self._len = 0
+        self._write = write
+
+    def __dealloc__(self):
+        free(self._buf)
+        free(self._values)
 
+    cdef int _grow(self, size_t size) except -1:
+        cdef char *buf
+
+        self.flush()
+        if size > self._size:
+            buf = <char*>realloc(self._buf, size)
+            if buf == NULL:
+                raise MemoryError("Unable to grow the pprof serialization buffer")
+            self._buf = buf
+            self._size = size
+        return 0
 
-class pprof_ProfileType(object):
-    # Emulate pprof_pb2.Profile for typing
-    id: int
-    string_table: typing.Dict[int, str]
-    mapping: typing.List[pprof_Mapping]
+    cdef inline int reserve(self, size_t size) except -1:
+        if self._len + size > self._size:
+            return self._grow(size)
+        return 0
 
-    def SerializeToString(self) -> bytes:  # type: ignore[empty-body]
-        ...
+    cdef uint64_t *values(self, size_t size) except NULL:
+        cdef uint64_t *values
 
+        if size > self._values_size:
+            values = <uint64_t*>realloc(self._values, size * sizeof(uint64_t))
+            if values == NULL:
+                raise MemoryError("Unable to grow the pprof serialization buffer")
+            self._values = values
+            self._values_size = size
+        return self._values
+
+    cdef int flush(self) except -1:
+        if self._len:
+            self._write(PyBytes_FromStringAndSize(self._buf, self._len))
+            self._len = 0
+        return 0
+
+    # The methods below do not check that there is enough space in the buffer
+
+    cdef inline void varint(self, uint64_t value):
+        while value >= 0x80:
+            self._buf[self._len] = <char>((value & 0x7F) | 0x80)
+            self._len += 1
+            value >>= 7
+        self._buf[self._len] = <char>value
+        self._len += 1
+
+    cdef inline void len_key(self, int field, size_t size):
+        self._buf[self._len] = <char>((field << 3) | WIRE_LEN)
+        self._len += 1
+        self.varint(size)
+
+    cdef inline void varint_field(self, int field, uint64_t value):
+        if value:
+            self._buf[self._len] = <char>((field << 3) | WIRE_VARINT)
+            self._len += 1
+            self.varint(value)
+
+    cdef inline void raw(self, const char *data, size_t size):
+        memcpy(self._buf + self._len, data, size)
+        self._len += size
+
+
+cdef inline uint64_t _int64(object value):
+    # int64 fields are serialized as the two's complement of the value
+    return <uint64_t>(<int64_t>value)
+
+
+cdef inline tuple _message(object message):
+    # DEV: the messages are named tuples, which are accessed as plain tuples when serialized
+    if not isinstance(message, tuple):
+        raise TypeError("Expected a pprof message, got %r" % type(message))
+    return <tuple>message
+
+
+cdef int _write_varint_message(_ProtobufWriter writer, int field, uint64_t *values, int *fields, size_t n) except -1:
+    # Write a message made of varint fields
+    cdef size_t size = 0
+    cdef size_t i
+
+    for i in range(n):
+        size += _varint_field_size(values[i])
+    writer.reserve(_len_field_size(size))
+    writer.len_key(field, size)
+    for i in range(n):
+        writer.varint_field(fields[i], values[i])
+    return 0
+
+
+cdef int[2] _VALUE_TYPE_FIELDS = [1, 2]
+cdef int[2] _MAPPING_FIELDS = [1, 5]
+cdef int[3] _FUNCTION_FIELDS = [1, 2, 4]
+
+
+cdef int _write_value_type(_ProtobufWriter writer, int field, object value_type_obj) except -1:
+    cdef tuple value_type = _message(value_type_obj)
+    cdef uint64_t values[2]
+
+    values[0] = _int64(value_type[0])
+    values[1] = _int64(value_type[1])
+    return _write_varint_message(writer, field, values, _VALUE_TYPE_FIELDS, 2)
+
+
+cdef int _write_mapping(_ProtobufWriter writer, object mapping_obj) except -1:
+    cdef tuple mapping = _message(mapping_obj)
+    cdef uint64_t values[2]
+
+    values[0] = mapping[0]
+    values[1] = _int64(mapping[1])
+    return _write_varint_message(writer, 3, values, _MAPPING_FIELDS, 2)
+
+
+cdef int _write_function(_ProtobufWriter writer, object function_obj) except -1:
+    cdef tuple function = _message(function_obj)
+    cdef uint64_t values[3]
+
+    values[0] = function[0]
+    values[1] = _int64(function[1])
+    values[2] = _int64(function[2])
+    return _write_varint_message(writer, 5, values, _FUNCTION_FIELDS, 3)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _write_sample(_ProtobufWriter writer, object sample_obj) except -1:
+    cdef tuple sample = _message(sample_obj)
+    cdef tuple location_ids = sample[0]
+    cdef list values = sample[1]
+    cdef list labels = sample[2]
+    cdef tuple label
+    cdef size_t nlocations = len(location_ids)
+    cdef size_t nvalues = len(values)
+    cdef size_t nlabels = len(labels)
+    cdef uint64_t *v = writer.values(nlocations + nvalues + 2 * nlabels)
+    cdef uint64_t *label_values = v + nlocations + nvalues
+    cdef size_t locations_size = 0
+    cdef size_t values_size = 0
+    cdef size_t labels_size = 0
+    cdef size_t size = 0
+    cdef size_t i
+
+    for i in range(nlocations):
+        v[i] = location_ids[i]
+        locations_size += _varint_size(v[i])
+    for i in range(nvalues):
+        v[nlocations + i] = _int64(values[i])
+        values_size += _varint_size(v[nlocations + i])
+    for i in range(nlabels):
+        label = _message(labels[i])
+        label_values[2 * i] = _int64(label[0])
+        label_values[2 * i + 1] = _int64(label[1])
+        labels_size += _len_field_size(
+            _varint_field_size(label_values[2 * i]) + _varint_field_size(label_values[2 * i + 1])
+        )
 
-class pprof_FunctionType(object):
-    # pprof_pb2.Function
-    id: int
+    # Repeated scalars are packed, and not serialized when empty
+    if locations_size:
+        size += _len_field_size(locations_size)
+    if values_size:
+        size += _len_field_size(values_size)
+    size += labels_size
+
+    writer.reserve(_len_field_size(size))
+    writer.len_key(2, size)
+    if locations_size:
+        writer.len_key(1, locations_size)
+        for i in range(nlocations):
+            writer.varint(v[i])
+    if values_size:
+        writer.len_key(2, values_size)
+        for i in range(nvalues):
+            writer.varint(v[nlocations + i])
+    for i in range(nlabels):
+        writer.len_key(3, _varint_field_size(label_values[2 * i]) + _varint_field_size(label_values[2 * i + 1]))
+        writer.varint_field(1, label_values[2 * i])
+        writer.varint_field(2, label_values[2 * i + 1])
+    return 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _write_location(_ProtobufWriter writer, object location_obj) except -1:
+    cdef tuple location = _message(location_obj)
+    cdef uint64_t id_ = location[0]
+    cdef list lines = location[1]
+    cdef tuple line
+    cdef size_t nlines = len(lines)
+    cdef uint64_t *v = writer.values(2 * nlines)
+    cdef size_t size = _varint_field_size(id_)
+    cdef size_t i
+
+    for i in range(nlines):
+        line = _message(lines[i])
+        v[2 * i] = line[0]
+        v[2 * i + 1] = _int64(line[1])
+        size += _len_field_size(_varint_field_size(v[2 * i]) + _varint_field_size(v[2 * i + 1]))
+
+    writer.reserve(_len_field_size(size))
+    writer.len_key(4, size)
+    writer.varint_field(1, id_)
+    for i in range(nlines):
+        writer.len_key(4, _varint_field_size(v[2 * i]) + _varint_field_size(v[2 * i + 1]))
+        writer.varint_field(1, v[2 * i])
+        writer.varint_field(2, v[2 * i + 1])
+    return 0
+
+
+cdef int _write_string(_ProtobufWriter writer, int field, str string) except -1:
+    cdef Py_ssize_t size
+    cdef const char *data = PyUnicode_AsUTF8AndSize(string, &size)
+
+    writer.reserve(_len_field_size(size))
+    writer.len_key(field, size)
+    writer.raw(data, size)
+    return 0
+
+
+cdef int _write_varint_field(_ProtobufWriter writer, int field, uint64_t value) except -1:
+    writer.reserve(_varint_field_size(value))
+    writer.varint_field(field, value)
+    return 0
+
+
+@attr.s(slots=True)
+class pprof_ProfileType(object):
+    """A profile in the pprof format.
+
+    The profile is serialized without the protobuf runtime, with the fields in
+    the same order as the generated protobuf classes do.
+    """
+
+    sample_type = attr.ib(type=typing.List[pprof_ValueType])
+    sample = attr.ib(type=typing.List[pprof_SampleType])
+    mapping = attr.ib(type=typing.List[pprof_Mapping])
+    location = attr.ib(type=typing.List[pprof_LocationType])
+    function = attr.ib(type=typing.List[pprof_FunctionType])
+    string_table = attr.ib(type=typing.List[str])
+    time_nanos = attr.ib(type=int)
+    duration_nanos = attr.ib(type=int)
+    period_type = attr.ib(type=pprof_ValueType)
+    period = attr.ib(default=None, type=typing.Optional[int])
+
+    def write_to(self, fp):
+        # type: (typing.BinaryIO) -> None
+        """Serialize the profile to a file object, e.g. a gzip stream, by chunks."""
+        cdef _ProtobufWriter writer = _ProtobufWriter(fp.write)
+
+        for value_type in self.sample_type:
+            _write_value_type(writer, 1, value_type)
+        for sample in self.sample:
+            _write_sample(writer, sample)
+        for mapping in self.mapping:
+            _write_mapping(writer, mapping)
+        for location in self.location:
+            _write_location(writer, location)
+        for function in self.function:
+            _write_function(writer, function)
+        for string in self.string_table:
+            _write_string(writer, 6, string)
+        _write_varint_field(writer, 9, _int64(self.time_nanos))
+        _write_varint_field(writer, 10, _int64(self.duration_nanos))
+        _write_value_type(writer, 11, self.period_type)
+        if self.period is not None:
+            _write_varint_field(writer, 12, _int64(self.period))
+        writer.flush()
+
+    def SerializeToString(self):
+        # type: () -> bytes
+        chunks = []  # type: typing.List[bytes]
+        self.write_to(_ChunkList(chunks))
+        return b"".join(chunks)
+
+
+class _ChunkList(object):
+    __slots__ = ("write",)
+
+    def __init__(self, chunks):
+        # type: (typing.List[bytes]) -> None
+        self.write = chunks.append
 
 
 _Label_T = typing.Tuple[str, str]
@@ -164,17 +476,47 @@ _Location_Key_T = typing.Tuple[typing.Tuple[int, ...], _Label_List_T]
 HashableStackTraceType = typing.Tuple[event.FrameType, ...]
 
 
+cdef str _get_event_trace_resource(object event):
+    trace_resource = ""
+    # Do not export trace_resource for non Web spans for privacy concerns.
+    if event.trace_resource_container and event.trace_type == ext.SpanTypes.WEB:
+        (trace_resource,) = event.trace_resource_container
+    return ensure_str(trace_resource, errors="backslashreplace")
+
+
+# Values that are scaled by the average sampling ratio of the lock events of
+# the profile when it is built.
+_LOCK_SAMPLED_VALUES = ("lock-acquire-wait", "lock-release-hold")
+# Values that are estimated from the sampled allocations, and rounded when
+# the profile is built.
+_ROUNDED_VALUES = ("alloc-samples", "alloc-space")
+
+
 @attr.s
 class _PprofConverter(object):
-    """Convert stacks generated by a Profiler to pprof format."""
+    """Convert events generated by a Profiler to pprof format.
+
+    The events are folded in the samples of the profile one at a time, so
+    that they can be converted as they are recorded.
+    """
 
-    # Those attributes will be serialize in a `pprof_pb2.Profile`
+    # Those attributes will be serialize in a `pprof_ProfileType`
     _functions = attr.ib(
         init=False, factory=dict, type=typing.Dict[typing.Tuple[str, typing.Optional[str]], pprof_FunctionType]
     )
     _locations = attr.ib(init=False, factory=dict, type=typing.Dict[typing.Tuple[str, int, str], pprof_LocationType])
     _string_table = attr.ib(init=False, factory=_StringTable)
 
+    # Locations of the stacks already converted, by identity of their frames:
+    # the stacks collected by the stack collector are interned, so the same
+    # tuple of frames is shared by all the samples of a stack.
+    _stack_locations = attr.ib(
+        init=False,
+        factory=dict,
+        repr=False,
+        type=typing.Dict[int, typing.Tuple[HashableStackTraceType, int, typing.Tuple[int, ...]]],
+    )
+
     _last_location_id = attr.ib(init=False, factory=lambda: itertools.count(1))
     _last_func_id = attr.ib(init=False, factory=lambda: itertools.count(1))
 
@@ -184,7 +526,20 @@ class _PprofConverter(object):
         factory=lambda: collections.defaultdict(lambda: collections.defaultdict(lambda: 0)),
         init=False,
         repr=False,
-        type=typing.DefaultDict[_Location_Key_T, typing.DefaultDict[str, int]],
+        type=typing.DefaultDict[_Location_Key_T, typing.DefaultDict[str, float]],
+    )
+
+    # Sum of the sampling periods of the stack samples, and their number
+    _sum_period = attr.ib(init=False, default=0, repr=False, type=int)
+    _nb_event = attr.ib(init=False, default=0, repr=False, type=int)
+
+    # Sum of the sampling percentages of the lock events, and their number,
+    # by the value they are used to scale
+    _lock_sampling = attr.ib(
+        init=False,
+        factory=lambda: collections.defaultdict(lambda: [0.0, 0]),
+        repr=False,
+        type=typing.DefaultDict[str, typing.List[float]],
     )
 
     def _to_Function(
@@ -195,7 +550,7 @@ class _PprofConverter(object):
         try:
             return self._functions[(filename, funcname)]
         except KeyError:
-            func = pprof_pb2.Function(
+            func = pprof_FunctionType(
                 id=next(self._last_func_id),
                 name=self._str(funcname),
                 filename=self._str(filename),
@@ -212,10 +567,10 @@ class _PprofConverter(object):
         try:
             return self._locations[(filename, lineno, funcname)]
         except KeyError:
-            location = pprof_pb2.Location(
+            location = pprof_LocationType(
                 id=next(self._last_location_id),
                 line=[
-                    pprof_pb2.Line(
+                    pprof_LineType(
                         function_id=self._to_Function(filename, funcname).id,
                         line=lineno,
                     ),
@@ -234,6 +589,19 @@ class _PprofConverter(object):
         nframes,  # type: int
     ):
         # type: (...) -> typing.Tuple[int, ...]
+        # DEV: only interned stacks are cached, the other ones are not shared
+        # by events and would be kept alive until the profile is exported.
+        interned = type(frames) is tuple
+        if interned:
+            try:
+                stack = self._stack_locations[id(frames)]
+            except KeyError:
+                pass
+            else:
+                # The frames are kept alive by the cache, so their id can not be reused
+                if stack[0] is frames and stack[1] == nframes:
+                    return stack[2]
+
         locations = [
             self._to_Location(filename, lineno, funcname).id for filename, lineno, funcname, class_name in frames
         ]
@@ -244,73 +612,53 @@ class _PprofConverter(object):
                 self._to_Location("", 0, "<%d frame%s omitted>" % (omitted, ("s" if omitted > 1 else ""))).id
             )
 
-        return tuple(locations)
+        stack_locations = tuple(locations)
+        if interned:
+            self._stack_locations[id(frames)] = (frames, nframes, stack_locations)
+        return stack_locations
 
-    def convert_stack_event(
-        self,
-        thread_id,  # type: str
-        thread_native_id,  # type: str
-        thread_name,  # type: str
-        task_id,  # type: str
-        task_name,  # type: str
-        local_root_span_id,  # type: str
-        span_id,  # type: str
-        trace_resource,  # type: str
-        trace_type,  # type: str
-        frames,  # type: HashableStackTraceType
-        nframes,  # type: int
-        samples,  # type: typing.List[stack_event.StackSampleEvent]
-    ):
-        # type: (...) -> None
+    def convert_stack_event(self, event: stack_event.StackSampleEvent) -> None:
         location_key = (
-            self._to_locations(frames, nframes),
+            self._to_locations(event.frames, event.nframes),
             (
-                ("thread id", thread_id),
-                ("thread native id", thread_native_id),
-                ("thread name", thread_name),
-                ("task id", task_id),
-                ("task name", task_name),
-                ("local root span id", local_root_span_id),
-                ("span id", span_id),
-                ("trace endpoint", trace_resource),
-                ("trace type", trace_type),
-                ("class name", frames[0][3]),
+                ("thread id", _none_to_str(event.thread_id)),
+                ("thread native id", _none_to_str(event.thread_native_id)),
+                ("thread name", _get_thread_name(event.thread_id, event.thread_name)),
+                ("task id", _none_to_str(event.task_id)),
+                ("task name", _none_to_str(event.task_name)),
+                ("local root span id", _none_to_str(event.local_root_span_id)),
+                ("span id", _none_to_str(event.span_id)),
+                ("trace endpoint", _get_event_trace_resource(event)),
+                ("trace type", _none_to_str(event.trace_type)),
+                ("class name", event.frames[0][3]),
             ),
         )
 
-        self._location_values[location_key]["cpu-samples"] = len(samples)
-        self._location_values[location_key]["cpu-time"] = sum(s.cpu_time_ns for s in samples)
-        self._location_values[location_key]["wall-time"] = sum(s.wall_time_ns for s in samples)
+        values = self._location_values[location_key]
+        values["cpu-samples"] += 1
+        values["cpu-time"] += event.cpu_time_ns
+        values["wall-time"] += event.wall_time_ns
 
-    def convert_memalloc_event(
-        self,
-        thread_id,  # type: str
-        thread_native_id,  # type: str
-        thread_name,  # type: str
-        frames,  # type: HashableStackTraceType
-        nframes,  # type: int
-        events,  # type: typing.List[memalloc.MemoryAllocSampleEvent]
-    ):
-        # type: (...) -> None
+        self._sum_period += event.sampling_period
+        self._nb_event += 1
+
+    def convert_memalloc_event(self, event: memalloc.MemoryAllocSampleEvent) -> None:
         location_key = (
-            self._to_locations(frames, nframes),
+            self._to_locations(event.frames, event.nframes),
             (
-                ("thread id", thread_id),
-                ("thread native id", thread_native_id),
-                ("thread name", thread_name),
+                ("thread id", _none_to_str(event.thread_id)),
+                ("thread native id", _none_to_str(event.thread_native_id)),
+                ("thread name", _get_thread_name(event.thread_id, event.thread_name)),
             ),
         )
 
-        self._location_values[location_key]["alloc-samples"] = round(
-            sum(event.nevents * (event.capture_pct / 100.0) for event in events)
-        )
-        self._location_values[location_key]["alloc-space"] = round(
-            sum(event.size / event.capture_pct * 100.0 for event in events)
-        )
+        values = self._location_values[location_key]
+        values["alloc-samples"] += event.nevents * (event.capture_pct / 100.0)
+        values["alloc-space"] += event.size / event.capture_pct * 100.0
 
     def convert_memalloc_heap_event(self, event: memalloc.MemoryHeapSampleEvent) -> None:
         location_key = (
-            self._to_locations(tuple(event.frames), event.nframes),
+            self._to_locations(event.frames, event.nframes),
             (
                 ("thread id", _none_to_str(event.thread_id)),
                 ("thread native id", _none_to_str(event.thread_native_id)),
@@ -320,112 +668,95 @@ class _PprofConverter(object):
 
         self._location_values[location_key]["heap-space"] += event.size
 
-    def convert_lock_acquire_event(
-        self,
-        lock_name,  # type: str
-        thread_id,  # type: str
-        thread_name,  # type: str
-        task_id,  # type: str
-        task_name,  # type: str
-        local_root_span_id,  # type: str
-        span_id,  # type: str
-        trace_resource,  # type: str
-        trace_type,  # type: str
-        frames,  # type: HashableStackTraceType
-        nframes,  # type: int
-        events,  # type: typing.List[_lock.LockAcquireEvent]
-        sampling_ratio,  # type: float
-    ):
-        # type: (...) -> None
-        location_key = (
-            self._to_locations(frames, nframes),
+    def _lock_event_location_key(self, event: _lock.LockEventBase) -> _Location_Key_T:
+        return (
+            self._to_locations(event.frames, event.nframes),
             (
-                ("thread id", thread_id),
-                ("thread name", thread_name),
-                ("task id", task_id),
-                ("task name", task_name),
-                ("local root span id", local_root_span_id),
-                ("span id", span_id),
-                ("trace endpoint", trace_resource),
-                ("trace type", trace_type),
-                ("lock name", lock_name),
-                ("class name", frames[0][3]),
+                ("thread id", _none_to_str(event.thread_id)),
+                ("thread name", _get_thread_name(event.thread_id, event.thread_name)),
+                ("task id", _none_to_str(event.task_id)),
+                ("task name", _none_to_str(event.task_name)),
+                ("local root span id", _none_to_str(event.local_root_span_id)),
+                ("span id", _none_to_str(event.span_id)),
+                ("trace endpoint", _get_event_trace_resource(event)),
+                ("trace type", _none_to_str(event.trace_type)),
+                ("lock name", _none_to_str(event.lock_name)),
+                ("class name", event.frames[0][3]),
             ),
         )
 
-        self._location_values[location_key]["lock-acquire"] = len(events)
-        self._location_values[location_key]["lock-acquire-wait"] = int(
-            sum(e.wait_time_ns for e in events) / sampling_ratio
-        )
+    def convert_lock_acquire_event(self, event: _lock.LockAcquireEvent) -> None:
+        values = self._location_values[self._lock_event_location_key(event)]
+        values["lock-acquire"] += 1
+        values["lock-acquire-wait"] += event.wait_time_ns
 
-    def convert_lock_release_event(
-        self,
-        lock_name,  # type: str
-        thread_id,  # type: str
-        thread_name,  # type: str
-        task_id,  # type: str
-        task_name,  # type: str
-        local_root_span_id,  # type: str
-        span_id,  # type: str
-        trace_resource,  # type: str
-        trace_type,  # type: str
-        frames,  # type: HashableStackTraceType
-        nframes,  # type: int
-        events,  # type: typing.List[_lock.LockReleaseEvent]
-        sampling_ratio,  # type: float
-    ):
-        # type: (...) -> None
+        sampling = self._lock_sampling["lock-acquire-wait"]
+        sampling[0] += event.sampling_pct
+        sampling[1] += 1
+
+    def convert_lock_release_event(self, event: _lock.LockReleaseEvent) -> None:
+        values = self._location_values[self._lock_event_location_key(event)]
+        values["lock-release"] += 1
+        values["lock-release-hold"] += event.locked_for_ns
+
+        sampling = self._lock_sampling["lock-release-hold"]
+        sampling[0] += event.sampling_pct
+        sampling[1] += 1
+
+    def convert_lock_site_event(self, event: _lock.LockSiteEvent) -> None:
         location_key = (
-            self._to_locations(frames, nframes),
+            self._to_locations(event.frames, event.nframes),
             (
-                ("thread id", thread_id),
-                ("thread name", thread_name),
-                ("task id", task_id),
-                ("task name", task_name),
-                ("local root span id", local_root_span_id),
-                ("span id", span_id),
-                ("trace endpoint", trace_resource),
-                ("trace type", trace_type),
-                ("lock name", lock_name),
-                ("class name", frames[0][3]),
+                ("lock name", _none_to_str(event.lock_name)),
+                ("class name", event.frames[0][3]),
             ),
         )
-
-        self._location_values[location_key]["lock-release"] = len(events)
-        self._location_values[location_key]["lock-release-hold"] = int(
-            sum(e.locked_for_ns for e in events) / sampling_ratio
-        )
-
-    def convert_stack_exception_event(
-        self,
-        thread_id: str,
-        thread_native_id: str,
-        thread_name: str,
-        local_root_span_id: str,
-        span_id: str,
-        trace_resource: str,
-        trace_type: str,
-        frames: HashableStackTraceType,
-        nframes: int,
-        exc_type_name: str,
-        events: typing.List[stack_event.StackExceptionSampleEvent],
-    ) -> None:
+        values = self._location_values[location_key]
+        values["lock-acquire"] += event.acquire_count
+        values["lock-acquire-wait"] += event.wait_time_ns
+        values["lock-release"] += event.release_count
+        values["lock-release-hold"] += event.locked_for_ns
+
+        # Each captured acquire and release weighs as much as an event
+        sampling = self._lock_sampling["lock-acquire-wait"]
+        sampling[0] += event.sampling_pct * event.acquire_count
+        sampling[1] += event.acquire_count
+        sampling = self._lock_sampling["lock-release-hold"]
+        sampling[0] += event.sampling_pct * event.release_count
+        sampling[1] += event.release_count
+
+    def convert_stack_exception_event(self, event: stack_event.StackExceptionSampleEvent) -> None:
+        exc_type = event.exc_type
         location_key = (
-            self._to_locations(frames, nframes),
+            self._to_locations(event.frames, event.nframes),
             (
-                ("thread id", thread_id),
-                ("thread native id", thread_native_id),
-                ("thread name", thread_name),
-                ("local root span id", local_root_span_id),
-                ("span id", span_id),
-                ("trace endpoint", trace_resource),
-                ("trace type", trace_type),
-                ("exception type", exc_type_name),
-                ("class name", frames[0][3]),
+                ("thread id", _none_to_str(event.thread_id)),
+                ("thread native id", _none_to_str(event.thread_native_id)),
+                ("thread name", _get_thread_name(event.thread_id, event.thread_name)),
+                ("local root span id", _none_to_str(event.local_root_span_id)),
+                ("span id", _none_to_str(event.span_id)),
+                ("trace endpoint", _get_event_trace_resource(event)),
+                ("trace type", _none_to_str(event.trace_type)),
+                ("exception type", exc_type.__module__ + "." + exc_type.__name__),
+                ("class name", event.frames[0][3]),
             ),
         )
 
-        self._location_values[location_key]["exception-samples"] = len(events)
+        self._location_values[location_key]["exception-samples"] += 1
+
+    def convert_events(self, events: typing.Sequence[event.Event]) -> None:
+        """Fold events of the same type in the samples of the profile.
+
+        Events of a type that is not exported are ignored.
+        """
+        if not events:
+            return
+        try:
+            convert = _EVENT_CONVERTERS[events[0].__class__]
+        except KeyError:
+            return
+        for e in events:
+            convert(self, e)
 
     def _build_libraries(self) -> typing.List[Package]:
         return [
@@ -449,43 +780,69 @@ class _PprofConverter(object):
             )
         ] + STDLIB
 
+    def _sample_values(
+        self,
+        values: typing.Dict[str, float],
+        sample_types: typing.Tuple[typing.Tuple[str, str], ...],
+        sampling_ratios: typing.Dict[str, float],
+    ) -> typing.List[int]:
+        sample_values = []
+        for sample_type_name, unit in sample_types:
+            value = values.get(sample_type_name, 0)
+            if sample_type_name in sampling_ratios:
+                value = int(value / sampling_ratios[sample_type_name])
+            elif sample_type_name in _ROUNDED_VALUES:
+                value = round(value)
+            sample_values.append(value)
+        return sample_values
+
     def _build_profile(
         self,
         start_time_ns: int,
         duration_ns: int,
-        period: typing.Optional[int],
         sample_types: typing.Tuple[typing.Tuple[str, str], ...],
         program_name: str,
     ) -> pprof_ProfileType:
         pprof_sample_type = [
-            pprof_pb2.ValueType(type=self._str(type_), unit=self._str(unit)) for type_, unit in sample_types
+            pprof_ValueType(type=self._str(type_), unit=self._str(unit)) for type_, unit in sample_types
         ]
 
+        # The average sampling ratio of the lock events
+        sampling_ratios = {
+            value_name: sum_pct / (count * 100.0)
+            for value_name, (sum_pct, count) in self._lock_sampling.items()
+            if count
+        }
+
         sample = [
-            pprof_pb2.Sample(
+            pprof_SampleType(
                 location_id=locations,
-                value=[values.get(sample_type_name, 0) for sample_type_name, unit in sample_types],
-                label=[pprof_pb2.Label(key=self._str(key), str=self._str(s)) for key, s in labels],
+                value=self._sample_values(values, sample_types, sampling_ratios),
+                label=[pprof_LabelType(key=self._str(key), str=self._str(s)) for key, s in labels],
             )
             for (locations, labels), values in six.iteritems(self._location_values)
         ]
 
-        period_type = pprof_pb2.ValueType(type=self._str("time"), unit=self._str("nanoseconds"))
+        period = None  # type: typing.Optional[int]
+        if self._nb_event:
+            period = int(self._sum_period / self._nb_event)
+
+        period_type = pprof_ValueType(type=self._str("time"), unit=self._str("nanoseconds"))
 
         # WARNING: no code should use _str() here as once the _string_table is serialized below,
         # it won't be updated if you call _str later in the code here
-        return pprof_pb2.Profile(
+        return pprof_ProfileType(
             sample_type=pprof_sample_type,
             sample=sample,
             mapping=[
-                pprof_pb2.Mapping(
+                pprof_Mapping(
                     id=1,
                     filename=self._str(program_name),
                 ),
             ],
-            location=self._locations.values(),
-            function=self._functions.values(),
-            string_table=self._string_table,
+            location=list(self._locations.values()),
+            function=list(self._functions.values()),
+            string_table=list(self._string_table),
             time_nanos=start_time_ns,
             duration_nanos=duration_ns,
             period=period,
@@ -493,140 +850,52 @@ class _PprofConverter(object):
         )
 
 
-# Use this format because CPython does not support the class style declaration
-StackEventGroupKey = typing.NamedTuple(
-    "StackEventGroupKey",
-    [
-        ("thread_id", str),
-        ("thread_native_id", str),
-        ("thread_name", str),
-        ("task_id", str),
-        ("task_name", str),
-        ("local_root_span_id", str),
-        ("span_id", str),
-        ("trace_resource", str),
-        ("trace_type", str),
-        ("frames", HashableStackTraceType),
-        ("nframes", int),
-    ],
-)
-
+# The events converted to pprof, by type. Only the events of these exact types
+# are exported.
+_EVENT_CONVERTERS = {
+    stack_event.StackSampleEvent: _PprofConverter.convert_stack_event,
+    stack_event.StackExceptionSampleEvent: _PprofConverter.convert_stack_exception_event,
+    _lock.LockAcquireEvent: _PprofConverter.convert_lock_acquire_event,
+    _lock.LockReleaseEvent: _PprofConverter.convert_lock_release_event,
+    _lock.LockSiteEvent: _PprofConverter.convert_lock_site_event,
+}  # type: typing.Dict[typing.Type[event.Event], typing.Callable[[_PprofConverter, typing.Any], None]]
 
-LockEventGroupKey = typing.NamedTuple(
-    "LockEventGroupKey",
-    [
-        ("lock_name", str),
-        ("thread_id", str),
-        ("thread_name", str),
-        ("task_id", str),
-        ("task_name", str),
-        ("local_root_span_id", str),
-        ("span_id", str),
-        ("trace_resource", str),
-        ("trace_type", str),
-        ("frames", HashableStackTraceType),
-        ("nframes", int),
-    ],
-)
-
-
-StackExceptionEventGroupKey = typing.NamedTuple(
-    "StackExceptionEventGroupKey",
-    [
-        ("thread_id", str),
-        ("thread_native_id", str),
-        ("thread_name", str),
-        ("local_root_span_id", str),
-        ("span_id", str),
-        ("trace_resource", str),
-        ("trace_type", str),
-        ("frames", HashableStackTraceType),
-        ("nframes", int),
-        ("exc_type_name", str),
-    ],
-)
+if memalloc._memalloc:
+    _EVENT_CONVERTERS[memalloc.MemoryAllocSampleEvent] = _PprofConverter.convert_memalloc_event
+    _EVENT_CONVERTERS[memalloc.MemoryHeapSampleEvent] = _PprofConverter.convert_memalloc_heap_event
 
 
 @attr.s
-class PprofExporter(exporter.Exporter):
-    """Export recorder events to pprof format."""
+class PprofAggregator(object):
+    """Aggregate events in pprof samples as they are recorded.
 
-    enable_code_provenance = attr.ib(default=True, type=bool)
+    Once set as the aggregator of a :class:`ddtrace.profiling.recorder.Recorder`,
+    the events that can be exported to pprof are converted as soon as they are
+    pushed, instead of being kept until the profile is exported. When the
+    recorder is reset, the samples of the period are handed over to the
+    exporters, which only have to serialize them.
+    """
 
-    def _stack_event_group_key(self, event: event.StackBasedEvent) -> StackEventGroupKey:
-        return StackEventGroupKey(
-            _none_to_str(event.thread_id),
-            _none_to_str(event.thread_native_id),
-            _get_thread_name(event.thread_id, event.thread_name),
-            _none_to_str(event.task_id),
-            _none_to_str(event.task_name),
-            _none_to_str(event.local_root_span_id),
-            _none_to_str(event.span_id),
-            self._get_event_trace_resource(event),
-            _none_to_str(event.trace_type),
-            # TODO: store this as a tuple directly?
-            tuple(event.frames),
-            event.nframes,
-        )
+    event_types = frozenset(_EVENT_CONVERTERS)
 
-    def _group_stack_events(
-        self, events: typing.Iterable[event.StackBasedEvent]
-    ) -> typing.Iterator[typing.Tuple[StackEventGroupKey, typing.Iterator[event.StackBasedEvent]]]:
-        return groupby(events, self._stack_event_group_key)
+    _converter = attr.ib(init=False, factory=_PprofConverter, repr=False)
 
-    def _lock_event_group_key(
-        self,
-        event: _lock.LockEventBase,
-    ) -> LockEventGroupKey:
-        return LockEventGroupKey(
-            _none_to_str(event.lock_name),
-            _none_to_str(event.thread_id),
-            _get_thread_name(event.thread_id, event.thread_name),
-            _none_to_str(event.task_id),
-            _none_to_str(event.task_name),
-            _none_to_str(event.local_root_span_id),
-            _none_to_str(event.span_id),
-            self._get_event_trace_resource(event),
-            _none_to_str(event.trace_type),
-            tuple(event.frames),
-            event.nframes,
-        )
+    def push_events(self, events: typing.Sequence[event.Event]) -> None:
+        """Fold events of the same type in the samples of the profile."""
+        self._converter.convert_events(events)
 
-    def _group_lock_events(
-        self, events: typing.Iterable[_lock.LockEventBase]
-    ) -> typing.Iterator[typing.Tuple[LockEventGroupKey, typing.Iterator[_lock.LockEventBase]]]:
-        return groupby(events, self._lock_event_group_key)
+    def reset(self) -> _PprofConverter:
+        """Start a new profile and return the samples of the current one."""
+        converter = self._converter
+        self._converter = _PprofConverter()
+        return converter
 
-    def _stack_exception_group_key(self, event: stack_event.StackExceptionSampleEvent) -> StackExceptionEventGroupKey:
-        exc_type = event.exc_type
-        exc_type_name = exc_type.__module__ + "." + exc_type.__name__
-
-        return StackExceptionEventGroupKey(
-            _none_to_str(event.thread_id),
-            _none_to_str(event.thread_native_id),
-            _get_thread_name(event.thread_id, event.thread_name),
-            _none_to_str(event.local_root_span_id),
-            _none_to_str(event.span_id),
-            self._get_event_trace_resource(event),
-            _none_to_str(event.trace_type),
-            tuple(event.frames),
-            event.nframes,
-            exc_type_name,
-        )
 
-    def _group_stack_exception_events(
-        self, events: typing.Iterable[stack_event.StackExceptionSampleEvent]
-    ) -> typing.Iterator[
-        typing.Tuple[StackExceptionEventGroupKey, typing.Iterator[stack_event.StackExceptionSampleEvent]]
-    ]:
-        return groupby(events, self._stack_exception_group_key)
+@attr.s
+class PprofExporter(exporter.Exporter):
+    """Export recorder events to pprof format."""
 
-    def _get_event_trace_resource(self, event: event.StackBasedEvent) -> str:
-        trace_resource = ""
-        # Do not export trace_resource for non Web spans for privacy concerns.
-        if event.trace_resource_container and event.trace_type == ext.SpanTypes.WEB:
-            (trace_resource,) = event.trace_resource_container
-        return ensure_str(trace_resource, errors="backslashreplace")
+    enable_code_provenance = attr.ib(default=True, type=bool)
 
     def export(
         self, events: recorder.EventsType, start_time_ns: int, end_time_ns: int
@@ -636,159 +905,18 @@ class PprofExporter(exporter.Exporter):
         :param events: The event dictionary from a `ddtrace.profiling.recorder.Recorder`.
         :param start_time_ns: The start time of recording.
         :param end_time_ns: The end time of recording.
-        :return: A protobuf Profile object.
+        :return: A pprof Profile object.
         """
         program_name = config.get_application_name() or "<unknown program>"
 
-        sum_period = 0
-        nb_event = 0
-
-        converter = _PprofConverter()
-
-        # Handle StackSampleEvent
-        stack_events = []
-        for event in events.get(stack_event.StackSampleEvent, []):  # type: ignore[call-overload]
-            stack_events.append(event)
-            sum_period += event.sampling_period
-            nb_event += 1
-
-        for (
-            (
-                thread_id,
-                thread_native_id,
-                thread_name,
-                task_id,
-                task_name,
-                local_root_span_id,
-                span_id,
-                trace_resource,
-                trace_type,
-                frames,
-                nframes,
-            ),
-            grouped_stack_events,
-        ) in self._group_stack_events(stack_events):
-            converter.convert_stack_event(
-                thread_id,
-                thread_native_id,
-                thread_name,
-                task_id,
-                task_name,
-                local_root_span_id,
-                span_id,
-                trace_resource,
-                trace_type,
-                frames,
-                nframes,
-                list(typing.cast(typing.Iterator[stack_event.StackSampleEvent], grouped_stack_events)),
-            )
-
-        # Handle Lock events
-        for event_class, convert_fn in (
-            (_lock.LockAcquireEvent, converter.convert_lock_acquire_event),
-            (_lock.LockReleaseEvent, converter.convert_lock_release_event),
-        ):
-            lock_events = events.get(event_class, [])  # type: ignore[call-overload]
-            sampling_sum_pct = sum(event.sampling_pct for event in lock_events)
-
-            if lock_events:
-                sampling_ratio_avg = sampling_sum_pct / (len(lock_events) * 100.0)
-
-                for (
-                    lock_name,
-                    thread_id,
-                    thread_name,
-                    task_id,
-                    task_name,
-                    local_root_span_id,
-                    span_id,
-                    trace_resource,
-                    trace_type,
-                    frames,
-                    nframes,
-                ), l_events in self._group_lock_events(lock_events):
-                    convert_fn(  # type: ignore[operator]
-                        lock_name,
-                        thread_id,
-                        thread_name,
-                        task_id,
-                        task_name,
-                        local_root_span_id,
-                        span_id,
-                        trace_resource,
-                        trace_type,
-                        frames,
-                        nframes,
-                        list(l_events),
-                        sampling_ratio_avg,
-                    )
-
-        for (
-            (
-                thread_id,
-                thread_native_id,
-                thread_name,
-                local_root_span_id,
-                span_id,
-                trace_resource,
-                trace_type,
-                frames,
-                nframes,
-                exc_type_name,
-            ),
-            se_events,
-        ) in self._group_stack_exception_events(
-            events.get(stack_event.StackExceptionSampleEvent, [])  # type: ignore[call-overload]
-        ):
-            converter.convert_stack_exception_event(
-                thread_id,
-                thread_native_id,
-                thread_name,
-                local_root_span_id,
-                span_id,
-                trace_resource,
-                trace_type,
-                frames,
-                nframes,
-                exc_type_name,
-                list(typing.cast(typing.Iterator[stack_event.StackExceptionSampleEvent], se_events)),
-            )
-
-        if memalloc._memalloc:
-            for (
-                (
-                    thread_id,
-                    thread_native_id,
-                    thread_name,
-                    task_id,
-                    task_name,
-                    local_root_span_id,
-                    span_id,
-                    trace_resource,
-                    trace_type,
-                    frames,
-                    nframes,
-                ),
-                memalloc_events,
-            ) in self._group_stack_events(
-                events.get(memalloc.MemoryAllocSampleEvent, [])  # type: ignore[call-overload]
-            ):
-                converter.convert_memalloc_event(
-                    thread_id,
-                    thread_native_id,
-                    thread_name,
-                    frames,
-                    nframes,
-                    list(typing.cast(typing.Iterator[memalloc.MemoryAllocSampleEvent], memalloc_events)),
-                )
-
-            for event in events.get(memalloc.MemoryHeapSampleEvent, []):  # type: ignore[call-overload]
-                converter.convert_memalloc_heap_event(event)
-
-        # Compute some metadata
-        period = None  # type: typing.Optional[int]
-        if nb_event:
-            period = int(sum_period / nb_event)
+        aggregated = events.get(PprofAggregator)  # type: ignore[call-overload]
+        if aggregated:
+            # The events have been converted by the aggregator of the recorder
+            (converter,) = aggregated
+        else:
+            converter = _PprofConverter()
+            for event_class in _EVENT_CONVERTERS:
+                converter.convert_events(events.get(event_class, []))  # type: ignore[call-overload]
 
         duration_ns = end_time_ns - start_time_ns
 
@@ -809,7 +937,6 @@ class PprofExporter(exporter.Exporter):
         profile = converter._build_profile(
             start_time_ns=start_time_ns,
             duration_ns=duration_ns,
-            period=period,
             sample_types=sample_types,
             program_name=program_name,
         )
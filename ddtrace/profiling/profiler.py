@@ -26,6 +26,7 @@ from ddtrace.profiling.collector import stack_event
 from ddtrace.profiling.collector import threading
 from ddtrace.profiling.exporter import file
 from ddtrace.profiling.exporter import http
+from ddtrace.profiling.exporter import pprof
 from ddtrace.settings.profiling import config
 
 from . import _asyncio
@@ -125,6 +126,7 @@ class _ProfilerInstance(service.Service):
         default=None,
         type=scheduler.Scheduler,
     )
+    _aggregation_scheduler = attr.ib(init=False, default=None, type=Optional[scheduler.AggregationScheduler])
     _lambda_function_name = attr.ib(
         init=False, factory=lambda: os.environ.get("AWS_LAMBDA_FUNCTION_NAME"), type=Optional[str]
     )
@@ -186,7 +188,17 @@ class _ProfilerInstance(service.Service):
         # type: (...) -> None
         # Allow to store up to 10 threads for 60 seconds at 50 Hz
         max_stack_events = 10 * 60 * 50
+
+        exporters = self._build_default_exporters()
+
+        # The events can only be aggregated as they are recorded if they are all exported to pprof
+        if config.streaming_aggregation and exporters and all(isinstance(e, pprof.PprofExporter) for e in exporters):
+            aggregator = pprof.PprofAggregator()  # type: Optional[pprof.PprofAggregator]
+        else:
+            aggregator = None
+
         r = self._recorder = recorder.Recorder(
+            aggregator=aggregator,
             max_events={
                 stack_event.StackSampleEvent: max_stack_events,
                 stack_event.StackExceptionSampleEvent: int(max_stack_events / 2),
@@ -230,8 +242,6 @@ class _ProfilerInstance(service.Service):
         if self._memory_collector_enabled:
             self._collectors.append(memalloc.MemoryCollector(r))
 
-        exporters = self._build_default_exporters()
-
         if exporters:
             if self._lambda_function_name is None:
                 scheduler_class = scheduler.Scheduler
@@ -239,6 +249,9 @@ class _ProfilerInstance(service.Service):
                 scheduler_class = scheduler.ServerlessScheduler
             self._scheduler = scheduler_class(recorder=r, exporters=exporters, before_flush=self._collectors_snapshot)
 
+        if aggregator is not None:
+            self._aggregation_scheduler = scheduler.AggregationScheduler(recorder=r)
+
     def _collectors_snapshot(self):
         for c in self._collectors:
             try:
@@ -275,6 +288,9 @@ class _ProfilerInstance(service.Service):
                 collectors.append(col)
         self._collectors = collectors
 
+        if self._aggregation_scheduler is not None:
+            self._aggregation_scheduler.start()
+
         if self._scheduler is not None:
             self._scheduler.start()
 
@@ -284,6 +300,12 @@ class _ProfilerInstance(service.Service):
 
         :param flush: Flush a last profile.
         """
+        if self._aggregation_scheduler is not None:
+            # The events left are aggregated when the recorder is reset
+            self._aggregation_scheduler.stop()
+            if join:
+                self._aggregation_scheduler.join()
+
         if self._scheduler is not None:
             self._scheduler.stop()
             # Wait for the export to be over: export might need collectors (e.g., for snapshot) so we can't stop
@@ -37,8 +37,24 @@ class Recorder(object):
     max_events = attr.ib(factory=dict, type=typing.Dict[typing.Type[event.Event], typing.Optional[int]])
     """A dict of {event_type_class: max events} to limit the number of events to record."""
 
+    aggregator = attr.ib(default=None, repr=False, eq=False)
+    """An object aggregating the events of the types listed in its `event_types` attribute.
+
+    The events of these types are queued as they are pushed and passed to its `push_events` method by `aggregate`,
+    outside of the threads pushing them. They are not stored by the recorder. When the recorder is reset, the
+    aggregated data returned by its `reset` method is stored in the events under the type of the aggregator.
+    """
+
     events = attr.ib(init=False, repr=False, eq=False, type=EventsType)
     _events_lock = attr.ib(init=False, repr=False, factory=threading.Lock, eq=False)
+    # Number of events queued for the aggregator since the last reset, by event type
+    _aggregated_counts = attr.ib(init=False, repr=False, factory=dict, eq=False, type=typing.Dict[type, int])
+    # Events waiting to be passed to the aggregator
+    _pending_events = attr.ib(
+        init=False, repr=False, factory=list, eq=False, type=typing.List[typing.Sequence[event.Event]]
+    )
+    # Held while passing events to the aggregator, always before _events_lock
+    _aggregator_lock = attr.ib(init=False, repr=False, factory=threading.Lock, eq=False)
 
     def __attrs_post_init__(self):
         # type: (...) -> None
@@ -71,10 +87,46 @@ class Recorder(object):
         """
         if events:
             event_type = events[0].__class__
+            aggregator = self.aggregator
+            if aggregator is not None and event_type in aggregator.event_types:
+                # Only queue the events: they are pushed by application threads, e.g. while acquiring a lock, and
+                # are aggregated later on by the thread calling aggregate.
+                with self._events_lock:
+                    self._queue_aggregated_events(event_type, events)
+                return
             with self._events_lock:
                 q = self.events[event_type]
                 q.extend(events)
 
+    def _queue_aggregated_events(self, event_type, events):
+        # Keep the same limit on the number of events as when they are stored.
+        # Aggregated events can not be evicted, so the most recent ones are dropped instead.
+        max_events = self.max_events.get(event_type, self.default_max_events)
+        count = self._aggregated_counts.get(event_type, 0)
+        if max_events is not None:
+            if count >= max_events:
+                return
+            events = events[: max_events - count]
+        self._aggregated_counts[event_type] = count + len(events)
+        self._pending_events.append(events)
+
+    def _pop_pending_events(self):
+        # type: (...) -> typing.List[typing.Sequence[event.Event]]
+        # Must be called with _events_lock held
+        pending_events, self._pending_events = self._pending_events, []
+        return pending_events
+
+    def aggregate(self):
+        # type: (...) -> None
+        """Pass the events queued since the last call to the aggregator, if any."""
+        aggregator = self.aggregator
+        if aggregator is not None:
+            with self._aggregator_lock:
+                with self._events_lock:
+                    pending_events = self._pop_pending_events()
+                for events in pending_events:
+                    aggregator.push_events(events)
+
     def _get_deque_for_event_type(self, event_type):
         return collections.deque(maxlen=self.max_events.get(event_type, self.default_max_events))
 
@@ -89,7 +141,20 @@ class Recorder(object):
 
         :return: The list of events that has been removed.
         """
-        with self._events_lock:
-            events = self.events
-            self._reset_events()
+        if self.aggregator is None:
+            with self._events_lock:
+                events = self.events
+                self._reset_events()
+            return events
+
+        with self._aggregator_lock:
+            with self._events_lock:
+                events = self.events
+                self._reset_events()
+                self._aggregated_counts = {}
+                pending_events = self._pop_pending_events()
+            # The events queued before the reset belong to this profile
+            for e in pending_events:
+                self.aggregator.push_events(e)
+            events[type(self.aggregator)] = [self.aggregator.reset()]
         return events
@@ -97,3 +97,19 @@ class ServerlessScheduler(Scheduler):
                 self._profiled_intervals = 0
         else:
             self._profiled_intervals += 1
+
+
+@attr.s
+class AggregationScheduler(periodic.PeriodicService):
+    """Schedule the aggregation of the events queued in the recorder.
+
+    This keeps the aggregation of the events off the threads recording them, and the number of events waiting to be
+    aggregated low between two exports.
+    """
+
+    recorder = attr.ib()
+    _interval = attr.ib(type=float, default=1.0)
+
+    def periodic(self):
+        # type: (...) -> None
+        self.recorder.aggregate()
@@ -13,6 +13,7 @@ from ..constants import AUTO_KEEP
 from ..constants import AUTO_REJECT
 from ..constants import USER_KEEP
 from ..context import Context
+from ..internal._headers import HeaderCollector
 from ..internal._tagset import TagsetDecodeError
 from ..internal._tagset import TagsetEncodeError
 from ..internal._tagset import TagsetMaxSizeDecodeError
@@ -68,15 +69,25 @@ POSSIBLE_HTTP_HEADER_TRACE_IDS = _possible_header(HTTP_HEADER_TRACE_ID)
 POSSIBLE_HTTP_HEADER_PARENT_IDS = _possible_header(HTTP_HEADER_PARENT_ID)
 POSSIBLE_HTTP_HEADER_SAMPLING_PRIORITIES = _possible_header(HTTP_HEADER_SAMPLING_PRIORITY)
 POSSIBLE_HTTP_HEADER_ORIGIN = _possible_header(HTTP_HEADER_ORIGIN)
-_POSSIBLE_HTTP_HEADER_TAGS = frozenset([_HTTP_HEADER_TAGS, get_wsgi_header(_HTTP_HEADER_TAGS).lower()])
-_POSSIBLE_HTTP_HEADER_B3_SINGLE_HEADER = _possible_header(_HTTP_HEADER_B3_SINGLE)
-_POSSIBLE_HTTP_HEADER_B3_TRACE_IDS = _possible_header(_HTTP_HEADER_B3_TRACE_ID)
-_POSSIBLE_HTTP_HEADER_B3_SPAN_IDS = _possible_header(_HTTP_HEADER_B3_SPAN_ID)
-_POSSIBLE_HTTP_HEADER_B3_SAMPLEDS = _possible_header(_HTTP_HEADER_B3_SAMPLED)
-_POSSIBLE_HTTP_HEADER_B3_FLAGS = _possible_header(_HTTP_HEADER_B3_FLAGS)
-_POSSIBLE_HTTP_HEADER_TRACEPARENT = _possible_header(_HTTP_HEADER_TRACEPARENT)
-_POSSIBLE_HTTP_HEADER_TRACESTATE = _possible_header(_HTTP_HEADER_TRACESTATE)
 
+# Finds all the headers used by the propagation styles in one pass over the
+# carrier, whether it is a header dict, a WSGI environ, or an ASGI header list
+_HEADER_COLLECTOR = HeaderCollector(
+    [
+        HTTP_HEADER_TRACE_ID,
+        HTTP_HEADER_PARENT_ID,
+        HTTP_HEADER_SAMPLING_PRIORITY,
+        HTTP_HEADER_ORIGIN,
+        _HTTP_HEADER_TAGS,
+        _HTTP_HEADER_B3_SINGLE,
+        _HTTP_HEADER_B3_TRACE_ID,
+        _HTTP_HEADER_B3_SPAN_ID,
+        _HTTP_HEADER_B3_SAMPLED,
+        _HTTP_HEADER_B3_FLAGS,
+        _HTTP_HEADER_TRACEPARENT,
+        _HTTP_HEADER_TRACESTATE,
+    ]
+)
 
 # https://www.w3.org/TR/trace-context/#traceparent-header-field-values
 # Future proofing: The traceparent spec is additive, future traceparent versions may contain more than 4 values
@@ -94,14 +105,8 @@ _TRACEPARENT_HEX_REGEX = re.compile(
     re.VERBOSE,
 )
 
-
-def _extract_header_value(possible_header_names, headers, default=None):
-    # type: (FrozenSet[str], Dict[str, str], Optional[str]) -> Optional[str]
-    for header in possible_header_names:
-        if header in headers:
-            return ensure_str(headers[header], errors="backslashreplace")
-
-    return default
+# tracestate values MUST only contain ASCII characters in the range of 0x20 to 0x7E
+_TRACESTATE_INVALID_CHARS_REGEX = re.compile(r"[^\x20-\x7E]")
 
 
 def _hex_id_to_dd_id(hex_id):
@@ -209,7 +214,7 @@ class _DatadogMultiHeader:
     @staticmethod
     def _extract(headers):
         # type: (Dict[str, str]) -> Optional[Context]
-        trace_id_str = _extract_header_value(POSSIBLE_HTTP_HEADER_TRACE_IDS, headers)
+        trace_id_str = headers.get(HTTP_HEADER_TRACE_ID)
         if trace_id_str is None:
             return None
         try:
@@ -223,26 +228,12 @@ class _DatadogMultiHeader:
             )
             return None
 
-        parent_span_id = _extract_header_value(
-            POSSIBLE_HTTP_HEADER_PARENT_IDS,
-            headers,
-            default="0",
-        )
-        sampling_priority = _extract_header_value(
-            POSSIBLE_HTTP_HEADER_SAMPLING_PRIORITIES,
-            headers,
-        )
-        origin = _extract_header_value(
-            POSSIBLE_HTTP_HEADER_ORIGIN,
-            headers,
-        )
+        parent_span_id = headers.get(HTTP_HEADER_PARENT_ID, "0")
+        sampling_priority = headers.get(HTTP_HEADER_SAMPLING_PRIORITY)
+        origin = headers.get(HTTP_HEADER_ORIGIN)
 
         meta = None
-        tags_value = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_TAGS,
-            headers,
-            default="",
-        )
+        tags_value = headers.get(_HTTP_HEADER_TAGS, "")
         if tags_value:
             # Do not fail if the tags are malformed
             try:
@@ -377,25 +368,13 @@ class _B3MultiHeader:
     @staticmethod
     def _extract(headers):
         # type: (Dict[str, str]) -> Optional[Context]
-        trace_id_val = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_B3_TRACE_IDS,
-            headers,
-        )
+        trace_id_val = headers.get(_HTTP_HEADER_B3_TRACE_ID)
         if trace_id_val is None:
             return None
 
-        span_id_val = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_B3_SPAN_IDS,
-            headers,
-        )
-        sampled = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_B3_SAMPLEDS,
-            headers,
-        )
-        flags = _extract_header_value(
-            _POSSIBLE_HTTP_HEADER_B3_FLAGS,
-            headers,
-        )
+        span_id_val = headers.get(_HTTP_HEADER_B3_SPAN_ID)
+        sampled = headers.get(_HTTP_HEADER_B3_SAMPLED)
+        flags = headers.get(_HTTP_HEADER_B3_FLAGS)
 
         # Try to parse values into their expected types
         try:
@@ -480,20 +459,32 @@ class _B3SingleHeader:
             return
 
         single_header = "{}-{}".format(_dd_id_to_b3_id(span_context.trace_id), _dd_id_to_b3_id(span_context.span_id))
+        single_header += _B3SingleHeader._sampling_state(span_context)
+        headers[_HTTP_HEADER_B3_SINGLE] = single_header
+
+    @staticmethod
+    def _sampling_state(span_context):
+        # type: (Context) -> str
         sampling_priority = span_context.sampling_priority
         if sampling_priority is not None:
             if sampling_priority <= 0:
-                single_header += "-0"
+                return "-0"
             elif sampling_priority == 1:
-                single_header += "-1"
+                return "-1"
             elif sampling_priority > 1:
-                single_header += "-d"
-        headers[_HTTP_HEADER_B3_SINGLE] = single_header
+                return "-d"
+        return ""
+
+    @staticmethod
+    def _format(span_context):
+        # type: (Context) -> str
+        """Return the header value with a ``{0:016x}`` placeholder for a 64 bits span id."""
+        return "%s-{0:016x}%s" % (_dd_id_to_b3_id(span_context.trace_id), _B3SingleHeader._sampling_state(span_context))
 
     @staticmethod
     def _extract(headers):
         # type: (Dict[str, str]) -> Optional[Context]
-        single_header = _extract_header_value(_POSSIBLE_HTTP_HEADER_B3_SINGLE_HEADER, headers)
+        single_header = headers.get(_HTTP_HEADER_B3_SINGLE)
         if not single_header:
             return None
 
@@ -711,7 +702,7 @@ class _TraceContext:
         # type: (Dict[str, str]) -> Optional[Context]
 
         try:
-            tp = _extract_header_value(_POSSIBLE_HTTP_HEADER_TRACEPARENT, headers)
+            tp = headers.get(_HTTP_HEADER_TRACEPARENT)
             if tp is None:
                 log.debug("no traceparent header")
                 return None
@@ -722,7 +713,7 @@ class _TraceContext:
         origin = None
         meta = {W3C_TRACEPARENT_KEY: tp}  # type: _MetaDictType
 
-        ts = _extract_header_value(_POSSIBLE_HTTP_HEADER_TRACESTATE, headers)
+        ts = headers.get(_HTTP_HEADER_TRACESTATE)
 
         if ts:
             # whitespace is allowed, but whitespace to start or end values should be trimmed
@@ -731,7 +722,7 @@ class _TraceContext:
             ts = ",".join(ts_l)
             # the value MUST contain only ASCII characters in the
             # range of 0x20 to 0x7E
-            if re.search(r"[^\x20-\x7E]+", ts):
+            if _TRACESTATE_INVALID_CHARS_REGEX.search(ts):
                 log.debug("received invalid tracestate header: %r", ts)
             else:
                 # store tracestate so we keep other vendor data for injection, even if dd ends up being invalid
@@ -822,6 +813,34 @@ class HTTPPropagator(object):
             log.debug("tried to inject invalid context %r", span_context)
             return
 
+        span_id = span_context.span_id
+        if span_id > _MAX_UINT_64BITS:
+            # The header formats expect a 64 bits span id
+            HTTPPropagator._inject(span_context, headers)
+            return
+
+        # The headers only depend on the trace, apart from the ones holding the span id, so they
+        # are rendered once and reused by all the outbound requests of the trace
+        # DEV: The styles are copied, so that the key does not change with the configuration
+        key = (
+            span_context.trace_id,
+            tuple(config._propagation_style_inject),
+            config._x_datadog_tags_enabled,
+            config._x_datadog_tags_max_length,
+        )
+        templates = span_context._get_propagation_cache(key)
+        if templates is None:
+            templates = HTTPPropagator._render_templates(span_context)
+            span_context._set_propagation_cache(key, templates)
+
+        trace_headers, span_header_formats = templates
+        headers.update(trace_headers)
+        for header, header_format in span_header_formats:
+            headers[header] = header_format.format(span_id)
+
+    @staticmethod
+    def _inject(span_context, headers):
+        # type: (Context, Dict[str, str]) -> None
         if PROPAGATION_STYLE_DATADOG in config._propagation_style_inject:
             _DatadogMultiHeader._inject(span_context, headers)
         if PROPAGATION_STYLE_B3 in config._propagation_style_inject:
@@ -831,6 +850,29 @@ class HTTPPropagator(object):
         if _PROPAGATION_STYLE_W3C_TRACECONTEXT in config._propagation_style_inject:
             _TraceContext._inject(span_context, headers)
 
+    @staticmethod
+    def _render_templates(span_context):
+        # type: (Context) -> Tuple[Dict[str, str], List[Tuple[str, str]]]
+        """Return the headers that only depend on the trace, and the formats of
+        the headers that hold the span id.
+        """
+        trace_headers = {}  # type: Dict[str, str]
+        HTTPPropagator._inject(span_context, trace_headers)
+
+        span_header_formats = []  # type: List[Tuple[str, str]]
+        if HTTP_HEADER_PARENT_ID in trace_headers:
+            span_header_formats.append((HTTP_HEADER_PARENT_ID, "{0}"))
+        if _HTTP_HEADER_B3_SPAN_ID in trace_headers:
+            span_header_formats.append((_HTTP_HEADER_B3_SPAN_ID, "{0:016x}"))
+        if _HTTP_HEADER_B3_SINGLE in trace_headers:
+            span_header_formats.append((_HTTP_HEADER_B3_SINGLE, _B3SingleHeader._format(span_context)))
+        if _HTTP_HEADER_TRACEPARENT in trace_headers:
+            span_header_formats.append((_HTTP_HEADER_TRACEPARENT, span_context._traceparent_format))
+
+        for header, _ in span_header_formats:
+            del trace_headers[header]
+        return trace_headers, span_header_formats
+
     @staticmethod
     def extract(headers):
         # type: (Dict[str,str]) -> Context
@@ -848,6 +890,10 @@ class HTTPPropagator(object):
                 with tracer.trace('my_controller') as span:
                     span.set_tag('http.url', url)
 
+        The headers can also be a WSGI environ, or a list of ``(name, value)``
+        pairs like the ``headers`` of an ASGI scope, where names and values may
+        be bytes.
+
         :param dict headers: HTTP headers to extract tracing attributes.
         :return: New `Context` with propagated attributes.
         """
@@ -855,7 +901,9 @@ class HTTPPropagator(object):
             return Context()
 
         try:
-            normalized_headers = {name.lower(): v for name, v in headers.items()}
+            normalized_headers = _HEADER_COLLECTOR.collect(headers)
+            if not normalized_headers:
+                return Context()
 
             # loop through the extract propagation styles specified in order
             for prop_style in config._propagation_style_extract:
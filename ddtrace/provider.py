@@ -19,6 +19,24 @@ log = get_logger(__name__)
 _DD_CONTEXTVAR = contextvars.ContextVar(
     "datadog_contextvar", default=None
 )  # type: contextvars.ContextVar[Optional[Union[Context, Span]]]
+# Generation of the span of _DD_CONTEXTVAR when it was activated, see Span._reuse
+_DD_GENERATION_CONTEXTVAR = contextvars.ContextVar(
+    "datadog_generation_contextvar", default=0
+)  # type: contextvars.ContextVar[int]
+
+
+def _get_active_item():
+    # type: () -> Optional[Union[Context, Span]]
+    """Return the item of the context variable, unless it is a span that was
+    reused by the span pool since it was activated.
+
+    A span is only reused once its whole trace has finished, so there is no
+    active span left in that case.
+    """
+    item = _DD_CONTEXTVAR.get()
+    if isinstance(item, Span) and item._generation != _DD_GENERATION_CONTEXTVAR.get():
+        return None
+    return item
 
 
 class BaseContextProvider(six.with_metaclass(abc.ABCMeta)):
@@ -96,9 +114,11 @@ class DatadogContextMixin(object):
         The active span is updated to be the span's parent if the span has
         finished until an unfinished span is found.
         """
-        if span.finished:
-            new_active = span  # type: Optional[Span]
-            while new_active and new_active.finished:
+        # DEV: ``duration_ns`` is checked rather than the ``finished``
+        # property as this is called every time the active span is read.
+        if span.duration_ns is not None:
+            new_active = span._parent  # type: Optional[Span]
+            while new_active is not None and new_active.duration_ns is not None:
                 new_active = new_active._parent
             self.activate(new_active)
             return new_active
@@ -120,19 +140,24 @@ class DefaultContextProvider(BaseContextProvider, DatadogContextMixin):
     def _has_active_context(self):
         # type: () -> bool
         """Returns whether there is an active context in the current execution."""
-        ctx = _DD_CONTEXTVAR.get()
+        ctx = _get_active_item()
         return ctx is not None
 
     def activate(self, ctx):
         # type: (Optional[Union[Span, Context]]) -> None
         """Makes the given context active in the current execution."""
         _DD_CONTEXTVAR.set(ctx)
+        if isinstance(ctx, Span):
+            _DD_GENERATION_CONTEXTVAR.set(ctx._generation)
         super(DefaultContextProvider, self).activate(ctx)
 
     def active(self):
         # type: () -> Optional[Union[Context, Span]]
         """Returns the active span or context for the current execution."""
-        item = _DD_CONTEXTVAR.get()
-        if isinstance(item, Span):
+        item = _get_active_item()
+        # The active span is only finished when it was finished in another
+        # execution, since finishing the active span activates its closest
+        # unfinished ancestor. Skip the update otherwise.
+        if isinstance(item, Span) and item.duration_ns is not None:
             return self._update_active(item)
         return item
@@ -218,7 +218,7 @@ class DatadogSampler(RateByServiceSampler):
     provided. It is not used when the agent supplied sample rates are used.
     """
 
-    __slots__ = ("limiter", "rules")
+    __slots__ = ("limiter", "_rules", "_matcher")
 
     NO_RATE_LIMIT = -1
     DEFAULT_RATE_LIMIT = 100
@@ -254,8 +254,6 @@ class DatadogSampler(RateByServiceSampler):
         if rate_limit is None:
             rate_limit = int(os.getenv("DD_TRACE_RATE_LIMIT", default=self.DEFAULT_RATE_LIMIT))
 
-        # Ensure rules is a list
-        self.rules = []  # type: List[SamplingRule]
         if rules is None:
             env_sampling_rules = os.getenv("DD_TRACE_SAMPLING_RULES")
             if env_sampling_rules:
@@ -272,6 +270,8 @@ class DatadogSampler(RateByServiceSampler):
         if default_sample_rate is not None:
             self.rules.append(SamplingRule(sample_rate=default_sample_rate))
 
+        self._matcher = None  # type: Optional[_SamplingRuleMatcher]
+
         # Configure rate limiter
         self.limiter = RateLimiter(rate_limit)
 
@@ -332,6 +332,37 @@ class DatadogSampler(RateByServiceSampler):
 
         update_sampling_decision(span.context, SamplingMechanism.TRACE_SAMPLING_RULE, sampled)
 
+    @property
+    def rules(self):
+        # type: () -> List[SamplingRule]
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules):
+        # type: (List[SamplingRule]) -> None
+        self._rules = _SamplingRules(rules)
+        self._matcher = None
+
+    def _match_rule(self, span):
+        # type: (Span) -> Optional[SamplingRule]
+        rules = self._rules
+        if not rules:
+            return None
+
+        matcher = self._matcher
+        # DEV: ``rules`` is a public list that can be changed after the sampler is created,
+        #      so the compiled matcher is rebuilt whenever its version changes.
+        if matcher is None or matcher.version != rules.version:
+            if not _SamplingRuleMatcher.supports(rules):
+                # Custom rules may match on more than the service and name of the span
+                for rule in rules:
+                    if rule.matches(span):
+                        return rule
+                return None
+            matcher = self._matcher = _SamplingRuleMatcher(rules)
+
+        return matcher.match(span)
+
     def sample(self, span):
         # type: (Span) -> bool
         """
@@ -344,23 +375,13 @@ class DatadogSampler(RateByServiceSampler):
         :returns: Whether the span was sampled or not
         :rtype: :obj:`bool`
         """
-        # If there are rules defined, then iterate through them and find one that wants to sample
-        sampler = None  # type: Optional[Union[SamplingRule, RateLimiter]]
-
-        # Go through all rules and grab the first one that matched
+        # Grab the first rule that matches
         # DEV: This means rules should be ordered by the user from most specific to least specific
-        for rule in self.rules:
-            if rule.matches(span):
-                sampler = rule
-                break
-        else:
+        sampler = self._match_rule(span)  # type: Optional[Union[SamplingRule, RateLimiter]]
+        if sampler is None:
             # No rules matches so use agent based sampling
             return super(DatadogSampler, self).sample(span)
 
-        # DEV: This should never happen, but since the type is Optional we have to check
-        if not sampler:
-            raise SamplingError("No sampling rule found for span {!r} from {!r}".format(span, self))
-
         sampled = sampler.sample(span)
         self._set_sampler_decision(span, sampler, sampled)
 
@@ -526,3 +547,150 @@ class SamplingRule(BaseSampler):
             raise TypeError("Cannot compare SamplingRule to {}".format(type(other)))
 
         return self.sample_rate == other.sample_rate and self.service == other.service and self.name == other.name
+
+
+class _SamplingRules(list):
+    """List of the sampling rules of a :class:`DatadogSampler`.
+
+    Every change to the list increments its ``version``, so that the sampler
+    can tell whether its matcher is up to date without comparing the rules.
+    """
+
+    version = 0
+
+
+def _versioned(name):
+    method = getattr(list, name)
+
+    def _mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    _mutate.__name__ = name
+    return _mutate
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__setslice__",
+    "__delslice__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "reverse",
+    "sort",
+):
+    if hasattr(list, _name):
+        setattr(_SamplingRules, _name, _versioned(_name))
+
+
+class _SamplingRuleMatcher(object):
+    """Find the first :class:`SamplingRule` of a list that matches a span.
+
+    Rules comparing ``service`` and ``name`` to plain values are indexed in
+    dictionaries, so that only the rules using a regular expression or a
+    function have to be evaluated in order. The rule picked for each
+    ``(service, name)`` pair is cached, as most applications only ever report
+    a handful of distinct root spans.
+    """
+
+    __slots__ = ("rules", "version", "_exact", "_by_service", "_by_name", "_catch_all", "_patterns", "_decisions")
+
+    # Cap on the number of cached decisions, the cache is reset when it is full
+    MAX_DECISIONS = 1024
+
+    def __init__(self, rules):
+        # type: (_SamplingRules) -> None
+        # Keep a copy, the rules of the sampler can change while matching
+        self.rules = list(rules)
+        self.version = rules.version
+        self._exact = {}  # type: Dict[Tuple[Any, Any], int]
+        self._by_service = {}  # type: Dict[Any, int]
+        self._by_name = {}  # type: Dict[Any, int]
+        self._catch_all = None  # type: Optional[int]
+        self._patterns = []  # type: List[Tuple[int, SamplingRule]]
+        self._decisions = {}  # type: Dict[Tuple[Optional[str], str], Optional[SamplingRule]]
+
+        for index, rule in enumerate(self.rules):
+            service, name = rule.service, rule.name
+            if not (self._is_literal(service) and self._is_literal(name)):
+                self._patterns.append((index, rule))
+            elif service is not SamplingRule.NO_RULE and name is not SamplingRule.NO_RULE:
+                self._exact.setdefault((service, name), index)
+            elif service is not SamplingRule.NO_RULE:
+                self._by_service.setdefault(service, index)
+            elif name is not SamplingRule.NO_RULE:
+                self._by_name.setdefault(name, index)
+            elif self._catch_all is None:
+                self._catch_all = index
+
+    @staticmethod
+    def _is_literal(pattern):
+        # type: (Any) -> bool
+        if pattern is SamplingRule.NO_RULE:
+            return True
+        if callable(pattern) or isinstance(pattern, pattern_type):
+            return False
+        try:
+            hash(pattern)
+        except TypeError:
+            return False
+        return True
+
+    @staticmethod
+    def supports(rules):
+        # type: (List[SamplingRule]) -> bool
+        """Return whether the rules only rely on the standard matching logic."""
+        overrides = ("matches", "_matches", "_pattern_matches")
+        for rule in rules:
+            for cls in type(rule).__mro__:
+                if cls is SamplingRule:
+                    break
+                if any(attr in cls.__dict__ for attr in overrides):
+                    return False
+        return True
+
+    def _find(self, key):
+        # type: (Tuple[Optional[str], str]) -> Optional[SamplingRule]
+        service, name = key
+        candidates = [
+            i
+            for i in (
+                self._exact.get(key),
+                self._by_service.get(service),
+                self._by_name.get(name),
+                self._catch_all,
+            )
+            if i is not None
+        ]
+        best = min(candidates) if candidates else None
+
+        # Only the rules that come before the best indexed one can take precedence
+        for index, rule in self._patterns:
+            if best is not None and index > best:
+                break
+            if rule._pattern_matches(service, rule.service) and rule._pattern_matches(name, rule.name):
+                return rule
+
+        return self.rules[best] if best is not None else None
+
+    def match(self, span):
+        # type: (Span) -> Optional[SamplingRule]
+        """Return the first rule matching the span, if any."""
+        key = (span.service, span.name)
+        try:
+            return self._decisions[key]
+        except KeyError:
+            pass
+
+        rule = self._find(key)
+        if len(self._decisions) >= self.MAX_DECISIONS:
+            self._decisions.clear()
+        self._decisions[key] = rule
+        return rule
@@ -240,6 +240,9 @@ class Config(object):
 
         self._128_bit_trace_id_logging_enabled = asbool(os.getenv("DD_TRACE_128_BIT_TRACEID_LOGGING_ENABLED", False))
 
+        self._span_pool_enabled = asbool(os.getenv("DD_TRACE_SPAN_POOL_ENABLED", False))
+        self._span_pool_size = int(os.getenv("DD_TRACE_SPAN_POOL_SIZE", 1024))
+
         # Propagation styles
         self._propagation_style_extract = self._propagation_style_inject = _parse_propagation_styles(
             "DD_TRACE_PROPAGATION_STYLE", default=_PROPAGATION_STYLE_DEFAULT
@@ -88,6 +88,16 @@ class ProfilingConfig(En):
         help="",
     )
 
+    streaming_aggregation = En.v(
+        bool,
+        "streaming_aggregation",
+        default=False,
+        help_type="Boolean",
+        help="Whether to aggregate the recorded events in pprof samples as they are collected, instead of keeping "
+        "them in memory until they are exported. This bounds the memory used by the profiler to the number of "
+        "distinct samples rather than the number of events",
+    )
+
     upload_interval = En.v(
         float,
         "upload_interval",
@@ -131,6 +141,16 @@ class ProfilingConfig(En):
         "statistics. Must be greater than 0 and lesser or equal to 100",
     )
 
+    adaptive_thread_sampling = En.v(
+        bool,
+        "adaptive_thread_sampling",
+        default=False,
+        help_type="Boolean",
+        help="Whether the stack profiler samples only some of the threads at each collection, in order to stay "
+        "within its maximum time usage at its maximum sampling rate however many threads are running. The threads "
+        "are sampled in turn, and the ones using CPU more often",
+    )
+
     api_timeout = En.v(
         float,
         "api_timeout",
@@ -167,6 +187,19 @@ class ProfilingConfig(En):
             help="",
         )
 
+    class Lock(En):
+        __item__ = __prefix__ = "lock"
+
+        aggregation = En.v(
+            bool,
+            "aggregation",
+            default=False,
+            help_type="Boolean",
+            help="Whether to aggregate the lock usage by acquisition site in the lock profiler, instead of recording "
+            "an event for each sampled acquire and release. The thread and trace information of the acquires is then "
+            "not reported",
+        )
+
     class Heap(En):
         __item__ = __prefix__ = "heap"
 
@@ -58,6 +58,14 @@ def _get_64_lowest_order_bits_as_int(large_int):
     return _MAX_UINT_64BITS & large_int
 
 
+def _intern_key(key):
+    # type: (_TagNameType) -> _TagNameType
+    """Intern native string tag keys so that the same key set on many spans shares a single object."""
+    if type(key) is str:
+        return six.moves.intern(key)
+    return key
+
+
 def _get_64_highest_order_bits_as_hex(large_int):
     # type: (int) -> str
     """Get the 64 highest order bits from a 128bit integer"""
@@ -74,9 +82,9 @@ class Span(object):
         "span_id",
         "trace_id",
         "parent_id",
-        "_meta",
+        "_meta_dict",
         "error",
-        "_metrics",
+        "_metrics_dict",
         "_store",
         "span_type",
         "start_ns",
@@ -89,6 +97,8 @@ class Span(object):
         "_parent",
         "_ignored_exceptions",
         "_on_finish_callbacks",
+        "_in_writer",
+        "_generation",
         "__weakref__",
     ]
 
@@ -127,6 +137,60 @@ class Span(object):
         :param object context: the Context of the span.
         :param on_finish: list of functions called when the span finishes.
         """
+        self._start(name, service, resource, span_type, trace_id, span_id, parent_id, start, context, on_finish)
+
+        # tags / metadata
+        # DEV: the tag dictionaries are only allocated when the first tag is set,
+        # leaf spans without tags are common and do not need to pay for them.
+        self._meta_dict = None  # type: Optional[_MetaDictType]
+        self._metrics_dict = None  # type: Optional[_MetricDictType]
+
+        self._parent = None  # type: Optional[Span]
+        self._ignored_exceptions = None  # type: Optional[List[Exception]]
+        self._local_root = None  # type: Optional[Span]
+        self._store = None  # type: Optional[Dict[str, Any]]
+        # Number of times the span was reused by the span pool
+        self._generation = 0  # type: int
+
+    def _reuse(
+        self,
+        name,  # type: str
+        service,  # type: Optional[str]
+        resource,  # type: Optional[str]
+        span_type,  # type: Optional[str]
+        trace_id,  # type: Optional[int]
+        span_id,  # type: Optional[int]
+        parent_id,  # type: Optional[int]
+        start,  # type: Optional[int]
+        context,  # type: Optional[Context]
+        on_finish,  # type: Optional[List[Callable[[Span], None]]]
+    ):
+        # type: (...) -> None
+        """Start a span reclaimed by the span pool again, as if it was created
+        with the given arguments.
+
+        The span pool has already reset the other attributes, and emptied the
+        tag dictionaries so that they can be reused. The generation of the
+        span is incremented, so that the references to its previous use can
+        tell that it was reused.
+        """
+        self._generation += 1
+        self._start(name, service, resource, span_type, trace_id, span_id, parent_id, start, context, on_finish)
+
+    def _start(
+        self,
+        name,  # type: str
+        service,  # type: Optional[str]
+        resource,  # type: Optional[str]
+        span_type,  # type: Optional[str]
+        trace_id,  # type: Optional[int]
+        span_id,  # type: Optional[int]
+        parent_id,  # type: Optional[int]
+        start,  # type: Optional[int]
+        context,  # type: Optional[Context]
+        on_finish,  # type: Optional[List[Callable[[Span], None]]]
+    ):
+        # type: (...) -> None
         # pre-conditions
         if not (span_id is None or isinstance(span_id, six.integer_types)):
             raise TypeError("span_id must be an integer")
@@ -138,13 +202,11 @@ class Span(object):
         # required span info
         self.name = name
         self.service = service
+        # DEV: the resource list is always a new one, as the profiler may
+        # still reference the one of a span reused by the span pool.
         self._resource = [resource or name]
         self.span_type = span_type
-
-        # tags / metadata
-        self._meta = {}  # type: _MetaDictType
         self.error = 0
-        self._metrics = {}  # type: _MetricDictType
 
         # timing
         self.start_ns = time_ns() if start is None else int(start * 1e9)  # type: int
@@ -165,10 +227,8 @@ class Span(object):
         self.sampled = True  # type: bool
 
         self._context = context._with_span(self) if context else None  # type: Optional[Context]
-        self._parent = None  # type: Optional[Span]
-        self._ignored_exceptions = None  # type: Optional[List[Exception]]
-        self._local_root = None  # type: Optional[Span]
-        self._store = None  # type: Optional[Dict[str, Any]]
+        # Set while the writer may still reference the span, see SpanPool
+        self._in_writer = False  # type: bool
 
     def _ignore_exception(self, exc):
         # type: (Exception) -> None
@@ -195,6 +255,32 @@ class Span(object):
             return None
         return self._store.get(key)
 
+    @property
+    def _meta(self):
+        # type: () -> _MetaDictType
+        meta = self._meta_dict
+        if meta is None:
+            meta = self._meta_dict = {}
+        return meta
+
+    @_meta.setter
+    def _meta(self, value):
+        # type: (_MetaDictType) -> None
+        self._meta_dict = value
+
+    @property
+    def _metrics(self):
+        # type: () -> _MetricDictType
+        metrics = self._metrics_dict
+        if metrics is None:
+            metrics = self._metrics_dict = {}
+        return metrics
+
+    @_metrics.setter
+    def _metrics(self, value):
+        # type: (_MetricDictType) -> None
+        self._metrics_dict = value
+
     @property
     def _trace_id_64bits(self):
         return _get_64_lowest_order_bits_as_int(self.trace_id)
@@ -355,9 +441,9 @@ class Span(object):
             return
 
         try:
-            self._meta[key] = stringify(value)
-            if key in self._metrics:
-                del self._metrics[key]
+            self._meta[_intern_key(key)] = stringify(value)
+            if self._metrics_dict and key in self._metrics_dict:
+                del self._metrics_dict[key]
         except Exception:
             log.warning("error setting tag %s, ignoring it", key, exc_info=True)
 
@@ -368,26 +454,52 @@ class Span(object):
         U+FFFD.
         """
         try:
-            self._meta[key] = ensure_text(value, errors="replace")
+            self._meta[_intern_key(key)] = ensure_text(value, errors="replace")
         except Exception as e:
             if config._raise:
                 raise e
             log.warning("Failed to set text tag '%s'", key, exc_info=True)
 
+    def _set_tags_str(self, tags):
+        # type: (Dict[_TagNameType, Text]) -> None
+        """Set several text tags at once.
+
+        This is a bulk version of :meth:`set_tag_str` for integrations that
+        build tags with known string names: the names are not checked for
+        special handling like in :meth:`set_tag`. Values are coerced like in
+        :meth:`set_tag_str`.
+        """
+        if not tags:
+            return
+        meta = self._meta
+        for key, value in tags.items():
+            key = _intern_key(key)
+            if type(value) is six.text_type:
+                meta[key] = value
+                continue
+            try:
+                meta[key] = ensure_text(value, errors="replace")
+            except Exception as e:
+                if config._raise:
+                    raise e
+                log.warning("Failed to set text tag '%s'", key, exc_info=True)
+
     def _remove_tag(self, key):
         # type: (_TagNameType) -> None
-        if key in self._meta:
-            del self._meta[key]
+        if self._meta_dict and key in self._meta_dict:
+            del self._meta_dict[key]
 
     def get_tag(self, key):
         # type: (_TagNameType) -> Optional[Text]
         """Return the given tag or None if it doesn't exist."""
-        return self._meta.get(key, None)
+        if self._meta_dict is None:
+            return None
+        return self._meta_dict.get(key, None)
 
     def get_tags(self):
         # type: () -> _MetaDictType
         """Return all tags."""
-        return self._meta.copy()
+        return self._meta_dict.copy() if self._meta_dict is not None else {}
 
     def set_tags(self, tags):
         # type: (_MetaDictType) -> None
@@ -426,9 +538,9 @@ class Span(object):
             log.debug("ignoring not real metric %s:%s", key, value)
             return
 
-        if key in self._meta:
-            del self._meta[key]
-        self._metrics[key] = value
+        if self._meta_dict and key in self._meta_dict:
+            del self._meta_dict[key]
+        self._metrics[_intern_key(key)] = value
 
     def set_metrics(self, metrics):
         # type: (_MetricDictType) -> None
@@ -439,12 +551,14 @@ class Span(object):
     def get_metric(self, key):
         # type: (_TagNameType) -> Optional[NumericType]
         """Return the given metric or None if it doesn't exist."""
-        return self._metrics.get(key)
+        if self._metrics_dict is None:
+            return None
+        return self._metrics_dict.get(key)
 
     def get_metrics(self):
         # type: () -> _MetricDictType
         """Return all metrics."""
-        return self._metrics.copy()
+        return self._metrics_dict.copy() if self._metrics_dict is not None else {}
 
     def set_traceback(self, limit=30):
         # type: (int) -> None
@@ -499,8 +613,8 @@ class Span(object):
             ("end", None if not self.duration else self.start + self.duration),
             ("duration", self.duration),
             ("error", self.error),
-            ("tags", dict(sorted(self._meta.items()))),
-            ("metrics", dict(sorted(self._metrics.items()))),
+            ("tags", dict(sorted(self._meta_dict.items())) if self._meta_dict else {}),
+            ("metrics", dict(sorted(self._metrics_dict.items())) if self._metrics_dict else {}),
         ]
         return " ".join(
             # use a large column width to keep pprint output on one line
@@ -36,6 +36,7 @@ from .internal.dogstatsd import get_dogstatsd_client
 from .internal.logger import get_logger
 from .internal.logger import hasHandlers
 from .internal.processor import SpanProcessor
+from .internal.processor.trace import DEFAULT_PARTIAL_FLUSH_MIN_BYTES
 from .internal.processor.trace import SpanAggregator
 from .internal.processor.trace import SpanSamplingProcessor
 from .internal.processor.trace import TopLevelSpanProcessor
@@ -48,6 +49,7 @@ from .internal.serverless import in_aws_lambda
 from .internal.serverless import in_gcp_function
 from .internal.serverless.mini_agent import maybe_start_serverless_mini_agent
 from .internal.service import ServiceStatusError
+from .internal.span_pool import SpanPool
 from .internal.utils.formats import asbool
 from .internal.writer import AgentWriter
 from .internal.writer import LogWriter
@@ -130,12 +132,14 @@ def _default_span_processors_factory(
     trace_writer,  # type: TraceWriter
     partial_flush_enabled,  # type: bool
     partial_flush_min_spans,  # type: int
+    partial_flush_min_bytes,  # type: int
     appsec_enabled,  # type: bool
     iast_enabled,  # type: bool
     compute_stats_enabled,  # type: bool
     single_span_sampling_rules,  # type: List[SpanSamplingRule]
     agent_url,  # type: str
     profiling_span_processor,  # type: EndpointCallCounterProcessor
+    span_pool=None,  # type: Optional[SpanPool]
 ):
     # type: (...) -> Tuple[List[SpanProcessor], Optional[Any]]
     # FIXME: type should be AppsecSpanProcessor but we have a cyclic import here
@@ -180,8 +184,10 @@ def _default_span_processors_factory(
         SpanAggregator(
             partial_flush_enabled=partial_flush_enabled,
             partial_flush_min_spans=partial_flush_min_spans,
+            partial_flush_min_bytes=partial_flush_min_bytes,
             trace_processors=trace_processors,
             writer=trace_writer,
+            span_pool=span_pool,
         )
     )
     return span_processors, appsec_processor
@@ -253,22 +259,31 @@ class Tracer(object):
         self._writer = writer  # type: TraceWriter
         self._partial_flush_enabled = asbool(os.getenv("DD_TRACE_PARTIAL_FLUSH_ENABLED", default=True))
         self._partial_flush_min_spans = int(os.getenv("DD_TRACE_PARTIAL_FLUSH_MIN_SPANS", default=500))
+        self._partial_flush_min_bytes = int(
+            os.getenv("DD_TRACE_PARTIAL_FLUSH_MIN_BYTES", default=DEFAULT_PARTIAL_FLUSH_MIN_BYTES)
+        )
         self._appsec_enabled = config._appsec_enabled
         # Direct link to the appsec processor
         self._appsec_processor = None
         self._iast_enabled = config._iast_enabled
         self._endpoint_call_counter_span_processor = EndpointCallCounterProcessor()
+        # Finished spans reused to start new ones, see DD_TRACE_SPAN_POOL_ENABLED
+        self._span_pool = None  # type: Optional[SpanPool]
+        if config._span_pool_enabled:
+            self._span_pool = SpanPool(config._span_pool_size)
         self._span_processors, self._appsec_processor = _default_span_processors_factory(
             self._filters,
             self._writer,
             self._partial_flush_enabled,
             self._partial_flush_min_spans,
+            self._partial_flush_min_bytes,
             self._appsec_enabled,
             self._iast_enabled,
             self._compute_stats,
             self._single_span_sampling_rules,
             self._agent_url,
             self._endpoint_call_counter_span_processor,
+            self._span_pool,
         )
 
         self._hooks = _hooks.Hooks()
@@ -499,12 +514,14 @@ class Tracer(object):
                 self._writer,
                 self._partial_flush_enabled,
                 self._partial_flush_min_spans,
+                self._partial_flush_min_bytes,
                 self._appsec_enabled,
                 self._iast_enabled,
                 self._compute_stats,
                 self._single_span_sampling_rules,
                 self._agent_url,
                 self._endpoint_call_counter_span_processor,
+                self._span_pool,
             )
 
         if context_provider is not None:
@@ -545,12 +562,14 @@ class Tracer(object):
             self._writer,
             self._partial_flush_enabled,
             self._partial_flush_min_spans,
+            self._partial_flush_min_bytes,
             self._appsec_enabled,
             self._iast_enabled,
             self._compute_stats,
             self._single_span_sampling_rules,
             self._agent_url,
             self._endpoint_call_counter_span_processor,
+            self._span_pool,
         )
 
         self._new_process = True
@@ -662,9 +681,11 @@ class Tracer(object):
         # Update the service name based on any mapping
         service = config.service_mapping.get(service, service)
 
+        new_span = Span if self._span_pool is None else self._span_pool.new_span
+
         if trace_id:
             # child_of a non-empty context, so either a local child span or from a remote context
-            span = Span(
+            span = new_span(
                 name=name,
                 context=context,
                 trace_id=trace_id,
@@ -685,7 +706,7 @@ class Tracer(object):
                 span._local_root = span
         else:
             # this is the root span of a new trace
-            span = Span(
+            span = new_span(
                 name=name,
                 context=context,
                 service=service,
@@ -766,6 +787,8 @@ class Tracer(object):
 
     def _on_span_finish(self, span):
         # type: (Span) -> None
+        # DEV: this activates the closest unfinished ancestor when the span
+        # is the active one, so that the next lookups take the fast path.
         active = self.current_span()
         # Debug check: if the finishing span has a parent and its parent
         # is not the next active span then this is an error in synchronous tracing.
@@ -2800,6 +2800,8 @@ venv = Venv(
                 # See https://github.com/workhorsy/py-cpuinfo/issues/177
                 "pytest-benchmark": latest,
                 "py-cpuinfo": "~=8.0.0",
+                # Only used to decode the exported profiles
+                "protobuf": latest,
             },
             venvs=[
                 # Python 2.7
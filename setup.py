@@ -337,9 +337,6 @@ setup(
         "enum34; python_version<'3.4'",
         "funcsigs>=1.0.0; python_version=='2.7'",
         "typing; python_version<'3.5'",
-        "protobuf>=3; python_version>='3.7'",
-        "protobuf>=3,<4.0; python_version=='3.6'",
-        "protobuf>=3,<3.18; python_version<'3.6'",
         "tenacity>=5",
         "attrs>=20; python_version>'2.7'",
         "attrs>=20,<22; python_version=='2.7'",
@@ -407,6 +404,16 @@ setup(
                 sources=["ddtrace/internal/_tagset.pyx"],
                 language="c",
             ),
+            Cython.Distutils.Extension(
+                "ddtrace.internal._headers",
+                sources=["ddtrace/internal/_headers.pyx"],
+                language="c",
+            ),
+            Cython.Distutils.Extension(
+                "ddtrace.internal._rate_limiter",
+                sources=["ddtrace/internal/_rate_limiter.pyx"],
+                language="c",
+            ),
             Extension(
                 "ddtrace.internal._encoding",
                 ["ddtrace/internal/_encoding.pyx"],
@@ -430,6 +437,11 @@ setup(
                 sources=["ddtrace/profiling/_threading.pyx"],
                 language="c",
             ),
+            Cython.Distutils.Extension(
+                "ddtrace.profiling.collector._profiled_lock",
+                sources=["ddtrace/profiling/collector/_profiled_lock.pyx"],
+                language="c",
+            ),
             Cython.Distutils.Extension(
                 "ddtrace.profiling.collector._task",
                 sources=["ddtrace/profiling/collector/_task.pyx"],
@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from ddtrace.internal.utils.cache import cached
+
+
+def resource_names(cardinality, n=10000):
+    # A few hot endpoints and a long tail of rarely seen ones, e.g. URLs with ids
+    rng = random.Random(cardinality)
+    return ["GET /users/{}".format(int(rng.paretovariate(1.0) * cardinality) % cardinality) for _ in range(n)]
+
+
+@pytest.mark.parametrize(
+    "cardinality",
+    [
+        (100),  # Everything fits in the cache
+        (1000),  # The cache holds about a quarter of the names
+        (100000),  # Most names are only seen once
+    ],
+)
+@pytest.mark.benchmark(group="lfu-cache", min_time=0.005)
+def test_cached_resource_names(benchmark, cardinality):
+    names = resource_names(cardinality)
+
+    @cached()
+    def normalize(name):
+        return name.lower()
+
+    def func():
+        for name in names:
+            normalize(name)
+
+    benchmark(func)
@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from ddtrace.internal.compat import monotonic_ns
+from ddtrace.internal.rate_limiter import RateLimiter
+
+
+@pytest.mark.parametrize("rate_limit", [100, 1000000])
+@pytest.mark.benchmark(group="rate-limiter", min_time=0.005)
+def test_rate_limiter_is_allowed(benchmark, rate_limit):
+    # With a low limit most requests are rejected, with a high one they are all allowed
+    limiter = RateLimiter(rate_limit)
+
+    def func():
+        for _ in range(1000):
+            limiter.is_allowed(monotonic_ns())
+
+    benchmark(func)
+
+
+@pytest.mark.benchmark(group="rate-limiter", min_time=0.005)
+def test_rate_limiter_is_allowed_n(benchmark):
+    limiter = RateLimiter(1000000)
+
+    def func():
+        for _ in range(100):
+            limiter.is_allowed_n(10, monotonic_ns())
+
+    benchmark(func)
+
+
+@pytest.mark.benchmark(group="rate-limiter", min_time=0.005)
+def test_rate_limiter_is_allowed_threads(benchmark):
+    limiter = RateLimiter(1000)
+
+    def check():
+        for _ in range(1000):
+            limiter.is_allowed(monotonic_ns())
+
+    def func():
+        threads = [threading.Thread(target=check) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    benchmark(func)
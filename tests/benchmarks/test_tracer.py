@@ -88,3 +88,30 @@ def test_tracer_large_trace(benchmark, tracer):
 
 def test_tracer_start_span(benchmark, tracer):
     benchmark(tracer.start_span, "benchmark")
+
+
+@pytest.mark.parametrize("depth", [1, 100])
+def test_tracer_current_span(benchmark, tracer, depth):
+    spans = [tracer.trace("span") for _ in range(depth)]
+
+    def func(tracer):
+        for _ in range(100):
+            tracer.current_span()
+
+    benchmark(func, tracer)
+    for span in reversed(spans):
+        span.finish()
+
+
+def test_tracer_current_span_nested(benchmark, tracer):
+    # Integrations look up the current span many times at each level
+    def func(tracer, level=0):
+        with tracer.trace("span"):
+            for _ in range(10):
+                tracer.current_span()
+            if level < 50:
+                func(tracer, level + 1)
+            for _ in range(10):
+                tracer.current_span()
+
+    benchmark(func, tracer)
@@ -366,8 +366,12 @@ def test_single_trace_too_large_partial_flush_disabled(encoding, monkeypatch):
                     s.set_tag("a" * 10, "b" * 10)
         t.shutdown()
 
-        calls = [mock.call("trace (%db) larger than payload buffer item limit (%db), dropping", AnyInt(), AnyInt())]
-        log.warning.assert_has_calls(calls)
+        # The trace is sent in smaller chunks rather than dropped
+        log.debug.assert_any_call(
+            "trace (%db) larger than payload buffer item limit, splitting it in %d chunks", AnyInt(), AnyInt()
+        )
+        drop = mock.call("trace (%db) larger than payload buffer item limit (%db), dropping", AnyInt(), AnyInt())
+        assert drop not in log.warning.mock_calls
         log.error.assert_not_called()
 
 
@@ -1002,8 +1006,10 @@ def test_civisibility_event_endpoints():
         with override_global_config({"_ci_visibility_code_coverage_enabled": True}):
             t = Tracer()
             t.configure(writer=CIVisibilityWriter(reuse_connections=True))
-            t._writer._conn = mock.MagicMock()
-            with mock.patch("ddtrace.internal.writer.Response.from_http_response") as from_http_response:
+            conn = mock.MagicMock()
+            with mock.patch.object(t._writer._conn_pool, "_new_connection", return_value=conn), mock.patch(
+                "ddtrace.internal.writer.Response.from_http_response"
+            ) as from_http_response:
                 from_http_response.return_value.status = 200
                 s = t.trace("operation", service="svc-no-cov")
                 s.finish()
@@ -1014,7 +1020,6 @@ def test_civisibility_event_endpoints():
                     + '{"filename": "test_module.py", "segments": [[2, 0, 2, 0, -1]]}]}',
                 )
                 span.finish()
-                conn = t._writer._conn
                 t.shutdown()
             assert conn.request.call_count == (2 if compat.PY3 else 1)
             assert conn.request.call_args_list[0].args[1] == "api/v2/citestcycle"
@@ -396,3 +396,47 @@ def test_module_watchdog_no_lazy_force_load():
         lazy.__spec__
     except AttributeError:
         pass
+
+
+@pytest.mark.subprocess
+def test_module_watchdog_lazy_origin_map():
+    import sys
+
+    from ddtrace.internal.module import ModuleWatchdog
+    from ddtrace.internal.module import origin
+
+    instance = ModuleWatchdog._instance
+
+    import tests.test_module  # noqa
+
+    # No module origin is computed on import if there are no origin hooks
+    assert instance._om is None
+
+    path = origin(sys.modules["tests.test_module"])
+    assert ModuleWatchdog.get_by_origin(path) is sys.modules["tests.test_module"]
+    assert instance._om is not None
+
+    ModuleWatchdog.uninstall()
+
+
+@pytest.mark.subprocess(env=dict(_DD_TRACE_MODULE_WATCHDOG_PROFILE="true"))
+def test_module_watchdog_import_profile():
+    from mock import mock
+
+    from ddtrace.internal import module
+    from ddtrace.internal.module import ModuleWatchdog
+
+    profile = module._import_profile
+    assert profile is not None
+
+    name = "tests.test_module"
+    hook = mock.Mock()
+    ModuleWatchdog.register_module_hook(name, hook)
+
+    __import__(name)
+
+    hook.assert_called_once()
+    assert profile.overhead[name] >= profile.hooks[name] > 0
+    assert name in profile.report()
+
+    ModuleWatchdog.uninstall()
@@ -0,0 +1,24 @@
+import pytest
+
+
+@pytest.mark.subprocess()
+def test_import_ddtrace_deferred_modules():
+    import sys
+
+    import ddtrace
+
+    ddtrace.patch_all()
+
+    # These are imported on first use, e.g. when the application imports
+    # asyncio or when the tracer starts sending traces.
+    for module in ("asyncio", "ddtrace.contrib.asyncio", "ddtrace.internal.remoteconfig.client"):
+        assert module not in sys.modules, module
+
+
+@pytest.mark.subprocess(ddtrace_run=True)
+def test_ddtrace_run_deferred_modules():
+    import sys
+
+    # The debugger is only imported when dynamic instrumentation is enabled
+    assert "ddtrace.debugging._debugger" not in sys.modules
+    assert "asyncio" not in sys.modules
@@ -1,6 +1,17 @@
+import os
+import select
+import socket
+import tempfile
+import threading
+import time
+
 import httpretty
+import mock
 import pytest
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
 
+from ddtrace.internal.utils.http import ConnectionPool
 from ddtrace.internal.utils.http import connector
 
 
@@ -15,3 +26,174 @@ def test_connector(scheme):
             response = conn.getresponse()
             assert response.status == 200
             assert response.read() == b'{"hello": "world"}'
+
+
+class _KeepAliveRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = str(self.client_address).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+class _UDSHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        BaseHTTPServer.HTTPServer.server_bind(self)
+
+
+class _TCPHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture(params=["http", "unix"])
+def keep_alive_server_url(request):
+    if request.param == "http":
+        server = _TCPHTTPServer(("127.0.0.1", 0), _KeepAliveRequestHandler)
+        url = "http://127.0.0.1:%d" % server.server_address[1]
+    else:
+        path = tempfile.mktemp()
+        server = _UDSHTTPServer(path, _KeepAliveRequestHandler)
+        url = "unix://%s" % path
+    t = threading.Thread(target=server.serve_forever)
+    t.daemon = True
+    t.start()
+    try:
+        yield url
+    finally:
+        server.shutdown()
+        server.server_close()
+        t.join()
+
+
+def _put(pool):
+    with pool.connection() as conn:
+        conn.request("PUT", "/", b"data")
+        resp = conn.getresponse()
+        assert resp.status == 200
+        resp.read()
+        return conn
+
+
+def test_connection_pool_reuse(keep_alive_server_url):
+    pool = ConnectionPool(keep_alive_server_url)
+
+    conn = _put(pool)
+    assert len(pool) == 1
+    assert _put(pool) is conn
+    assert len(pool) == 1
+
+    pool.close()
+    assert len(pool) == 0
+    assert _put(pool) is not conn
+
+
+def test_connection_pool_maxsize(keep_alive_server_url):
+    pool = ConnectionPool(keep_alive_server_url, maxsize=1)
+
+    c1 = pool.acquire()
+    c2 = pool.acquire()
+    assert c1 is not c2
+    for c in (c1, c2):
+        c.request("PUT", "/", b"data")
+        c.getresponse().read()
+    pool.release(c1)
+    pool.release(c2)
+
+    assert len(pool) == 1
+    assert c2.sock is None
+
+
+def test_connection_pool_no_reuse(keep_alive_server_url):
+    pool = ConnectionPool(keep_alive_server_url, maxsize=0)
+
+    conn = _put(pool)
+    assert len(pool) == 0
+    assert conn.sock is None
+
+
+def test_connection_pool_idle_eviction(keep_alive_server_url):
+    pool = ConnectionPool(keep_alive_server_url, max_idle_time=0.0)
+
+    conn = _put(pool)
+    assert len(pool) == 1
+    time.sleep(0.01)
+    assert _put(pool) is not conn
+    assert conn.sock is None
+
+
+def test_connection_pool_discard_closed_by_peer(keep_alive_server_url):
+    pool = ConnectionPool(keep_alive_server_url)
+
+    conn = _put(pool)
+    # Simulate the peer closing the idle connection
+    conn.sock.shutdown(socket.SHUT_RD)
+    assert _put(pool) is not conn
+
+
+def test_connection_pool_discard_on_error(keep_alive_server_url):
+    pool = ConnectionPool(keep_alive_server_url)
+
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            conn.request("PUT", "/", b"data")
+            raise ValueError()
+
+    assert len(pool) == 0
+    assert conn.sock is None
+
+
+def test_connection_pool_fork(keep_alive_server_url):
+    pool = ConnectionPool(keep_alive_server_url)
+    conn = _put(pool)
+
+    with mock.patch("os.getpid", return_value=os.getpid() + 1):
+        assert pool.acquire() is not conn
+    assert conn.sock is None
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+def test_connection_pool_fork_locked(keep_alive_server_url):
+    pool = ConnectionPool(keep_alive_server_url)
+    conn = _put(pool)
+
+    # Another thread is using the pool when the process forks
+    with pool._lock:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                with mock.patch.object(pool, "_new_connection") as new_connection:
+                    assert pool.acquire() is new_connection.return_value
+            except BaseException:
+                os._exit(1)
+            os._exit(0)
+
+    for _ in range(100):
+        child, status = os.waitpid(pid, os.WNOHANG)
+        if child:
+            break
+        time.sleep(0.05)
+    else:
+        os.kill(pid, 9)
+        os.waitpid(pid, 0)
+        pytest.fail("the child process is blocked on the lock of the pool")
+    assert os.WEXITSTATUS(status) == 0
+    assert _put(pool) is conn
+
+
+@pytest.mark.skipif(not hasattr(select, "poll"), reason="select.poll is not available")
+def test_connection_pool_high_fd(keep_alive_server_url):
+    pool = ConnectionPool(keep_alive_server_url)
+    conn = _put(pool)
+
+    # select.select cannot check the file descriptors above FD_SETSIZE
+    with mock.patch("select.select", side_effect=ValueError("filedescriptor out of range in select()")):
+        assert _put(pool) is conn
@@ -14,6 +14,7 @@ import six
 from six.moves import _thread
 
 import ddtrace  # noqa
+from ddtrace.internal import compat
 from ddtrace.profiling import _threading
 from ddtrace.profiling import recorder
 from ddtrace.profiling.collector import stack
@@ -321,7 +322,8 @@ def test_repr():
         stack.StackCollector,
         "StackCollector(status=<ServiceStatus.STOPPED: 'stopped'>, "
         "recorder=Recorder(default_max_events=16384, max_events={}), min_interval_time=0.01, max_time_usage_pct=1.0, "
-        "nframes=64, ignore_profiler=False, endpoint_collection_enabled=None, tracer=None)",
+        "nframes=64, ignore_profiler=False, endpoint_collection_enabled=None, tracer=None, "
+        "adaptive_thread_sampling=False)",
     )
 
 
@@ -339,6 +341,92 @@ def test_new_interval():
     assert new_interval == c.min_interval_time
 
 
+def test_thread_sampler_round_robin():
+    sampler = stack._ThreadSampler(threads_per_sample=2)
+    threads = [(i, i) for i in range(5)]
+    wall_times = dict.fromkeys(threads, 0)
+    sampled_at = {}
+    for tick in range(10):
+        sampled = sampler.select(dict.fromkeys(threads, 0), 10)
+        assert len(sampled) == 2
+        for key, (wall_time, cpu_time) in sampled.items():
+            wall_times[key] += wall_time
+            sampled_at.setdefault(key, []).append(tick)
+
+    # Each thread is sampled in turn, with the wall time elapsed since it was last sampled
+    assert all(len(ticks) == 4 for ticks in sampled_at.values())
+    assert all(wall_time >= 70 for wall_time in wall_times.values())
+
+
+def test_thread_sampler_cpu_time():
+    sampler = stack._ThreadSampler(threads_per_sample=1)
+    busy = (1, 1)
+    idle = [(i, i) for i in range(2, 5)]
+    counts = dict.fromkeys(idle + [busy], 0)
+    cpu_time = 0
+    for _ in range(100):
+        cpu_times = dict.fromkeys(idle, 0)
+        cpu_times[busy] = 10
+        for key, (_, thread_cpu_time) in sampler.select(cpu_times, 10).items():
+            counts[key] += 1
+            cpu_time += thread_cpu_time
+
+    # The busy thread is sampled more often, but idle threads are still sampled
+    assert counts[busy] > max(counts[key] for key in idle)
+    assert all(counts[key] > 0 for key in idle)
+    # The CPU time is accumulated until the busy thread is sampled
+    assert 900 <= cpu_time <= 1000
+
+
+def test_thread_sampler_forget_threads():
+    sampler = stack._ThreadSampler(threads_per_sample=1)
+    sampler.select({(1, 1): 0, (2, 2): 0}, 10)
+    # The thread that was not sampled stopped
+    assert sampler.select({(3, 3): 0}, 10) == {(3, 3): (10, 0)}
+    assert sampler.threads_per_sample == 1
+
+
+def test_thread_sampler_adjust():
+    sampler = stack._ThreadSampler()
+    threads = dict.fromkeys(((i, i) for i in range(10)), 0)
+
+    start = compat.monotonic_ns()
+    assert len(sampler.select(threads, 10)) == 1
+    # Sampling a thread took 10ms, 1s allows to sample all of them
+    sampler.adjust(start, compat.monotonic_ns() + 10000000, 1e9)
+    assert sampler.threads_per_sample == 10
+
+    start = compat.monotonic_ns()
+    assert len(sampler.select(threads, 10)) == 10
+    sampler.adjust(start, compat.monotonic_ns() + 100000000, 1e6)
+    assert sampler.threads_per_sample == 1
+
+
+def test_adaptive_thread_sampling():
+    r = recorder.Recorder()
+    s = stack.StackCollector(r, adaptive_thread_sampling=True)
+    s._init()
+    assert isinstance(s._thread_sampler, stack._ThreadSampler)
+
+    quit_thread = threading.Event()
+    threads = [threading.Thread(target=quit_thread.wait) for _ in range(20)]
+    for t in threads:
+        t.start()
+    try:
+        # The first collection only samples one thread, then as many as the time budget allows
+        events, _ = s.collect()
+        assert len(events) == 1
+        thread_ids = set()
+        for _ in range(100):
+            events, _ = s.collect()
+            thread_ids.update(e.thread_id for e in events)
+        assert {t.ident for t in threads} <= thread_ids
+    finally:
+        quit_thread.set()
+        for t in threads:
+            t.join()
+
+
 # Function to use for stress-test of polling
 MAX_FN_NUM = 30
 FN_TEMPLATE = """def _f{num}():
@@ -20,7 +20,7 @@ def test_repr():
         collector_threading.ThreadingLockCollector,
         "ThreadingLockCollector(status=<ServiceStatus.STOPPED: 'stopped'>, "
         "recorder=Recorder(default_max_events=16384, max_events={}), capture_pct=1.0, nframes=64, "
-        "endpoint_collection_enabled=True, tracer=None)",
+        "endpoint_collection_enabled=True, tracer=None, aggregate=False)",
     )
 
 
@@ -350,3 +350,111 @@ def test_user_threads_have_native_id():
         assert False, "Thread.native_id not set"
 
     t.join()
+
+
+def test_lock_proxy():
+    r = recorder.Recorder()
+    with collector_threading.ThreadingLockCollector(r, capture_pct=100):
+        lock = threading.Lock()
+
+    assert not lock.locked()
+    with lock:
+        assert lock.locked()
+        assert not lock.acquire(False)
+        assert not lock.acquire(timeout=0.01)
+    assert lock.acquire(blocking=False)
+    lock.release()
+
+    cond = threading.Condition(lock)
+    with cond:
+        assert not cond.wait(0.01)
+
+    # Failed attempts to acquire the lock are not recorded
+    assert len(r.events[collector_threading.ThreadingLockAcquireEvent]) == 4
+    assert len(r.events[collector_threading.ThreadingLockReleaseEvent]) == 4
+
+
+def test_lock_aggregate():
+    r = recorder.Recorder()
+    with collector_threading.ThreadingLockCollector(r, capture_pct=100, aggregate=True) as c:
+        lock = threading.Lock()
+        for _ in range(3):
+            with lock:
+                pass
+        lock.acquire()
+        lock.release()
+        (events,) = c.snapshot()
+
+    # Nothing is recorded until the collector is snapshot
+    assert len(r.events) == 0
+
+    lineno = test_lock_aggregate.__code__.co_firstlineno
+    by_line = {event.frames[0][1]: event for event in events}
+    assert sorted(by_line) == [lineno + 5, lineno + 7]
+
+    event = by_line[lineno + 5]
+    assert event.lock_name == "test_threading.py:%d" % (lineno + 3)
+    assert event.frames[0] == (__file__.replace(".pyc", ".py"), lineno + 5, "test_lock_aggregate", "")
+    assert event.nframes > 3
+    assert event.thread_id is None
+    assert event.sampling_pct == 100
+    assert event.acquire_count == event.release_count == 3
+    assert event.wait_time_ns > 0
+    assert event.locked_for_ns > 0
+
+    assert by_line[lineno + 7].acquire_count == by_line[lineno + 7].release_count == 1
+
+    # The sites are collected once
+    assert c.snapshot() == [[]]
+
+
+def test_lock_not_aggregated_snapshot():
+    r = recorder.Recorder()
+    with collector_threading.ThreadingLockCollector(r, capture_pct=100) as c:
+        with threading.Lock():
+            pass
+        assert c.snapshot() is None
+
+
+def test_lock_aggregate_held_across_snapshot():
+    r = recorder.Recorder()
+    with collector_threading.ThreadingLockCollector(r, capture_pct=100, aggregate=True) as c:
+        lock = threading.Lock()
+        lock.acquire()
+        (acquired,) = c.snapshot()
+        lock.release()
+        (released,) = c.snapshot()
+
+    (acquired,) = acquired
+    assert acquired.acquire_count == 1
+    assert acquired.release_count == 0
+
+    # The release is aggregated in the next snapshot
+    (released,) = released
+    assert released.frames is acquired.frames
+    assert released.acquire_count == 0
+    assert released.release_count == 1
+    assert released.locked_for_ns > 0
+
+
+def test_lock_aggregate_threads():
+    r = recorder.Recorder()
+    with collector_threading.ThreadingLockCollector(r, capture_pct=100, aggregate=True) as c:
+        lock = threading.Lock()
+
+        def _lock():
+            for _ in range(1000):
+                with lock:
+                    pass
+
+        threads = [threading.Thread(target=_lock) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        (events,) = c.snapshot()
+
+    # The threads share one site for the acquisition site
+    (event,) = [event for event in events if event.frames[0][2] == "_lock"]
+    assert event.acquire_count == event.release_count
+    assert 0 < event.acquire_count <= 4000
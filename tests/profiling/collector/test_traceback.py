@@ -20,3 +20,62 @@ def test_check_traceback_to_frames():
         (this_file, 7, "_x", ""),
         (this_file, 15, "test_check_traceback_to_frames", ""),
     ]
+
+
+def _stack(n):
+    if n:
+        return _stack(n - 1)
+    return sys._getframe()
+
+
+class Foo(object):
+    def stack(self):
+        return sys._getframe()
+
+
+def test_stack_table_interns_stacks():
+    table = _traceback.StackTable()
+    frame = _stack(3)
+    # DEV: only look at the frames of _stack, as the line of this function changes
+    frames, nframes = table.pyframe_to_frames(frame, 4)
+    assert isinstance(frames, tuple)
+    assert (list(frames), nframes) == _traceback.pyframe_to_frames(frame, 4)
+    assert table.pyframe_to_frames(frame, 4) == (frames, nframes)
+    assert table.pyframe_to_frames(frame, 4)[0] is frames
+    assert (table.hits, table.misses, len(table)) == (2, 1, 1)
+
+    # Another line is another stack
+    other_frames, _ = table.pyframe_to_frames(_stack(3).f_back, 4)
+    assert other_frames is not frames
+    assert len(table) == 2
+
+
+def test_stack_table_max_nframes():
+    table = _traceback.StackTable()
+    frame = _stack(10)
+    frames, nframes = table.pyframe_to_frames(frame, 5)
+    assert len(frames) == 5
+    assert nframes == _traceback.pyframe_to_frames(frame, 5)[1] > 5
+    assert table.pyframe_to_frames(frame, 5)[0] is frames
+    assert table.pyframe_to_frames(frame, 6)[0] is not frames
+
+
+def test_stack_table_class_name():
+    table = _traceback.StackTable()
+    frames, _ = table.pyframe_to_frames(Foo().stack(), 64)
+    assert frames[0][2:] == ("stack", "Foo")
+
+
+def test_stack_table_max_size():
+    table = _traceback.StackTable(max_size=2)
+    for _ in range(3):
+        table.pyframe_to_frames(_stack(0), 64)
+        table.pyframe_to_frames(_stack(1), 64)
+        table.pyframe_to_frames(_stack(2), 64)
+    assert len(table) <= 2
+    try:
+        _traceback.StackTable(max_size=0)
+    except ValueError:
+        pass
+    else:
+        assert False, "ValueError not raised"
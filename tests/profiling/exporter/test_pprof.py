@@ -5,12 +5,15 @@ import mock
 import six
 
 from ddtrace import ext
+from ddtrace.profiling import recorder
 from ddtrace.profiling.collector import _lock
 from ddtrace.profiling.collector import memalloc
 from ddtrace.profiling.collector import stack_event
 from ddtrace.profiling.exporter import _packages
 from ddtrace.profiling.exporter import pprof
 
+from .. import utils
+
 
 TEST_EVENTS = {
     stack_event.StackExceptionSampleEvent: [
@@ -797,3 +800,166 @@ def test_pprof_exporter_empty():
     export, libs = exp.export({}, 0, 1)
     assert len(libs) > 0
     assert len(export.sample) == 0
+
+
+def _samples(profile):
+    functions = {f.id: profile.string_table[f.name] for f in profile.function}
+    locations = {
+        loc.id: tuple((functions[line.function_id], line.line) for line in loc.line) for loc in profile.location
+    }
+    return sorted(
+        (
+            tuple(locations[location_id] for location_id in sample.location_id),
+            tuple(sorted((profile.string_table[label.key], profile.string_table[label.str]) for label in sample.label)),
+            tuple(sample.value),
+        )
+        for sample in profile.sample
+    )
+
+
+@mock.patch("ddtrace.internal.utils.config.get_application_name")
+def test_pprof_aggregator(gan):
+    gan.return_value = "bonjour"
+    r = recorder.Recorder(aggregator=pprof.PprofAggregator())
+    for events in TEST_EVENTS.values():
+        r.push_events(events)
+    events = r.reset()
+
+    # The aggregated events are not kept by the recorder
+    assert set(events) == {pprof.PprofAggregator}
+
+    exp = pprof.PprofExporter()
+    aggregated, _ = exp.export(events, 1, 7)
+    exported, _ = exp.export(TEST_EVENTS, 1, 7)
+
+    assert _samples(aggregated) == _samples(exported)
+    assert aggregated.period == exported.period == 1000000
+
+    # The next profile starts from scratch
+    empty, _ = exp.export(r.reset(), 7, 8)
+    assert len(empty.sample) == 0
+
+
+def test_pprof_lock_site_events():
+    frames = (("foobar.py", 23, "func1", "Foo"), ("foobar.py", 44, "func2", ""))
+    events = {
+        _lock.LockSiteEvent: [
+            _lock.LockSiteEvent(
+                lock_name="foobar.py:12",
+                frames=frames,
+                nframes=2,
+                sampling_pct=50,
+                acquire_count=3,
+                wait_time_ns=300,
+                release_count=2,
+                locked_for_ns=1000,
+            ),
+            _lock.LockSiteEvent(
+                lock_name="foobar.py:12",
+                frames=frames,
+                nframes=2,
+                sampling_pct=50,
+                acquire_count=1,
+                wait_time_ns=100,
+                release_count=2,
+                locked_for_ns=1000,
+            ),
+        ]
+    }
+
+    profile, _ = pprof.PprofExporter().export(events, 1, 7)
+
+    (sample,) = _samples(profile)
+    locations, labels, values = sample
+    assert locations == ((("func1", 23),), (("func2", 44),))
+    assert labels == (("class name", "Foo"), ("lock name", "foobar.py:12"))
+    values = {profile.string_table[t.type]: v for t, v in zip(profile.sample_type, values)}
+    # The times are scaled by the sampling percentage, not the counts
+    assert values["lock-acquire"] == 4
+    assert values["lock-acquire-wait"] == 800
+    assert values["lock-release"] == 4
+    assert values["lock-release-hold"] == 4000
+
+
+def _to_pb2(profile):
+    pprof_pb2 = utils.pprof_pb2()
+    return pprof_pb2.Profile(
+        sample_type=[pprof_pb2.ValueType(type=t.type, unit=t.unit) for t in profile.sample_type],
+        sample=[
+            pprof_pb2.Sample(
+                location_id=s.location_id,
+                value=s.value,
+                label=[pprof_pb2.Label(key=label.key, str=label.str) for label in s.label],
+            )
+            for s in profile.sample
+        ],
+        mapping=[pprof_pb2.Mapping(id=m.id, filename=m.filename) for m in profile.mapping],
+        location=[
+            pprof_pb2.Location(
+                id=loc.id, line=[pprof_pb2.Line(function_id=line.function_id, line=line.line) for line in loc.line]
+            )
+            for loc in profile.location
+        ],
+        function=[pprof_pb2.Function(id=f.id, name=f.name, filename=f.filename) for f in profile.function],
+        string_table=profile.string_table,
+        time_nanos=profile.time_nanos,
+        duration_nanos=profile.duration_nanos,
+        period=profile.period,
+        period_type=pprof_pb2.ValueType(type=profile.period_type.type, unit=profile.period_type.unit),
+    )
+
+
+@mock.patch("ddtrace.internal.utils.config.get_application_name")
+def test_pprof_serialize(gan):
+    gan.return_value = "bonjour"
+    profile, _ = pprof.PprofExporter().export(TEST_EVENTS, 1, 7)
+
+    assert profile.SerializeToString() == _to_pb2(profile).SerializeToString()
+
+
+def test_pprof_serialize_values():
+    profile = pprof.pprof_ProfileType(
+        sample_type=[pprof.pprof_ValueType(1, 0)],
+        sample=[
+            # Negative and 64-bit values, empty location and label lists
+            pprof.pprof_SampleType((1, 2 ** 40), [-1, 0, 2 ** 63 - 1], []),
+            pprof.pprof_SampleType((), [], [pprof.pprof_LabelType(0, 2)]),
+        ],
+        mapping=[pprof.pprof_Mapping(1, 2)],
+        location=[pprof.pprof_LocationType(1, [pprof.pprof_LineType(1, 0)]), pprof.pprof_LocationType(2 ** 40, [])],
+        function=[pprof.pprof_FunctionType(1, 1, 3)],
+        string_table=["", "foo", u"\u00e9t\u00e9", "x" * 200],
+        time_nanos=0,
+        duration_nanos=-5,
+        period_type=pprof.pprof_ValueType(0, 0),
+    )
+
+    serialized = profile.SerializeToString()
+    assert serialized == _to_pb2(profile).SerializeToString()
+
+    parsed = utils.pprof_pb2().Profile()
+    parsed.ParseFromString(serialized)
+    assert list(parsed.sample[0].value) == [-1, 0, 2 ** 63 - 1]
+    assert list(parsed.string_table)[2] == u"\u00e9t\u00e9"
+
+
+def test_pprof_write_to_chunks():
+    profile = pprof.pprof_ProfileType(
+        sample_type=[],
+        sample=[pprof.pprof_SampleType((i,), [i], [pprof.pprof_LabelType(1, 1)]) for i in range(50000)],
+        mapping=[],
+        location=[],
+        function=[],
+        # Larger than the serialization buffer
+        string_table=["", "a" * (1 << 17)],
+        time_nanos=1,
+        duration_nanos=2,
+        period_type=pprof.pprof_ValueType(0, 0),
+        period=3,
+    )
+
+    chunks = []
+    profile.write_to(mock.Mock(write=chunks.append))
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == profile.SerializeToString() == _to_pb2(profile).SerializeToString()
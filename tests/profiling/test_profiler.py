@@ -180,6 +180,25 @@ def test_disable_memory():
     assert all(not isinstance(col, memalloc.MemoryCollector) for col in profiler.Profiler()._profiler._collectors)
 
 
+@pytest.mark.subprocess()
+def test_default_streaming_aggregation():
+    from ddtrace.profiling import profiler
+
+    p = profiler.Profiler()._profiler
+    assert p._recorder.aggregator is None
+    assert p._aggregation_scheduler is None
+
+
+@pytest.mark.subprocess(env=dict(DD_PROFILING_STREAMING_AGGREGATION="true"))
+def test_enable_streaming_aggregation():
+    from ddtrace.profiling import profiler
+    from ddtrace.profiling.exporter import pprof
+
+    p = profiler.Profiler()._profiler
+    assert isinstance(p._recorder.aggregator, pprof.PprofAggregator)
+    assert p._aggregation_scheduler.recorder is p._recorder
+
+
 @pytest.mark.subprocess(
     env=dict(DD_PROFILING_AGENTLESS="true", DD_API_KEY="foobar"),
     err=None,
@@ -402,3 +421,24 @@ def test_profiler_serverless(monkeypatch):
     p = profiler.Profiler()
     assert isinstance(p._scheduler, scheduler.ServerlessScheduler)
     assert p.tags["functionname"] == "foobar"
+
+
+@pytest.mark.subprocess()
+def test_import_asyncio_after_start():
+    import sys
+
+    from ddtrace.profiling import profiler
+
+    assert "asyncio" not in sys.modules
+
+    p = profiler.Profiler()
+    p.start()
+    try:
+        import asyncio
+
+        from ddtrace.profiling import _asyncio
+
+        assert _asyncio.current_task is asyncio.current_task
+        assert _asyncio.THREAD_LINK is not None
+    finally:
+        p.stop(flush=False)
@@ -59,3 +59,55 @@ def test_limit():
 def test_fork():
     stdout, stderr, exitcode, pid = call_program("python", os.path.join(os.path.dirname(__file__), "recorder_fork.py"))
     assert exitcode == 0, (stdout, stderr)
+
+
+class _Aggregator(object):
+    event_types = frozenset([stack_event.StackSampleEvent])
+
+    def __init__(self):
+        self.events = []
+
+    def push_events(self, events):
+        self.events.extend(events)
+
+    def reset(self):
+        events, self.events = self.events, []
+        return events
+
+
+def test_aggregator():
+    r = recorder.Recorder(aggregator=_Aggregator(), max_events={stack_event.StackSampleEvent: 3})
+    r.push_events([stack_event.StackSampleEvent(), stack_event.StackSampleEvent()])
+    r.push_events([stack_event.StackSampleEvent(), stack_event.StackSampleEvent()])
+    r.push_event(event.Event())
+
+    events = r.reset()
+    assert len(events[event.Event]) == 1
+    assert len(events[stack_event.StackSampleEvent]) == 0
+    # The events beyond the limit are dropped
+    (aggregated,) = events[_Aggregator]
+    assert len(aggregated) == 3
+
+    # The limit applies to each profile
+    e = stack_event.StackSampleEvent()
+    r.push_event(e)
+    assert r.reset()[_Aggregator] == [[e]]
+
+
+def test_aggregator_aggregate():
+    aggregator = _Aggregator()
+    r = recorder.Recorder(aggregator=aggregator)
+    e1 = stack_event.StackSampleEvent()
+    r.push_event(e1)
+    # The events are only queued by the threads pushing them
+    assert aggregator.events == []
+
+    r.aggregate()
+    assert aggregator.events == [e1]
+
+    e2 = stack_event.StackSampleEvent()
+    r.push_event(e2)
+    # The events queued are aggregated in the profile being reset
+    assert r.reset()[_Aggregator] == [[e1, e2]]
+    r.aggregate()
+    assert aggregator.events == []
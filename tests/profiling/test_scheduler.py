@@ -74,3 +74,10 @@ def test_serverless_periodic(mock_periodic):
     assert s._profiled_intervals == 0
     assert s.interval == 1
     mock_periodic.assert_called()
+
+
+def test_aggregation_scheduler():
+    r = mock.Mock()
+    s = scheduler.AggregationScheduler(r)
+    s.periodic()
+    r.aggregate.assert_called_once_with()
@@ -1,6 +1,25 @@
 import gzip
+import sys
 
-from ddtrace.profiling.exporter import pprof
+from ddtrace.internal.utils.version import parse_version
+
+
+def pprof_pb2():
+    """Return the generated protobuf module for pprof matching the installed protobuf version.
+
+    The exporter does not depend on protobuf: the generated classes are only used to decode profiles in tests.
+    """
+    import google.protobuf
+
+    pb_version = parse_version(google.protobuf.__version__)
+    for v in [(4, 21), (3, 19), (3, 12)]:
+        if pb_version >= v:
+            pprof_module = "tests.profiling.exporter.pprof_%s%s_pb2" % v
+            break
+    else:
+        pprof_module = "tests.profiling.exporter.pprof_3_pb2"
+    __import__(pprof_module)
+    return sys.modules[pprof_module]
 
 
 def check_pprof_file(
@@ -9,7 +28,7 @@ def check_pprof_file(
     # type: (...) -> None
     with gzip.open(filename, "rb") as f:
         content = f.read()
-    p = pprof.pprof_pb2.Profile()
+    p = pprof_pb2().Profile()
     p.ParseFromString(content)
     assert len(p.sample_type) == 11
     assert p.string_table[p.sample_type[0].type] == "cpu-samples"
@@ -1,9 +1,16 @@
 from ddtrace.internal.runtime.constants import GC_COUNT_GEN0
 from ddtrace.internal.runtime.constants import GC_RUNTIME_METRICS
 from ddtrace.internal.runtime.constants import PSUTIL_RUNTIME_METRICS
+from ddtrace.internal.runtime.constants import SPAN_POOL_HITS
+from ddtrace.internal.runtime.constants import SPAN_POOL_HIT_RATE
+from ddtrace.internal.runtime.constants import SPAN_POOL_MISSES
+from ddtrace.internal.runtime.constants import SPAN_POOL_REJECTED
+from ddtrace.internal.runtime.constants import SPAN_POOL_RUNTIME_METRICS
 from ddtrace.internal.runtime.metric_collectors import GCRuntimeMetricCollector
 from ddtrace.internal.runtime.metric_collectors import PSUtilRuntimeMetricCollector
 from ddtrace.internal.runtime.metric_collectors import RuntimeMetricCollector
+from ddtrace.internal.runtime.metric_collectors import SpanPoolRuntimeMetricCollector
+from ddtrace.internal.span_pool import SpanPool
 from tests.utils import BaseTestCase
 
 
@@ -58,3 +65,33 @@ class TestGCRuntimeMetricCollector(BaseTestCase):
         assert len(collected_after) == 1
         assert collected_after[0][0] == "runtime.python.gc.count.gen0"
         assert isinstance(collected_after[0][1], int)
+
+
+class TestSpanPoolRuntimeMetricCollector(BaseTestCase):
+    def test_disabled(self):
+        assert SpanPoolRuntimeMetricCollector().collect(SPAN_POOL_RUNTIME_METRICS) == []
+
+    def test_metrics(self):
+        import ddtrace
+
+        pool = SpanPool()
+        original, ddtrace.tracer._span_pool = ddtrace.tracer._span_pool, pool
+        try:
+            collector = SpanPoolRuntimeMetricCollector()
+            pool.hits, pool.misses, pool.rejected = 3, 1, 2
+            assert dict(collector.collect(SPAN_POOL_RUNTIME_METRICS)) == {
+                SPAN_POOL_HITS: 3,
+                SPAN_POOL_MISSES: 1,
+                SPAN_POOL_REJECTED: 2,
+                SPAN_POOL_HIT_RATE: 0.75,
+            }
+            # Only the counts since the previous collection are reported
+            pool.hits += 1
+            assert dict(collector.collect(SPAN_POOL_RUNTIME_METRICS)) == {
+                SPAN_POOL_HITS: 1,
+                SPAN_POOL_MISSES: 0,
+                SPAN_POOL_REJECTED: 0,
+                SPAN_POOL_HIT_RATE: 1.0,
+            }
+        finally:
+            ddtrace.tracer._span_pool = original
@@ -23,6 +23,7 @@ from ddtrace.internal._encoding import BufferFull
 from ddtrace.internal._encoding import BufferItemTooLarge
 from ddtrace.internal._encoding import ListStringTable
 from ddtrace.internal._encoding import MsgpackStringTable
+from ddtrace.internal._encoding import estimate_span_size
 from ddtrace.internal.compat import msgpack_type
 from ddtrace.internal.compat import string_type
 from ddtrace.internal.encoding import JSONEncoder
@@ -398,6 +399,22 @@ def test_span_types(encoding, span, tags):
     assert decode(refencoder.encode_traces([trace])) == decode(encoder.encode())
 
 
+@allencodings
+def test_custom_msgpack_encode_untagged_spans(encoding):
+    encoder = MSGPACK_ENCODERS[encoding](1 << 20, 1 << 20)
+    refencoder = REF_MSGPACK_ENCODERS[encoding]()
+
+    trace = [Span(name="root", trace_id=1, span_id=1), Span(name="leaf", trace_id=1, span_id=2, parent_id=1)]
+    trace[1].finish()
+    trace[0].finish()
+
+    encoder.put(trace)
+    encoded = encoder.encode()
+    # Encoding must not allocate the lazily created tag dictionaries
+    assert all(span._meta_dict is None and span._metrics_dict is None for span in trace)
+    assert decode(encoded) == decode(refencoder.encode_traces([trace]))
+
+
 @pytest.mark.parametrize(
     "Encoder,item",
     [
@@ -450,6 +467,31 @@ def test_custom_msgpack_encode_trace_size(encoding, trace_id, name, service, res
     assert encoder.size == len(encoder.encode())
 
 
+@allencodings
+@given(
+    name=text(alphabet=string.printable),
+    service=text(alphabet=string.printable),
+    resource=text(alphabet=string.printable),
+    meta=dictionaries(text(alphabet=string.printable), text(alphabet=string.printable)),
+    metrics=dictionaries(text(alphabet=string.printable), floats()),
+    span_type=text(alphabet=string.printable),
+)
+@settings(max_examples=100)
+def test_estimate_span_size(encoding, name, service, resource, meta, metrics, span_type):
+    encoder = MSGPACK_ENCODERS[encoding](1 << 20, 1 << 20)
+    span = Span(trace_id=2 ** 64 - 1, span_id=2 ** 64 - 1, parent_id=2 ** 64 - 1, name=name, service=service)
+    span.resource = resource
+    span.set_tags(meta)
+    span.set_metrics(metrics)
+    span.error = 1
+    span.span_type = span_type
+    span.finish()
+
+    encoder.put([span])
+    # ASCII strings are not underestimated
+    assert encoder.size <= estimate_span_size(span)
+
+
 def test_encoder_buffer_size_limit_v03():
     buffer_size = 1 << 10
     encoder = MsgpackEncoderV03(buffer_size, buffer_size)
@@ -518,6 +560,46 @@ def test_encoder_buffer_item_size_limit_v05():
         encoder.put([span] * (int(max_item_size / trace_size) + 2))
 
 
+@pytest.mark.parametrize("Encoder", [MsgpackEncoderV03, MsgpackEncoderV05])
+def test_encoder_buffer_growth_is_bounded(Encoder):
+    max_item_size = 1 << 10
+    encoder = Encoder(max_item_size << 1, max_item_size)
+    encoder.put([Span(name="test")])
+
+    # A trace much larger than the limits is rejected without packing it whole
+    with pytest.raises(BufferItemTooLarge) as exc_info:
+        encoder.put([Span(name="a" * 5000, span_id=i) for i in range(2 ** 10)])
+    assert exc_info.value.args[0] < 3 * max_item_size
+
+    # The encoder is still usable after the overflow
+    encoder.put([Span(name="test")])
+    assert len(encoder) == 2
+    assert len(decode(encoder.encode())) == 2
+
+
+@pytest.mark.skipif(six.PY2, reason="tracemalloc is not available")
+@pytest.mark.parametrize("Encoder", [MsgpackEncoderV03, MsgpackEncoderV05])
+def test_encoder_buffer_shrinks_after_flush(Encoder):
+    import tracemalloc
+
+    max_size = 16 << 20
+    encoder = Encoder(max_size, max_size)
+    trace = [Span(name="%04d" % i + "a" * 1024, span_id=i + 1) for i in range(4 << 10)]
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        encoder.put(trace)
+        assert tracemalloc.get_traced_memory()[0] - baseline > 4 << 20
+        payload = encoder.encode()
+        del payload
+        # The buffers that grew to hold the large trace are shrunk back to
+        # their initial size
+        assert tracemalloc.get_traced_memory()[0] - baseline < 3 << 20
+    finally:
+        tracemalloc.stop()
+
+
 def test_custom_msgpack_encode_v05():
     encoder = MsgpackEncoderV05(2 << 20, 2 << 20)
     assert encoder.max_size == 2 << 20
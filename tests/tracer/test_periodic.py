@@ -130,3 +130,40 @@ def test_awakeable_periodic_service():
     awake_me.stop()
 
     assert queue == list(range(n + 2))
+
+
+def test_notifiable_periodic_service():
+    ran = Event()
+
+    class NotifyMe(periodic.NotifiablePeriodicService):
+        def periodic(self):
+            ran.set()
+
+    # Use an interval long enough for the periodic function to only run
+    # because of the notification
+    notify_me = NotifyMe(60)
+    notify_me.start()
+    try:
+        assert not ran.wait(0.1)
+        notify_me.notify()
+        assert ran.wait(5)
+    finally:
+        notify_me.stop()
+        notify_me.join(5)
+
+    assert not notify_me._worker.is_alive()
+
+
+def test_notifiable_periodic_thread_stop():
+    x = {"DOWN": False}
+
+    def _on_shutdown():
+        x["DOWN"] = True
+
+    t = periodic.NotifiablePeriodicThread(60, lambda: None, on_shutdown=_on_shutdown)
+    t.start()
+    t.stop()
+    # Stopping must not wait for the interval to elapse
+    t.join(5)
+    assert not t.is_alive()
+    assert x["DOWN"]
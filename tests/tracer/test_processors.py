@@ -1,8 +1,10 @@
+import threading
 from typing import Any
 
 import attr
 import mock
 import pytest
+import six
 
 from ddtrace import Span
 from ddtrace import Tracer
@@ -17,8 +19,11 @@ from ddtrace.constants import _SINGLE_SPAN_SAMPLING_MECHANISM
 from ddtrace.constants import _SINGLE_SPAN_SAMPLING_RATE
 from ddtrace.context import Context
 from ddtrace.ext import SpanTypes
+from ddtrace.internal._encoding import estimate_span_size
 from ddtrace.internal.constants import HIGHER_ORDER_TRACE_ID_BITS
 from ddtrace.internal.processor.endpoint_call_counter import EndpointCallCounterProcessor
+from ddtrace.internal.processor.stats import SpanAggrStats
+from ddtrace.internal.processor.stats import SpanStatsProcessorV06
 from ddtrace.internal.processor.trace import SpanAggregator
 from ddtrace.internal.processor.trace import SpanProcessor
 from ddtrace.internal.processor.trace import SpanSamplingProcessor
@@ -252,6 +257,212 @@ def test_aggregator_partial_flush_2_spans():
     assert parent.get_metric("_dd.py.partial_flush") is None
 
 
+def test_aggregator_partial_flush_min_bytes():
+    writer = DummyWriter()
+    aggr = SpanAggregator(
+        partial_flush_enabled=True,
+        partial_flush_min_spans=100,
+        partial_flush_min_bytes=estimate_span_size(Span("child", service="a" * 1000)) * 2,
+        trace_processors=[],
+        writer=writer,
+    )
+
+    parent = Span("parent", on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(parent)
+    children = []
+    for _ in range(3):
+        child = Span("child", service="a" * 1000, on_finish=[aggr.on_span_finish])
+        child.trace_id = parent.trace_id
+        child.parent_id = parent.span_id
+        aggr.on_span_start(child)
+        children.append(child)
+
+    children[0].finish()
+    assert writer.pop() == []
+    children[1].finish()
+    assert writer.pop() == children[:2]
+    assert children[0].get_metric("_dd.py.partial_flush") == 2
+    # The size of the flushed spans is not accounted for anymore
+    children[2].finish()
+    assert writer.pop() == []
+    parent.finish()
+    assert writer.pop() == [parent, children[2]]
+
+
+def test_aggregator_partial_flush_min_bytes_default():
+    # The size of the spans is only estimated when partial_flush_min_bytes is set
+    tracer = Tracer()
+    aggr = [p for p in tracer._span_processors if isinstance(p, SpanAggregator)][0]
+    assert aggr._partial_flush_min_bytes == 0
+
+    with mock.patch("ddtrace.internal.processor.trace.estimate_span_size") as estimate:
+        with tracer.trace("parent"):
+            with tracer.trace("child"):
+                pass
+    estimate.assert_not_called()
+
+
+def test_aggregator_processors_run_unlocked():
+    writer = DummyWriter()
+    aggr = SpanAggregator(partial_flush_enabled=False, partial_flush_min_spans=0, trace_processors=[], writer=writer)
+
+    class Proc(TraceProcessor):
+        def process_trace(self, trace):
+            # Trace processors can create spans in the same trace without deadlocking
+            assert not aggr._shard(trace[0].trace_id).lock.locked()
+            if trace[0].name == "from_processor":
+                return trace
+            span = Span("from_processor", trace_id=trace[0].trace_id, on_finish=[aggr.on_span_finish])
+            aggr.on_span_start(span)
+            span.finish()
+            return trace
+
+    aggr._trace_processors = [Proc()]
+    span = Span("span", on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(span)
+    span.finish()
+
+    assert [s.name for s in writer.pop()] == ["from_processor", "span"]
+    assert all(len(shard.traces) == 0 for shard in aggr._shards)
+
+
+def test_aggregator_partial_flush_ordered():
+    writer = DummyWriter()
+    aggr = SpanAggregator(partial_flush_enabled=True, partial_flush_min_spans=1, trace_processors=[], writer=writer)
+    processing = threading.Event()
+    resume = threading.Event()
+
+    class Proc(TraceProcessor):
+        def process_trace(self, trace):
+            if trace[0].name == "child":
+                # Give the other thread the opportunity to flush the rest of
+                # the trace while this chunk is processed.
+                processing.set()
+                resume.wait(1)
+            return trace
+
+    aggr._trace_processors = [Proc()]
+    root = Span("root", on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(root)
+    child = Span("child", trace_id=root.trace_id, parent_id=root.span_id, on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(child)
+
+    t = threading.Thread(target=child.finish)
+    t.start()
+    assert processing.wait(1)
+    t_root = threading.Thread(target=root.finish)
+    t_root.start()
+    t_root.join(0.1)
+    resume.set()
+    t.join()
+    t_root.join()
+
+    assert [s.name for s in writer.pop()] == ["child", "root"]
+
+
+def test_aggregator_partial_flush_unlocked():
+    class Writer(DummyWriter):
+        def write(self, spans=None):
+            # Other traces of the shard are not blocked by the writer
+            shard = aggr._shard(spans[0].trace_id)
+            assert shard.lock.acquire(False)
+            shard.lock.release()
+            DummyWriter.write(self, spans=spans)
+
+    writer = Writer()
+    aggr = SpanAggregator(
+        partial_flush_enabled=True, partial_flush_min_spans=1, trace_processors=[], writer=writer, num_shards=1
+    )
+    root = Span("root", on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(root)
+    child = Span("child", trace_id=root.trace_id, parent_id=root.span_id, on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(child)
+    child.finish()
+    root.finish()
+
+    assert [s.name for s in writer.pop()] == ["child", "root"]
+
+
+def test_aggregator_partial_flush_reentrant():
+    writer = DummyWriter()
+    aggr = SpanAggregator(partial_flush_enabled=True, partial_flush_min_spans=1, trace_processors=[], writer=writer)
+    root = Span("root", on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(root)
+    children = []
+    for name in ("first", "second"):
+        child = Span(name, trace_id=root.trace_id, parent_id=root.span_id, on_finish=[aggr.on_span_finish])
+        aggr.on_span_start(child)
+        children.append(child)
+
+    class Proc(TraceProcessor):
+        def process_trace(self, trace):
+            if trace[0].name == "first":
+                # Finishing a span of the same trace while processing a chunk
+                # queues the next chunk instead of waiting for this one.
+                children[1].finish()
+                assert writer.pop() == []
+            return trace
+
+    aggr._trace_processors = [Proc()]
+    children[0].finish()
+    root.finish()
+
+    assert [s.name for s in writer.pop()] == ["first", "second", "root"]
+    assert not aggr._shard(root.trace_id).traces
+
+
+def test_aggregator_shards():
+    writer = DummyWriter()
+    aggr = SpanAggregator(
+        partial_flush_enabled=False, partial_flush_min_spans=0, trace_processors=[], writer=writer, num_shards=4
+    )
+    assert len(aggr._shards) == 4
+
+    spans = [Span("span", trace_id=trace_id, on_finish=[aggr.on_span_finish]) for trace_id in range(8)]
+    for span in spans:
+        aggr.on_span_start(span)
+    assert [len(shard.traces) for shard in aggr._shards] == [2, 2, 2, 2]
+
+    for span in spans:
+        span.finish()
+    assert sorted(s.trace_id for s in writer.pop()) == list(range(8))
+    assert all(len(shard.traces) == 0 for shard in aggr._shards)
+
+    with pytest.raises(ValueError):
+        SpanAggregator(
+            partial_flush_enabled=False, partial_flush_min_spans=0, trace_processors=[], writer=writer, num_shards=0
+        )
+
+
+def test_aggregator_threads():
+    writer = DummyWriter()
+    aggr = SpanAggregator(partial_flush_enabled=True, partial_flush_min_spans=3, trace_processors=[], writer=writer)
+    n_threads = 16
+    n_traces = 50
+
+    def _trace(thread_id):
+        for i in range(n_traces):
+            trace_id = thread_id * n_traces + i
+            root = Span("root", trace_id=trace_id, on_finish=[aggr.on_span_finish])
+            aggr.on_span_start(root)
+            for _ in range(5):
+                child = Span("child", trace_id=trace_id, parent_id=root.span_id, on_finish=[aggr.on_span_finish])
+                aggr.on_span_start(child)
+                child.finish()
+            root.finish()
+
+    threads = [threading.Thread(target=_trace, args=(i,)) for i in range(n_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    spans = writer.pop()
+    assert len(spans) == n_threads * n_traces * 6
+    assert len(set(s.trace_id for s in spans)) == n_threads * n_traces
+    assert all(len(shard.traces) == 0 for shard in aggr._shards)
+
+
 def test_trace_top_level_span_processor_partial_flushing():
     """Parent span and child span have the same service name"""
     tracer = Tracer()
@@ -649,3 +860,52 @@ def test_register_unregister_span_processor():
     with tracer.trace("test") as span:
         assert span.get_tag("on_start") is None
     assert span.get_tag("on_finish") is None
+
+
+def test_span_stats_buffered_durations():
+    with mock.patch.object(SpanStatsProcessorV06, "start"):
+        processor = SpanStatsProcessorV06("http://localhost:8126", interval=1000.0)
+
+    def finish(error=0, duration_ns=1000):
+        span = Span("web.request", service="svc", resource="GET /" + "users", start=0)
+        span._local_root = span
+        span.error = error
+        span.duration_ns = duration_ns
+        processor.on_span_finish(span)
+
+    with mock.patch("ddtrace.internal.processor.stats.MAX_BUFFERED_DURATIONS", 10):
+        for i in range(15):
+            finish(duration_ns=1000 * (i + 1))
+        finish(error=1)
+
+    ((key, stats),) = processor._buckets[0].items()
+    assert key[2] is six.moves.intern("GET /users")
+    # The full buffer of ok durations was followed by a new one
+    assert [len(durations) for durations in stats.ok_durations] == [10, 5]
+    assert [len(durations) for durations in stats.err_durations] == [1]
+    assert stats.ok_distribution.count == stats.err_distribution.count == 0
+
+    merge_durations = SpanAggrStats.merge_durations
+
+    def merge_unlocked(self):
+        # The spans that finish are not blocked by the merge
+        assert processor._lock.acquire(False)
+        processor._lock.release()
+        merge_durations(self)
+
+    with mock.patch.object(SpanAggrStats, "merge_durations", merge_unlocked), mock.patch.object(
+        processor, "_flush_stats"
+    ) as flush_stats:
+        processor.periodic()
+    assert flush_stats.call_count == 1
+    assert not processor._buckets
+
+    (bucket,) = processor._serialize_buckets({0: {key: stats}})
+    (serialized,) = bucket["Stats"]
+    assert serialized["Hits"] == 16
+    assert serialized["Errors"] == 1
+    assert stats.ok_distribution.count == 15
+    assert stats.ok_distribution.sum == sum(1000 * (i + 1) for i in range(15))
+    assert stats.err_distribution.count == 1
+    assert [len(durations) for durations in stats.ok_durations] == [0]
+    assert [len(durations) for durations in stats.err_durations] == [0]
@@ -3,6 +3,7 @@ import json
 import logging
 import os
 
+import mock
 import pytest
 
 from ddtrace.context import Context
@@ -50,6 +51,62 @@ def test_inject(tracer):
         assert tags == set(["_dd.p.test=value", "_dd.p.other=value"])
 
 
+def test_inject_reuses_trace_headers(tracer):
+    styles = [
+        PROPAGATION_STYLE_DATADOG,
+        PROPAGATION_STYLE_B3,
+        PROPAGATION_STYLE_B3_SINGLE_HEADER,
+        _PROPAGATION_STYLE_W3C_TRACECONTEXT,
+    ]
+    ctx = Context(trace_id=1234, sampling_priority=1, dd_origin="synthetics", meta={"_dd.p.test": "value"})
+    tracer.context_provider.activate(ctx)
+    with override_global_config(dict(_propagation_style_inject=styles)):
+        with tracer.trace("root") as root:
+            for _ in range(2):
+                with tracer.trace("child") as child:
+                    headers = {}
+                    HTTPPropagator.inject(child.context, headers)
+
+                    expected = {}
+                    HTTPPropagator._inject(child.context, expected)
+                    assert headers == expected
+                    assert headers[HTTP_HEADER_PARENT_ID] == str(child.span_id)
+                    assert headers[_HTTP_HEADER_B3_SPAN_ID] == "{:016x}".format(child.span_id)
+                    assert headers[_HTTP_HEADER_B3_SINGLE] == "{:016x}-{:016x}-1".format(1234, child.span_id)
+                    assert headers[_HTTP_HEADER_TRACEPARENT] == "00-{:032x}-{:016x}-01".format(1234, child.span_id)
+
+            # Changes to the sampling priority and to the trace tags are reflected
+            root.context.sampling_priority = 2
+            root.context._meta["_dd.p.other"] = "value"
+            headers = {}
+            HTTPPropagator.inject(root.context, headers)
+            assert headers[HTTP_HEADER_SAMPLING_PRIORITY] == "2"
+            assert set(headers[_HTTP_HEADER_TAGS].split(",")) == {"_dd.p.test=value", "_dd.p.other=value"}
+            assert headers[_HTTP_HEADER_B3_SINGLE].endswith("-d")
+            assert headers[_HTTP_HEADER_TRACESTATE] == "dd=s:2;o:synthetics;t.test:value;t.other:value"
+
+            del root.context._meta["_dd.p.test"]
+            headers = {}
+            HTTPPropagator.inject(root.context, headers)
+            assert headers[_HTTP_HEADER_TAGS] == "_dd.p.other=value"
+
+
+def test_inject_renders_trace_headers_once(tracer):
+    ctx = Context(trace_id=1234, sampling_priority=1, meta={"_dd.p.test": "value"})
+    tracer.context_provider.activate(ctx)
+    with mock.patch.object(
+        HTTPPropagator, "_render_templates", wraps=HTTPPropagator._render_templates
+    ) as render_templates:
+        with tracer.trace("root"):
+            for _ in range(5):
+                with tracer.trace("child") as child:
+                    headers = {}
+                    HTTPPropagator.inject(child.context, headers)
+                    assert headers[HTTP_HEADER_PARENT_ID] == str(child.span_id)
+
+    assert render_templates.call_count == 1
+
+
 @pytest.mark.subprocess(
     env=dict(DD_TRACE_PROPAGATION_STYLE=PROPAGATION_STYLE_DATADOG),
 )
@@ -487,6 +544,46 @@ def test_WSGI_extract(tracer):
         }
 
 
+def test_ASGI_extract(tracer):
+    """Ensure we support the ASGI list of byte headers as well."""
+    headers = [
+        (b"host", b"localhost"),
+        (b"x-datadog-trace-id", b"1234"),
+        (b"X-Datadog-Parent-Id", b"5678"),
+        (b"x-datadog-sampling-priority", b"1"),
+        (b"x-datadog-origin", b"synthetics"),
+        (b"x-datadog-tags", b"_dd.p.test=value,any=tag"),
+    ]
+
+    context = HTTPPropagator.extract(headers)
+    tracer.context_provider.activate(context)
+
+    with tracer.trace("local_root_span") as span:
+        assert span.trace_id == 1234
+        assert span.parent_id == 5678
+        assert span.context.sampling_priority == 1
+        assert span.context.dd_origin == "synthetics"
+        assert span.context._meta == {
+            "_dd.origin": "synthetics",
+            "_dd.p.test": "value",
+        }
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"X-DATADOG-TRACE-ID": "1234", "X-Datadog-Parent-Id": "5678"},
+        {"Http_X_Datadog_Trace_Id": "1234", "http_x_datadog_parent_id": "5678"},
+        {"x-datadog-trace-id": b"1234", "x-datadog-parent-id": b"5678", "x-datadog-trace-id-": "1"},
+        [("x-datadog-trace-id", "1234"), (b"x-datadog-parent-id", "5678"), (1, "2")],
+    ],
+)
+def test_extract_header_spellings(headers):
+    context = HTTPPropagator.extract(headers)
+    assert context.trace_id == 1234
+    assert context.span_id == 5678
+
+
 def test_extract_invalid_tags(tracer):
     # Malformed tags do not fail to extract the rest of the context
     headers = {
@@ -1,5 +1,7 @@
 from __future__ import division
 
+import threading
+
 import mock
 import pytest
 
@@ -188,6 +190,61 @@ def test_rate_limiter_3():
             assert decision is False
 
 
+def test_rate_limiter_is_allowed_n():
+    limiter = RateLimiter(rate_limit=10)
+
+    now_ns = compat.monotonic_ns()
+    assert limiter.is_allowed_n(4, now_ns) == 4
+    assert limiter.is_allowed_n(10, now_ns) == 6
+    assert limiter.is_allowed_n(10, now_ns) == 0
+    assert limiter.is_allowed_n(0, now_ns) == 0
+    assert limiter.effective_rate == 10 / 24
+
+    # Half a second later, half of the tokens are back
+    assert limiter.is_allowed_n(10, now_ns + 0.5e9) == 5
+    assert limiter.is_allowed(now_ns + 0.5e9) is False
+
+
+@pytest.mark.parametrize("rate_limit", [0, -1])
+def test_rate_limiter_is_allowed_n_no_limit(rate_limit):
+    limiter = RateLimiter(rate_limit=rate_limit)
+
+    assert limiter.is_allowed_n(10, compat.monotonic_ns()) == (10 if rate_limit else 0)
+    assert limiter.tokens_total == 10
+
+
+@pytest.mark.parametrize("n", [1, 3, 7])
+def test_rate_limiter_is_allowed_n_same_as_is_allowed(n):
+    batched = RateLimiter(rate_limit=50)
+    single = RateLimiter(rate_limit=50)
+
+    now_ns = compat.monotonic_ns()
+    for i in range(100):
+        time_ns = now_ns + i * 1e7
+        assert batched.is_allowed_n(n, time_ns) == sum(single.is_allowed(time_ns) for _ in range(n))
+        assert batched.effective_rate == single.effective_rate
+        assert batched.tokens == single.tokens
+
+
+def test_rate_limiter_threads():
+    limiter = RateLimiter(rate_limit=1000)
+    now_ns = compat.monotonic_ns()
+    allowed = []
+
+    def check():
+        allowed.append(sum(limiter.is_allowed(now_ns) for _ in range(1000)))
+
+    threads = [threading.Thread(target=check) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Every token is given exactly once
+    assert sum(allowed) == 1000
+    assert limiter.tokens_total == 8000
+
+
 @pytest.mark.parametrize("rate_limit", list(range(10)))
 def test_rate_limiter_with_jitter_expected_calls(rate_limit):
     limiter = BudgetRateLimiterWithJitter(limit_rate=rate_limit)
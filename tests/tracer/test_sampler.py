@@ -900,6 +900,42 @@ def test_datadog_sampler_sample_rules(sampler, sampling_priority, sampling_mecha
     )
 
 
+def test_datadog_sampler_rule_matcher():
+    rules = [
+        SamplingRule(sample_rate=0.1, service="svc", name="op"),
+        SamplingRule(sample_rate=0.2, service=re.compile("db-.*")),
+        SamplingRule(sample_rate=0.3, name="op"),
+        SamplingRule(sample_rate=0.4, service="svc"),
+        SamplingRule(sample_rate=0.5, service=lambda service: service.endswith("-worker"), name="job"),
+        SamplingRule(sample_rate=0.6, service="db-users", name="query"),
+        SamplingRule(sample_rate=0.7, service=None),
+        SamplingRule(sample_rate=0.8, name=re.compile("http\\..*")),
+    ]
+    sampler = DatadogSampler(rules=rules)
+
+    services = ["svc", "db-users", "web", "mail-worker", None]
+    names = ["op", "query", "job", "http.request", "other"]
+    for _ in range(2):
+        for service in services:
+            for name in names:
+                span = Span(service=service, name=name)
+                expected = next((rule for rule in rules if rule.matches(span)), None)
+                assert sampler._match_rule(span) is expected, (service, name)
+
+    # Changes to the rules after the sampler was created are honored
+    matcher = sampler._matcher
+    sampler._match_rule(Span(service="web", name="other"))
+    assert sampler._matcher is matcher
+    sampler.rules.insert(0, SamplingRule(sample_rate=0.9, service="web"))
+    assert sampler._match_rule(Span(service="web", name="other")) is sampler.rules[0]
+    sampler.rules[0] = SamplingRule(sample_rate=0.9, service="mail-worker")
+    assert sampler._match_rule(Span(service="mail-worker", name="other")) is sampler.rules[0]
+    sampler.rules = [SamplingRule(sample_rate=1.0)]
+    assert sampler._match_rule(Span(service="svc", name="op")) is sampler.rules[0]
+    sampler.rules.clear()
+    assert sampler._match_rule(Span(service="svc", name="op")) is None
+
+
 def test_datadog_sampler_tracer(dummy_tracer):
     rule = SamplingRule(sample_rate=1.0, name="test.span")
     sampler = DatadogSampler(rules=[rule])
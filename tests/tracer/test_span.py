@@ -460,6 +460,56 @@ def test_span_encoding_set_str_tag(span_log):
     assert span.get_tag("foo") == u"/?foo=bar&baz=����ó��"
 
 
+def test_span_lazy_tags():
+    span = Span("test")
+    assert span._meta_dict is None
+    assert span._metrics_dict is None
+
+    # Reading tags must not allocate the underlying dictionaries
+    assert span.get_tag("foo") is None
+    assert span.get_metric("foo") is None
+    assert span.get_tags() == {}
+    assert span.get_metrics() == {}
+    span._remove_tag("foo")
+    assert span._meta_dict is None
+    assert span._metrics_dict is None
+
+    key = "".join(["dynamic", ".", "key"])
+    span.set_tag(key, "value")
+    span.set_metric(key + ".metric", 1)
+    assert span._meta == {"dynamic.key": "value"}
+    assert span._metrics == {"dynamic.key.metric": 1}
+    assert list(span._meta)[0] is six.moves.intern("dynamic.key")
+
+    span._meta = {"a": "b"}
+    assert span.get_tag("a") == "b"
+
+
+@mock.patch("ddtrace.span.log")
+def test_span_set_tags_str(span_log):
+    span = Span(None)
+    span._set_tags_str({})
+    assert span._meta_dict is None
+
+    span._set_tags_str(
+        {
+            "text": u"😌",
+            "bytes": b"\xf0\x9f\xa4\x94",
+            "encoded": u"/?foo=bar&baz=정상처리".encode("euc-kr"),
+        }
+    )
+    assert span.get_tag("text") == u"😌"
+    assert span.get_tag("bytes") == u"🤔"
+    assert span.get_tag("encoded") == u"/?foo=bar&baz=����ó��"
+    span_log.warning.assert_not_called()
+
+    with override_global_config(dict(_raise=False)):
+        span._set_tags_str({"foo": dict(a=1), "bar": "baz"})
+    assert "foo" not in span.get_tags()
+    assert span.get_tag("bar") == "baz"
+    span_log.warning.assert_called_once_with("Failed to set text tag '%s'", "foo", exc_info=True)
+
+
 def test_span_nonstring_set_str_tag_exc():
     span = Span(None)
     with pytest.raises(TypeError):
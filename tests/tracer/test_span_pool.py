@@ -0,0 +1,274 @@
+import threading
+import weakref
+
+import mock
+import pytest
+
+from ddtrace.context import Context
+from ddtrace.internal.processor.trace import SpanAggregator
+from ddtrace.internal.processor.trace import TraceProcessor
+from ddtrace.internal.span_pool import SpanPool
+from ddtrace.internal.writer import AgentWriter
+from ddtrace.span import Span
+from tests.utils import DummyTracer
+from tests.utils import DummyWriter
+from tests.utils import override_global_config
+
+
+def _finished_trace(pool, n=3):
+    root = pool.new_span("root", service="svc", context=Context())
+    root._local_root = root
+    root.set_tag("tag", "value")
+    root.set_metric("metric", 1)
+    spans = [root]
+    for _ in range(n - 1):
+        child = pool.new_span("child", trace_id=root.trace_id, parent_id=root.span_id, context=root.context)
+        child._parent = spans[-1]
+        child._local_root = root
+        spans.append(child)
+    for span in reversed(spans):
+        span.finish()
+    pool.release(spans)
+    return [id(s) for s in spans]
+
+
+def test_span_pool_invalid_size():
+    with pytest.raises(ValueError):
+        SpanPool(0)
+
+
+def test_span_pool_reuses_released_spans():
+    pool = SpanPool()
+    first = _finished_trace(pool)
+    # The most recent chunk is only checked once another one is released
+    _finished_trace(pool)
+
+    span = pool.new_span("new", service="other", resource="res", context=Context())
+    assert id(span) in first
+    assert pool.stats() == (1, 6, 6, 0)
+
+    assert span.name == "new"
+    assert span.service == "other"
+    assert span.resource == "res"
+    assert not span.finished
+    assert span.duration_ns is None
+    assert span.error == 0
+    assert span.get_tags() == {}
+    assert span.get_metrics() == {}
+    assert span._parent is None
+    assert span._store is None
+    assert span.context.span_id == span.span_id
+    assert span.context.trace_id == span.trace_id
+
+
+def test_span_pool_new_resource_list():
+    pool = SpanPool()
+    root = pool.new_span("root", context=Context())
+    root._local_root = root
+    root.finish()
+    resource = root._resource
+    pool.release([root])
+    del root
+    _finished_trace(pool)
+
+    span = pool.new_span("new", context=Context())
+    assert resource == ["root"]
+    assert span._resource is not resource
+    assert span.resource == "new"
+
+
+def test_span_pool_waits_for_writer():
+    pool = SpanPool()
+    held = pool.new_span("held", context=Context())
+    held._local_root = held
+    held.set_tag("tag", "value")
+    held.finish()
+    # Still encoded asynchronously by the writer
+    held._in_writer = True
+    pool.release([held])
+    _finished_trace(pool, n=1)
+
+    span = pool.new_span("new")
+    assert span is not held
+    assert held.name == "held"
+    assert held.get_tag("tag") == "value"
+    assert pool.hits == 0 and pool.rejected == 0
+
+    # The chunks are reclaimed in order once the writer is done with them
+    held._in_writer = False
+    assert _finished_trace(pool, n=1) == [id(held)]
+    assert pool.hits == 1
+
+
+def test_span_pool_rejects_weakly_referenced_spans():
+    pool = SpanPool()
+    spans = [pool.new_span("root")]
+    ref = weakref.ref(spans[0])
+    spans[0].finish()
+    pool.release(spans)
+    del spans
+    _finished_trace(pool, n=1)
+
+    assert pool.new_span("new") is not ref()
+    assert ref() is None
+    assert pool.rejected == 1
+
+
+def test_aggregator_span_pool():
+    pool = SpanPool()
+    writer = DummyWriter()
+    aggr = SpanAggregator(
+        partial_flush_enabled=True, partial_flush_min_spans=1, trace_processors=[], writer=writer, span_pool=pool
+    )
+    root = Span("root", on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(root)
+    child = Span("child", trace_id=root.trace_id, parent_id=root.span_id, on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(child)
+
+    # The partially flushed chunk is still referenced by the rest of the trace
+    child.finish()
+    assert pool.released == 0
+
+    root.finish()
+    assert pool.released == 1
+    assert not root._in_writer
+
+
+def test_aggregator_span_pool_dropped_traces():
+    class DropTraces(TraceProcessor):
+        def process_trace(self, trace):
+            return None
+
+    pool = SpanPool()
+    writer = AgentWriter("http://localhost:9126", async_encoding=True)
+    aggr = SpanAggregator(
+        partial_flush_enabled=False,
+        partial_flush_min_spans=1,
+        trace_processors=[DropTraces()],
+        writer=writer,
+        span_pool=pool,
+    )
+    for _ in range(4):
+        span = pool.new_span("root", on_finish=[aggr.on_span_finish])
+        aggr.on_span_start(span)
+        span.finish()
+
+    # The spans the writer never got are reused as soon as a newer chunk is released
+    assert not span._in_writer
+    assert pool.stats() == (2, 2, 4, 0)
+
+
+def test_writer_flags_held_spans():
+    writer = AgentWriter("http://localhost:9126")
+    spans = [Span("root"), Span("child")]
+    with mock.patch.object(writer, "start"):
+        writer.write(spans)
+    # Encoded synchronously
+    assert not any(span._in_writer for span in spans)
+
+    writer = AgentWriter("http://localhost:9126", async_encoding=True)
+    with mock.patch.object(writer, "start"):
+        writer.write(spans)
+        assert all(span._in_writer for span in spans)
+        writer._drain_pending()
+    assert not any(span._in_writer for span in spans)
+
+
+def test_span_pool_context_not_reused_when_referenced():
+    pool = SpanPool()
+    root = pool.new_span("root", context=Context())
+    root._local_root = root
+    context = root.context
+    root.finish()
+    pool.release([root])
+    del root
+    _finished_trace(pool, n=1)
+
+    span = pool.new_span("new", context=Context())
+    assert span.context is not context
+    assert context.span_id != span.span_id
+
+
+def test_span_pool_max_size():
+    pool = SpanPool(max_size=4)
+    _finished_trace(pool, n=3)
+    _finished_trace(pool, n=3)
+    # The oldest chunk was evicted to keep at most 4 pending spans
+    assert pool.rejected == 3
+    _finished_trace(pool, n=1)
+    pool.new_span("new")
+    assert pool.stats() == (1, 7, 7, 3)
+
+
+def test_span_pool_per_thread():
+    pool = SpanPool()
+    _finished_trace(pool)
+    _finished_trace(pool)
+
+    spans = []
+    t = threading.Thread(target=lambda: spans.append(pool.new_span("thread")))
+    t.start()
+    t.join()
+    assert pool.hits == 0
+
+    pool.new_span("main")
+    assert pool.hits == 1
+
+
+def test_tracer_span_pool():
+    with override_global_config(dict(_span_pool_enabled=True, _span_pool_size=16)):
+        tracer = DummyTracer()
+    assert tracer._span_pool is not None
+
+    def trace():
+        with tracer.trace("root", service="svc") as root:
+            root.set_tag("tag", "value")
+            with tracer.trace("child"):
+                pass
+        assert [s.name for s in tracer.pop()] == ["root", "child"]
+        tracer.pop_traces()
+
+    for _ in range(10):
+        trace()
+
+    hits, misses, released, rejected = tracer._span_pool.stats()
+    assert released == 20
+    assert hits > 0
+    assert hits + misses == 20
+
+    with tracer.trace("root") as span:
+        assert span.get_tag("tag") is None
+        assert span._parent is None
+        assert span._local_root is span
+        with tracer.trace("child") as child:
+            assert child._parent is span
+            assert child.trace_id == span.trace_id
+            assert child.context.span_id == child.span_id
+
+
+def test_tracer_span_pool_disabled():
+    with override_global_config(dict(_span_pool_enabled=False)):
+        tracer = DummyTracer()
+    assert tracer._span_pool is None
+
+
+def test_tracer_span_pool_contextvar():
+    contextvars = pytest.importorskip("contextvars")
+
+    with override_global_config(dict(_span_pool_enabled=True, _span_pool_size=16)):
+        tracer = DummyTracer()
+
+    # A copy of the context outlives the trace of its active span
+    with tracer.trace("root"):
+        with tracer.trace("child") as child:
+            copied = contextvars.copy_context()
+    with tracer.trace("other"):
+        pass
+    tracer.pop()
+
+    with tracer.trace("reused") as reused:
+        assert reused is child
+        assert tracer.current_span() is reused
+        # The span was reused since it was activated in the copied context
+        assert copied.run(tracer.current_span) is None
+        assert copied.run(tracer.context_provider.active) is None
@@ -456,8 +456,41 @@ def test_set_http_meta_custom_errors(mock_log, span, int_config, error_codes, st
         mock_log.exception.assert_not_called()
 
 
-@mock.patch("ddtrace.contrib.trace_utils._store_headers")
-def test_set_http_meta_no_headers(mock_store_headers, span, int_config):
+def test_set_http_meta_header_mappings(span, int_config):
+    class Headers(object):
+        # Mapping-like header containers, e.g. from web frameworks, are read in place
+        def __init__(self, headers):
+            self._headers = headers
+
+        def get(self, key, default=None):
+            return dict(self._headers).get(key, default)
+
+        def items(self):
+            return self._headers
+
+    int_config.myint.http.trace_headers(["my-header", "content-type"])
+    trace_utils.set_http_meta(
+        span,
+        int_config.myint,
+        method="GET",
+        status_code=200,
+        route="/",
+        request_headers=Headers([("my-header", "request"), ("user-agent", "dd-agent/1.0.0")]),
+        response_headers=[("content-type", "text/plain")],
+    )
+    assert span.get_tags() == {
+        "runtime-id": mock.ANY,
+        http.METHOD: "GET",
+        http.STATUS_CODE: "200",
+        http.ROUTE: "/",
+        http.USER_AGENT: "dd-agent/1.0.0",
+        "http.request.headers.my-header": "request",
+        "http.response.headers.content-type": "text/plain",
+    }
+
+
+@mock.patch("ddtrace.contrib.trace_utils._collect_header_tags")
+def test_set_http_meta_no_headers(mock_collect_header_tags, span, int_config):
     assert int_config.myint.is_header_tracing_configured is False
     trace_utils.set_http_meta(
         span,
@@ -468,10 +501,10 @@ def test_set_http_meta_no_headers(mock_store_headers, span, int_config):
     result_keys = list(span.get_tags().keys())
     result_keys.sort(reverse=True)
     assert result_keys == ["runtime-id", http.USER_AGENT]
-    mock_store_headers.assert_not_called()
+    mock_collect_header_tags.assert_not_called()
 
 
-@mock.patch("ddtrace.contrib.trace_utils._store_headers")
+@mock.patch("ddtrace.contrib.trace_utils._collect_header_tags")
 @pytest.mark.parametrize(
     "user_agent_key,user_agent_value,expected_keys,expected",
     [
@@ -484,7 +517,7 @@ def test_set_http_meta_no_headers(mock_store_headers, span, int_config):
     ],
 )
 def test_set_http_meta_headers_useragent(
-    mock_store_headers, user_agent_key, user_agent_value, expected_keys, expected, span, int_config
+    mock_collect_header_tags, user_agent_key, user_agent_value, expected_keys, expected, span, int_config
 ):
     int_config.myint.http._header_tags = {"enabled": True}
     assert int_config.myint.is_header_tracing_configured is True
@@ -497,11 +530,11 @@ def test_set_http_meta_headers_useragent(
     result_keys.sort(reverse=True)
     assert result_keys == expected_keys
     assert span.get_tag(http.USER_AGENT) == expected
-    mock_store_headers.assert_called()
+    mock_collect_header_tags.assert_called()
 
 
-@mock.patch("ddtrace.contrib.trace_utils._store_headers")
-def test_set_http_meta_case_sensitive_headers(mock_store_headers, span, int_config):
+@mock.patch("ddtrace.contrib.trace_utils._collect_header_tags")
+def test_set_http_meta_case_sensitive_headers(mock_collect_header_tags, span, int_config):
     int_config.myint.http._header_tags = {"enabled": True}
     trace_utils.set_http_meta(
         span, int_config.myint, request_headers={"USER-AGENT": "dd-agent/1.0.0"}, headers_are_case_sensitive=True
@@ -510,11 +543,11 @@ def test_set_http_meta_case_sensitive_headers(mock_store_headers, span, int_conf
     result_keys.sort(reverse=True)
     assert result_keys == ["runtime-id", http.USER_AGENT]
     assert span.get_tag(http.USER_AGENT) == "dd-agent/1.0.0"
-    mock_store_headers.assert_called()
+    mock_collect_header_tags.assert_called()
 
 
-@mock.patch("ddtrace.contrib.trace_utils._store_headers")
-def test_set_http_meta_case_sensitive_headers_notfound(mock_store_headers, span, int_config):
+@mock.patch("ddtrace.contrib.trace_utils._collect_header_tags")
+def test_set_http_meta_case_sensitive_headers_notfound(mock_collect_header_tags, span, int_config):
     int_config.myint.http._header_tags = {"enabled": True}
     trace_utils.set_http_meta(
         span, int_config.myint, request_headers={"USER-AGENT": "dd-agent/1.0.0"}, headers_are_case_sensitive=False
@@ -523,7 +556,7 @@ def test_set_http_meta_case_sensitive_headers_notfound(mock_store_headers, span,
     result_keys.sort(reverse=True)
     assert result_keys == ["runtime-id"]
     assert not span.get_tag(http.USER_AGENT)
-    mock_store_headers.assert_called()
+    mock_collect_header_tags.assert_called()
 
 
 @pytest.mark.parametrize(
@@ -717,7 +750,7 @@ def test_ip_subnet_regression():
 
 
 @pytest.mark.skipif(sys.version_info < (3, 0, 0), reason="Python2 tests")
-@mock.patch("ddtrace.contrib.trace_utils._store_headers")
+@mock.patch("ddtrace.contrib.trace_utils._collect_header_tags")
 @pytest.mark.parametrize(
     "user_agent_value, expected_keys ,expected",
     [
@@ -726,7 +759,7 @@ def test_ip_subnet_regression():
     ],
 )
 def test_set_http_meta_headers_useragent_py3(
-    mock_store_headers, user_agent_value, expected_keys, expected, span, int_config
+    mock_collect_header_tags, user_agent_value, expected_keys, expected, span, int_config
 ):
     assert int_config.myint.is_header_tracing_configured is False
     trace_utils.set_http_meta(
@@ -739,11 +772,11 @@ def test_set_http_meta_headers_useragent_py3(
     result_keys.sort(reverse=True)
     assert result_keys == expected_keys
     assert span.get_tag(http.USER_AGENT) == expected
-    mock_store_headers.assert_not_called()
+    mock_collect_header_tags.assert_not_called()
 
 
 @pytest.mark.skipif(sys.version_info >= (3, 0, 0), reason="Python2 tests")
-@mock.patch("ddtrace.contrib.trace_utils._store_headers")
+@mock.patch("ddtrace.contrib.trace_utils._collect_header_tags")
 @pytest.mark.parametrize(
     "user_agent_value, expected_keys ,expected",
     [
@@ -752,7 +785,7 @@ def test_set_http_meta_headers_useragent_py3(
     ],
 )
 def test_set_http_meta_headers_useragent_py2(
-    mock_store_headers, user_agent_value, expected_keys, expected, span, int_config
+    mock_collect_header_tags, user_agent_value, expected_keys, expected, span, int_config
 ):
     assert int_config.myint.is_header_tracing_configured is False
     trace_utils.set_http_meta(
@@ -765,7 +798,7 @@ def test_set_http_meta_headers_useragent_py2(
     result_keys.sort(reverse=True)
     assert result_keys == expected_keys
     assert span.get_tag(http.USER_AGENT) == expected
-    mock_store_headers.assert_not_called()
+    mock_collect_header_tags.assert_not_called()
 
 
 @mock.patch("ddtrace.contrib.trace_utils.log")
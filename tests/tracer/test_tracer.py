@@ -363,6 +363,18 @@ class TracerTestCases(TracerTestCase):
         with self.trace("fake_span") as span:
             assert self.tracer.current_span() == span
 
+    def test_tracer_current_span_finished_elsewhere(self):
+        # Spans finished without going through the tracer, e.g. from another
+        # execution context, are skipped when looking up the current span
+        root = self.tracer.trace("root")
+        child = self.tracer.trace("child")
+        grandchild = self.tracer.trace("grandchild")
+        grandchild.duration_ns = child.duration_ns = 1
+        assert self.tracer.current_span() is root
+        assert self.tracer.context_provider.active() is root
+        root.finish()
+        assert self.tracer.current_span() is None
+
     def test_tracer_current_span_missing_context(self):
         self.assertIsNone(self.tracer.current_span())
 
@@ -12,6 +12,7 @@ from ddtrace.internal.utils import ArgumentError
 from ddtrace.internal.utils import get_argument_value
 from ddtrace.internal.utils import set_argument_value
 from ddtrace.internal.utils import time
+from ddtrace.internal.utils.cache import LFUCache
 from ddtrace.internal.utils.cache import cached
 from ddtrace.internal.utils.cache import cachedmethod
 from ddtrace.internal.utils.cache import callonce
@@ -283,17 +284,25 @@ def cached_test_recipe(expensive, cheap, witness, cache_size):
 
     assert witness.call_count == 1 + cache_size
 
+    # The oldest of the least frequently used elements
+    LFU_FOO = "Foo%d" % (cache_size >> 1)
     MAX_FOO = "Foo%d" % (cache_size - 1)
 
-    cheap("last drop")  # Forces least frequent elements out of the cache
+    cheap("last drop")  # Forces the least frequent element out of the cache
     assert witness.call_count == 2 + cache_size
 
-    cheap(MAX_FOO)  # Check MAX_FOO was dropped
+    cheap(LFU_FOO)  # Check LFU_FOO was dropped
     assert witness.call_count == 3 + cache_size
 
     cheap("last drop")  # Check last drop was retained
+    cheap(MAX_FOO)  # Check MAX_FOO was retained
     assert witness.call_count == 3 + cache_size
 
+    cache = cheap.cache
+    assert len(cache) == cache_size
+    assert cache.misses == 3 + (cache_size >> 1) + (cache_size >> 1)
+    assert cache.evictions == 2
+
 
 def test_cached():
     witness = mock.Mock()
@@ -326,6 +335,31 @@ def test_cachedmethod():
     cached_test_recipe(expensive, Foo().cheap, witness, cache_size)
 
 
+def test_lfu_cache_keeps_frequent_keys():
+    cache = LFUCache(16)
+
+    def f(key):
+        return key * 2
+
+    for _ in range(3):
+        assert cache.get("hot", f) == "hothot"
+
+    # A stream of keys seen only once does not push the frequent key out
+    for i in range(1000):
+        assert cache.get(str(i), f) == str(i) * 2
+        assert len(cache) <= 16
+
+    assert cache.get("hot", f) == "hothot"
+    assert cache.hits == 3
+    assert cache.misses == 1001
+    assert cache.evictions == 1001 - 16
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("hot", f) == "hothot"
+    assert cache.misses == 1002
+
+
 i = 0
 
 
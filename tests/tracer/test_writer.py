@@ -5,16 +5,21 @@ import sys
 import tempfile
 import threading
 import time
+import zlib
 
 import mock
 import msgpack
 import pytest
 from six.moves import BaseHTTPServer
 from six.moves import socketserver
+import tenacity
 
 import ddtrace
 from ddtrace import config
 from ddtrace.constants import KEEP_SPANS_RATE_KEY
+from ddtrace.constants import SAMPLING_PRIORITY_KEY
+from ddtrace.context import Context
+from ddtrace.internal._encoding import estimate_span_size
 from ddtrace.internal.ci_visibility.writer import CIVisibilityWriter
 from ddtrace.internal.compat import PY3
 from ddtrace.internal.compat import get_connection_response
@@ -26,6 +31,7 @@ from ddtrace.internal.writer import AgentWriter
 from ddtrace.internal.writer import LogWriter
 from ddtrace.internal.writer import Response
 from ddtrace.internal.writer import _human_size
+from ddtrace.internal.writer.spool import PayloadSpool
 from ddtrace.sampler import RateByServiceSampler
 from ddtrace.span import Span
 from tests.utils import AnyInt
@@ -97,9 +103,8 @@ class AgentWriterTests(BaseTestCase):
             writer = self.WRITER_CLASS("http://asdf:1234", dogstatsd=statsd)
             for i in range(10):
                 writer.write([Span(name="name", trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(5)])
-            writer.write(
-                [Span(name="a" * 5000, trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(2 ** 10)]
-            )
+            # A single span can not be split
+            writer.write([Span(name="a" * (5 << 20), trace_id=i)])
             writer.stop()
             writer.join()
 
@@ -194,9 +199,8 @@ class AgentWriterTests(BaseTestCase):
             writer._metrics_reset = writer_metrics_reset
             for i in range(10):
                 writer.write([Span(name="name", trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(5)])
-            writer.write(
-                [Span(name="a" * 5000, trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(2 ** 10)]
-            )
+            # A single span can not be split
+            writer.write([Span(name="a" * (5 << 20), trace_id=i)])
             writer.stop()
             writer.join()
 
@@ -206,6 +210,34 @@ class AgentWriterTests(BaseTestCase):
         assert client_count == writer._metrics["buffer.dropped.traces"]["count"]
         assert ["reason:t_too_big"] == writer._metrics["buffer.dropped.traces"]["tags"]
 
+    def test_split_trace_too_big(self):
+        statsd = mock.Mock()
+        writer_put = mock.Mock()
+        writer_put.return_value = Response(status=200)
+        with override_global_config(dict(health_metrics_enabled=False)):
+            writer = self.WRITER_CLASS(
+                "http://asdf:1234", buffer_size=1 << 20, max_payload_size=64 << 10, dogstatsd=statsd
+            )
+            writer.run_periodic = mock.Mock()
+            writer._put = writer_put
+
+            context = Context(sampling_priority=1)
+            trace = [
+                Span(name="a" * 2000, trace_id=1, span_id=j, parent_id=j - 1 or None, context=context)
+                for j in range(1, 65)
+            ]
+            writer.write(trace)
+            assert "buffer.dropped.traces" not in writer._metrics
+            assert 1 == writer._metrics["buffer.split.traces"]["count"]
+            writer.flush_queue()
+
+        payload = msgpack.unpackb(writer_put.call_args.args[0])
+        assert len(payload) > 1
+        assert [s["span_id"] for chunk in payload for s in chunk] == list(range(1, 65))
+        for chunk in payload[1:]:
+            assert chunk[0]["meta"]["language"] == "python"
+            assert chunk[0]["metrics"][SAMPLING_PRIORITY_KEY] == 1
+
     def test_drop_reason_buffer_full(self):
         statsd = mock.Mock()
         writer_metrics_reset = mock.Mock()
@@ -261,10 +293,7 @@ class AgentWriterTests(BaseTestCase):
                 [Span(name="name", trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(5)] for i in range(4)
             ]
 
-            traces_too_big = [
-                [Span(name="a" * 5000, trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(2 ** 10)]
-                for i in range(4)
-            ]
+            traces_too_big = [[Span(name="a" * (5 << 20), trace_id=i)] for i in range(4)]
 
             # 1. We write 4 traces successfully.
             for trace in traces:
@@ -343,6 +372,9 @@ class CIVisibilityWriterTests(AgentWriterTests):
     def test_drop_reason_trace_too_big(self):
         pytest.skip()
 
+    def test_split_trace_too_big(self):
+        pytest.skip()
+
     def test_metrics_trace_too_big(self):
         pytest.skip()
 
@@ -752,26 +784,40 @@ def test_writer_reuse_connections_envvar(monkeypatch, writer_class):
 @pytest.mark.parametrize("writer_class", (AgentWriter, CIVisibilityWriter))
 def test_writer_reuse_connections(writer_class):
     with override_env(dict(DD_API_KEY="foobar.baz")):
-        # Ensure connection is not reused
+        # Ensure connection is reused
         writer = writer_class("http://localhost:9126", reuse_connections=True)
-        # Do an initial flush to get a connection
-        writer.flush_queue()
-        assert writer._conn is None
-        writer.flush_queue()
-        assert writer._conn is None
+        conn = mock.Mock()
+        conn.request.side_effect = None
+        with mock.patch.object(writer._conn_pool, "_new_connection", return_value=conn), mock.patch(
+            "ddtrace.internal.utils.http._is_connection_alive", return_value=True
+        ), mock.patch("ddtrace.internal.writer.writer.Response.from_http_response") as from_http_response:
+            from_http_response.return_value = Response(status=200)
+            writer._encoder.put([Span("foobar")])
+            writer.flush_queue(raise_exc=True)
+            assert len(writer._conn_pool) == 1
+            writer._encoder.put([Span("foobar")])
+            writer.flush_queue(raise_exc=True)
+            assert len(writer._conn_pool) == 1
+            assert writer._conn_pool._new_connection.call_count == 1
+            assert conn.request.call_count == 2
 
 
 @pytest.mark.parametrize("writer_class", (AgentWriter, CIVisibilityWriter))
 def test_writer_reuse_connections_false(writer_class):
     with override_env(dict(DD_API_KEY="foobar.baz")):
-        # Ensure connection is reused
+        # Ensure connection is not reused
         writer = writer_class("http://localhost:9126", reuse_connections=False)
-        # Do an initial flush to get a connection
-        writer.flush_queue()
-        conn = writer._conn
-        # And another to potentially have it reset
-        writer.flush_queue()
-        assert writer._conn is conn
+        with mock.patch.object(writer._conn_pool, "_new_connection") as new_connection, mock.patch(
+            "ddtrace.internal.writer.writer.Response.from_http_response"
+        ) as from_http_response:
+            from_http_response.return_value = Response(status=200)
+            writer._encoder.put([Span("foobar")])
+            writer.flush_queue(raise_exc=True)
+            writer._encoder.put([Span("foobar")])
+            writer.flush_queue(raise_exc=True)
+            assert len(writer._conn_pool) == 0
+            assert new_connection.call_count == 2
+            assert new_connection.return_value.close.call_count == 2
 
 
 @pytest.mark.subprocess(env=dict(DD_TRACE_128_BIT_TRACEID_GENERATION_ENABLED="true"))
@@ -792,3 +838,346 @@ def test_trace_with_128bit_trace_ids():
     chunk_root = spans[0]
     assert chunk_root.trace_id >= 2 ** 64
     assert chunk_root._meta[HIGHER_ORDER_TRACE_ID_BITS] == "{:016x}".format(parent.trace_id >> 64)
+
+
+@pytest.mark.parametrize("writer_class", (AgentWriter, CIVisibilityWriter))
+def test_writer_async_encoding_envvar(monkeypatch, writer_class):
+    with override_env(dict(DD_API_KEY="foobar.baz")):
+        monkeypatch.setenv("DD_TRACE_WRITER_ASYNC_ENCODING", "false")
+        writer = writer_class("http://localhost:9126")
+        assert not writer._async_encoding
+
+        monkeypatch.setenv("DD_TRACE_WRITER_ASYNC_ENCODING", "true")
+        writer = writer_class("http://localhost:9126")
+        assert writer._async_encoding
+
+
+def test_writer_async_encoding():
+    writer = AgentWriter("http://localhost:9126", async_encoding=True)
+    writer._put = mock.Mock(return_value=Response(status=200))
+    try:
+        for i in range(10):
+            writer.write([Span(name="name", trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(5)])
+
+        # Nothing is encoded on the calling thread
+        assert len(writer._encoder) == 0
+        assert len(writer._pending) <= 10
+
+        writer.flush_queue()
+        assert len(writer._pending) == 0
+
+        payloads = [msgpack.unpackb(call.args[0]) for call in writer._put.call_args_list]
+        assert sum(len(p) for p in payloads) == 10
+    finally:
+        writer.stop()
+        writer.join()
+
+
+def test_writer_async_encoding_queue_full():
+    writer = AgentWriter("http://localhost:9126", async_encoding=True)
+    writer._pending_max_size = 2
+    writer._put = mock.Mock(return_value=Response(status=200))
+    with mock.patch.object(writer, "start"):
+        for i in range(5):
+            writer.write([Span(name="name", trace_id=i, span_id=1)])
+
+        assert len(writer._pending) == 2
+        assert writer._metrics["buffer.dropped.traces"]["count"] == 3
+        assert writer._metrics["buffer.dropped.traces"]["tags"] == ["reason:full"] * 3
+
+        writer.flush_queue()
+        payload = msgpack.unpackb(writer._put.call_args.args[0])
+        assert len(payload) == 2
+
+
+def test_writer_async_encoding_queue_bytes():
+    writer = AgentWriter("http://localhost:9126", async_encoding=True)
+    writer._put = mock.Mock(return_value=Response(status=200))
+    trace = [Span(name="name", trace_id=1, span_id=1)]
+    size = estimate_span_size(trace[0])
+    writer._pending_max_bytes = size * 2
+    with mock.patch.object(writer, "start"):
+        for _ in range(5):
+            writer.write(trace)
+
+        assert len(writer._pending) == 2
+        assert writer._pending_bytes == size * 2
+        assert writer._metrics["buffer.dropped.traces"]["count"] == 3
+        assert writer._metrics["buffer.dropped.bytes"]["count"] == size * 3
+
+        writer.flush_queue()
+        assert writer._pending_bytes == 0
+        payload = msgpack.unpackb(writer._put.call_args.args[0])
+        assert len(payload) == 2
+
+
+def test_writer_async_encoding_flush_when_full():
+    writer = AgentWriter("http://localhost:9126")
+    writer._encoder.put([Span(name="name", trace_id=1, span_id=1)])
+    trace_size = writer._encoder.size
+    writer = AgentWriter("http://localhost:9126", async_encoding=True, adaptive_flush=False, buffer_size=trace_size * 3)
+    writer._pending_max_bytes = 1 << 20
+    writer._put = mock.Mock(return_value=Response(status=200))
+    with mock.patch.object(writer, "start"):
+        for i in range(10):
+            writer.write([Span(name="name", trace_id=i, span_id=1)])
+        assert len(writer._pending) == 10
+
+        writer.flush_queue()
+
+    # The encoder buffer was flushed as it got full instead of dropping traces
+    payloads = [msgpack.unpackb(call.args[0]) for call in writer._put.call_args_list]
+    assert len(payloads) > 1
+    assert sum(len(p) for p in payloads) == 10
+    assert "buffer.dropped.traces" not in writer._metrics
+
+
+def test_writer_async_encoding_recreate():
+    writer = AgentWriter("http://localhost:9126", async_encoding=True)
+    assert writer.recreate()._async_encoding
+
+
+def test_writer_adaptive_flush_envvar(monkeypatch):
+    monkeypatch.setenv("DD_TRACE_WRITER_ADAPTIVE_FLUSH", "true")
+    writer = AgentWriter("http://localhost:9126")
+    assert writer._adaptive_flush
+    assert writer.recreate()._adaptive_flush
+
+
+def test_writer_adaptive_flush_high_watermark():
+    writer = AgentWriter("http://localhost:9126", buffer_size=1 << 12, adaptive_flush=True)
+    with mock.patch.object(writer, "start"), mock.patch.object(writer, "notify") as notify:
+        writer._worker = mock.Mock()
+        writer._worker.notified.is_set.return_value = False
+
+        writer.write([Span(name="name", trace_id=1, span_id=1)])
+        notify.assert_not_called()
+
+        while writer._encoder.size < writer._encoder.max_size * 0.5:
+            writer.write([Span(name="name", trace_id=1, span_id=1)])
+        notify.assert_called_once()
+        assert writer._metrics["writer.flush.early"]["count"] == 1
+
+        # No more notifications until the writer thread wakes up
+        writer._worker.notified.is_set.return_value = True
+        writer.write([Span(name="name", trace_id=1, span_id=1)])
+        notify.assert_called_once()
+
+
+def test_writer_adaptive_flush_async_encoding():
+    writer = AgentWriter("http://localhost:9126", buffer_size=1 << 12, async_encoding=True, adaptive_flush=True)
+    # The size of the queue is limited separately, see test_writer_async_encoding_queue_bytes
+    writer._pending_max_bytes = 1 << 20
+    writer._put = mock.Mock(return_value=Response(status=200))
+    n_traces = 200
+    with mock.patch.object(writer, "start"):
+        for i in range(n_traces):
+            writer.write([Span(name="name", trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(2)])
+
+    # The queue does not fit in the encoder buffer, so the writer has to flush
+    # while draining it to avoid dropping traces.
+    writer.flush_queue()
+    assert writer._put.call_count > 1
+    assert sum(len(msgpack.unpackb(call.args[0])) for call in writer._put.call_args_list) == n_traces
+
+
+def test_writer_adaptive_flush_backoff():
+    writer = AgentWriter("http://localhost:9126", processing_interval=1.0, adaptive_flush=True)
+
+    # Uploads taking the whole interval back off up to the maximum interval
+    for _ in range(10):
+        writer._adjust_interval(writer.interval)
+    assert writer.interval == 8.0
+    assert writer._metrics["writer.flush.backoff"]["count"] == 3
+
+    # Fast uploads bring the interval back to the configured one
+    for _ in range(20):
+        writer._adjust_interval(0.0)
+    assert writer.interval == 1.0
+    assert writer._metrics["writer.flush.recover"]["count"] == 3
+    assert writer.recreate().interval == 1.0
+
+
+def test_writer_compression_envvar(monkeypatch):
+    monkeypatch.setenv("DD_TRACE_WRITER_COMPRESSION", "GZIP")
+    assert AgentWriter("http://localhost:9126")._compression == "gzip"
+
+    monkeypatch.setenv("DD_TRACE_WRITER_COMPRESSION", "lzma")
+    assert AgentWriter("http://localhost:9126")._compression == ""
+
+
+def test_writer_compression():
+    with override_env(dict(DD_API_KEY="foobar.baz", DD_TRACE_WRITER_COMPRESSION_MIN_SIZE_BYTES="1024")):
+        writer = CIVisibilityWriter("http://localhost:9126", compression="gzip")
+    writer._put = mock.Mock(return_value=Response(status=200))
+
+    # Small payloads are sent as they are
+    writer.write([Span(name="name", trace_id=1, span_id=1)])
+    writer.flush_queue()
+    data, headers, _ = writer._put.call_args.args
+    assert "Content-Encoding" not in headers
+    assert msgpack.unpackb(data)
+
+    writer.write([Span(name="name", trace_id=1, span_id=i + 1) for i in range(100)])
+    writer.flush_queue()
+    data, headers, _ = writer._put.call_args.args
+    assert headers["Content-Encoding"] == "gzip"
+    payload = msgpack.unpackb(zlib.decompress(data, 16 + zlib.MAX_WBITS), raw=False, strict_map_key=False)
+    assert len(payload["events"]) == 100
+    assert writer._metrics["http.compression.saved.bytes"]["count"] == 0  # reset after the flush
+
+
+def test_writer_compression_unsupported_endpoint():
+    writer = AgentWriter("http://localhost:9126", compression="gzip")
+    writer._put = mock.Mock(return_value=Response(status=200))
+    writer.write([Span(name="name", trace_id=1, span_id=i + 1) for i in range(1000)])
+    writer.flush_queue()
+    data, headers, _ = writer._put.call_args.args
+    assert "Content-Encoding" not in headers
+    assert len(msgpack.unpackb(data)[0]) == 1000
+
+
+def test_payload_spool_ring(tmpdir):
+    spool = PayloadSpool(str(tmpdir.join("test.spool")), 10)
+    assert spool.peek() is None
+    assert not tmpdir.join("test.spool").exists()
+
+    assert spool.put(b"aaaa", 1, "v0.4/traces") == (True, 0)
+    assert spool.put(b"bbbb", 2, "v0.4/traces", "gzip") == (True, 0)
+    assert len(spool) == 2 and spool.n_traces == 3
+
+    # Not enough room left at the end of the ring: the oldest payload is
+    # evicted and the new one wraps around
+    assert spool.put(b"cccc", 3, "v0.4/traces") == (True, 1)
+    assert [spool._payloads[i].offset for i in range(2)] == [4, 0]
+
+    p, payload = spool.peek()
+    assert (payload, p.n_traces, p.content_encoding) == (b"bbbb", 2, "gzip")
+    spool.pop()
+    p, payload = spool.peek()
+    assert (payload, p.n_traces) == (b"cccc", 3)
+
+    # Payloads larger than the spool are rejected
+    assert spool.put(b"d" * 11, 1, "v0.4/traces") == (False, 0)
+    assert len(spool) == 1
+
+    spool.close()
+    assert len(spool) == 0
+    assert not tmpdir.join("test.spool").exists()
+
+
+def test_writer_spool(tmpdir):
+    writer = AgentWriter("http://localhost:9126", spool_dir=str(tmpdir))
+    writer._retry_upload = tenacity.Retrying(stop=tenacity.stop_after_attempt(1), retry=writer._retry_upload.retry)
+
+    with mock.patch.object(writer, "start"):
+        # The agent is unreachable, payloads are spooled instead of dropped
+        with mock.patch.object(writer, "_put", side_effect=OSError("connection refused")):
+            for i in range(2):
+                writer.write([Span(name="name", trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(5)])
+                writer.flush_queue()
+        assert len(writer._spool) == 2
+        assert writer._spool.n_traces == 2
+        assert len(tmpdir.listdir()) == 1
+
+        # The spooled payloads are sent first, oldest first, once the agent is back
+        writer._put = mock.Mock(return_value=Response(status=200))
+        writer.write([Span(name="name", trace_id=2, span_id=1)])
+        writer.flush_queue()
+        payloads = [msgpack.unpackb(call.args[0]) for call in writer._put.call_args_list]
+        assert [p[0][0]["trace_id"] for p in payloads] == [0, 1, 2]
+        assert len(writer._spool) == 0
+
+    writer.on_shutdown()
+    assert tmpdir.listdir() == []
+
+
+def test_writer_spool_replay_status(tmpdir):
+    writer = AgentWriter("http://localhost:9126", spool_dir=str(tmpdir))
+    writer._retry_upload = tenacity.Retrying(stop=tenacity.stop_after_attempt(1), retry=writer._retry_upload.retry)
+
+    with mock.patch.object(writer, "start"):
+        with mock.patch.object(writer, "_put", side_effect=OSError("connection refused")):
+            for i in range(3):
+                writer.write([Span(name="name", trace_id=i, span_id=1)])
+                writer.flush_queue()
+        assert len(writer._spool) == 3
+
+        # The spooled payloads are kept while the intake is not ready
+        for status in (500, 503, 429, 408):
+            writer._put = mock.Mock(return_value=Response(status=status))
+            writer.flush_queue()
+            assert writer._put.call_count == 1
+            assert len(writer._spool) == 3
+
+        # The payloads rejected by the intake are dropped
+        writer._put = mock.Mock(side_effect=[Response(status=400), Response(status=200), Response(status=200)])
+        writer.flush_queue()
+        assert writer._put.call_count == 3
+        assert len(writer._spool) == 0
+
+    writer.on_shutdown()
+
+
+@pytest.mark.parametrize("status", [503, 500, 429, 408])
+def test_writer_spool_error_status(tmpdir, status):
+    writer = AgentWriter("http://localhost:9126", spool_dir=str(tmpdir))
+
+    with mock.patch.object(writer, "start"):
+        # The agent is not ready, payloads are spooled instead of dropped
+        writer._put = mock.Mock(return_value=Response(status=status))
+        writer.write([Span(name="name", trace_id=0, span_id=1)])
+        writer.flush_queue()
+        assert writer._put.call_count == 1
+        assert len(writer._spool) == 1
+
+        # The payloads rejected by the intake are not spooled
+        writer._put = mock.Mock(side_effect=[Response(status=status), Response(status=400)])
+        writer.write([Span(name="name", trace_id=1, span_id=1)])
+        writer.flush_queue()
+        assert writer._put.call_count == 2
+        assert len(writer._spool) == 1
+
+        writer._put = mock.Mock(return_value=Response(status=200))
+        writer.flush_queue()
+        payloads = [msgpack.unpackb(call.args[0]) for call in writer._put.call_args_list]
+        assert [p[0][0]["trace_id"] for p in payloads] == [0]
+        assert len(writer._spool) == 0
+
+    writer.on_shutdown()
+
+
+def test_writer_spool_replay_concurrent(tmpdir):
+    writer = AgentWriter("http://localhost:9126", spool_dir=str(tmpdir))
+    writer._retry_upload = tenacity.Retrying(stop=tenacity.stop_after_attempt(1), retry=writer._retry_upload.retry)
+
+    with mock.patch.object(writer, "start"):
+        with mock.patch.object(writer, "_put", side_effect=OSError("connection refused")):
+            writer.write([Span(name="name", trace_id=0, span_id=1)])
+            writer.flush_queue()
+        assert len(writer._spool) == 1
+
+        sending = threading.Event()
+        resume = threading.Event()
+
+        def _put(payload, headers, client):
+            sending.set()
+            resume.wait(1)
+            return Response(status=200)
+
+        writer._put = mock.Mock(side_effect=_put)
+        t = threading.Thread(target=writer.flush_queue)
+        t.start()
+        assert sending.wait(1)
+        # Another flush while the spooled payload is being sent
+        t_flush = threading.Thread(target=writer.flush_queue)
+        t_flush.start()
+        t_flush.join(0.1)
+        resume.set()
+        t.join()
+        t_flush.join()
+
+        assert writer._put.call_count == 1
+        assert len(writer._spool) == 0
+
+    writer.on_shutdown()